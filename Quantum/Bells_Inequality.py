@@ -1,13 +1,25 @@
+import time
+
 import cirq
 import numpy as np
+import pandas as pd
+import sympy
+from circuit_optimizer import run
+from sweeps import run_sweep_arrays
+
+ALICE_ANGLE = sympy.Symbol('alice_angle')
+BOB_ANGLE = sympy.Symbol('bob_angle')
 
-def bell_inequality_test_circuit():
+
+def bell_inequality_test_circuit(alice_angle=-0.25, bob_angle=0.0):
     """
     Define 4 qubits
     0th qubit - Alice
     1st qubit - contains the bit sent to Alice by the referee
     2nd qubit - Bob's qubit
     3rd qubit - contains the bit sent to Bob by the referee
+    :param alice_angle: exponent of the X rotation on Alice's qubit (number or sympy symbol)
+    :param bob_angle: exponent of the X rotation on Bob's qubit (number or sympy symbol)
     :return: cirq circuit
     """
 
@@ -17,7 +29,9 @@ def bell_inequality_test_circuit():
     circuit.append(cirq.H(qubits[0]))
     circuit.append(cirq.CNOT(qubits[0], qubits[2]))
 
-    circuit.append([cirq.X(qubits[0])**(-0.25)])
+    circuit.append([cirq.X(qubits[0])**alice_angle])
+    if bob_angle is not None and bob_angle != 0:
+        circuit.append([cirq.X(qubits[2])**bob_angle])
 
     circuit.append([cirq.H(qubits[1]), cirq.H(qubits[3])])
 
@@ -38,8 +52,7 @@ def main(iters=1000):
     print("Bell Inequality Test Circuit")
     print(circuit)
     #Simulate for several iterations
-    sim = cirq.Simulator()
-    result = sim.run(circuit, repetitions=iters)
+    result = run(circuit, repetitions=iters)
     A = result.measurements['A'][:, 0]
     r_A = result.measurements['r_A'][:, 0]
     B = result.measurements['B'][:, 0]
@@ -47,5 +60,53 @@ def main(iters=1000):
     win = (np.array(A) + np.array(B)) % 2 == (np.array(r_A)
     & np.array(r_B))
     print(f"Alice and Bob won {100*np.mean(win)} %of the times")
+
+
+def chsh_win_rates(measurements):
+    """
+    :param measurements: {key: bool array [points, repetitions, 1]} from run_sweep_arrays
+    :return: win rate per sweep point
+    """
+    A, r_A, B, r_B = (measurements[k][..., 0] for k in ('A', 'r_A', 'B', 'r_B'))
+    win = (A ^ B) == (r_A & r_B)
+    return win.mean(axis=1)
+
+
+def chsh_sweep(alice_angles, bob_angles=(0.0,), repetitions=1000, processes=None, seed=None):
+    """
+    CHSH win rate over a grid of Alice/Bob rotation exponents.
+    One symbolic circuit is compiled and run through run_sweep for all points.
+    :param alice_angles: exponents for Alice's X rotation
+    :param bob_angles: exponents for Bob's X rotation
+    :param repetitions: games played per grid point
+    :param processes: worker processes (None: automatic for large grids)
+    :param seed: seed for reproducible sampling
+    :return: pd.DataFrame with columns alice_angle, bob_angle, win_rate, std_err
+    """
+    circuit = bell_inequality_test_circuit(ALICE_ANGLE, BOB_ANGLE)
+    sweep = cirq.Product(cirq.Points(ALICE_ANGLE.name, list(alice_angles)),
+                         cirq.Points(BOB_ANGLE.name, list(bob_angles)))
+    resolvers, measurements = run_sweep_arrays(circuit, sweep, repetitions,
+                                               processes=processes, seed=seed)
+    win_rate = chsh_win_rates(measurements)
+    return pd.DataFrame({
+        'alice_angle': [r.value_of(ALICE_ANGLE) for r in resolvers],
+        'bob_angle': [r.value_of(BOB_ANGLE) for r in resolvers],
+        'win_rate': win_rate,
+        'std_err': np.sqrt(win_rate * (1 - win_rate) / repetitions),
+    })
+
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
+
+    angles = np.linspace(-1, 1, 41)
+    start = time.perf_counter()
+    table = chsh_sweep(angles, repetitions=2000)
+    print(f"\nCHSH win rate vs Alice's angle ({len(table)} points, {time.perf_counter() - start:.2f}s)")
+    print(table.loc[table.win_rate.idxmax()])
+
+    start = time.perf_counter()
+    grid = chsh_sweep(angles, bob_angles=np.linspace(-0.5, 0.5, 11), repetitions=2000)
+    print(f"{len(grid)}-point grid over a process pool: {time.perf_counter() - start:.2f}s")
+    print(grid.pivot(index='alice_angle', columns='bob_angle', values='win_rate').round(3).iloc[::8])
\ No newline at end of file
@@ -1,5 +1,12 @@
+import itertools
+
 import cirq
 import numpy as np
+import pandas as pd
+import sympy
+from circuit_optimizer import run
+from sweeps import run_sweep_arrays
+
 
 def oracle(data_reg, y_reg, circuit, is_balanced=True):
     """
@@ -14,6 +21,76 @@ def oracle(data_reg, y_reg, circuit, is_balanced=True):
             circuit.append(cirq.CNOT(qubit, y_reg))
     return circuit
 
+
+def parameterized_oracle(data_reg, y_reg, circuit):
+    """
+    Oracle for f(x) = (s . x) xor c with symbolic mask bits s_i and offset c.
+    Resolving s = 0 gives a constant function, any other 0/1 mask a balanced one,
+    so a single circuit covers the whole family of linear oracles.
+    :param data_reg: Qubits representing the data register
+    :param y_reg: Qubit representing the output register
+    :param circuit: cirq Circuit to which the oracle will be added
+    :return: (circuit, mask symbols, offset symbol)
+    """
+    mask = sympy.symbols(f's0:{len(data_reg)}')
+    offset = sympy.Symbol('c')
+    for qubit, s in zip(data_reg, mask):
+        circuit.append(cirq.CNOT(qubit, y_reg)**s)
+    circuit.append(cirq.X(y_reg)**offset)
+    return circuit, mask, offset
+
+
+def dj_circuit(num_qubits):
+    """
+    :param num_qubits: Number of qubits in the data register
+    :return: (symbolic Deutsch-Jozsa circuit, mask symbols, offset symbol)
+    """
+    data_reg = [cirq.LineQubit(i) for i in range(num_qubits)]
+    y_reg = cirq.LineQubit(num_qubits)
+    circuit = cirq.Circuit()
+    circuit.append(cirq.H(qubit) for qubit in data_reg)
+    circuit.append([cirq.X(y_reg), cirq.H(y_reg)])
+    circuit, mask, offset = parameterized_oracle(data_reg, y_reg, circuit)
+    circuit.append(cirq.H(qubit) for qubit in data_reg)
+    circuit.append(cirq.measure(*data_reg, key='z'))
+    return circuit, mask, offset
+
+
+def dj_sweep(num_qubits, masks=None, offsets=(0, 1), copies=100, processes=None, seed=None):
+    """
+    Run Deutsch-Jozsa over many oracle variants with one compiled circuit.
+    :param num_qubits: Number of qubits in the data register
+    :param masks: iterable of bit tuples (default: all 2**num_qubits masks)
+    :param offsets: constant offsets c to combine with every mask
+    :param copies: shots per oracle
+    :param processes: worker processes (None: automatic for large grids)
+    :param seed: seed for reproducible sampling
+    :return: pd.DataFrame with one row per oracle: mask, offset, expected and
+             measured function type, and the probability of reading all zeros
+    """
+    circuit, mask_symbols, offset_symbol = dj_circuit(num_qubits)
+    if masks is None:
+        masks = itertools.product((0, 1), repeat=num_qubits)
+    masks = np.array(list(masks), dtype=int).reshape(-1, num_qubits)
+    offsets = np.asarray(offsets, dtype=int)
+
+    grid_masks = np.repeat(masks, len(offsets), axis=0)
+    grid_offsets = np.tile(offsets, len(masks))
+    resolvers = [dict(zip([s.name for s in mask_symbols] + [offset_symbol.name], [*m, int(c)]))
+                 for m, c in zip(grid_masks.tolist(), grid_offsets)]
+    # Compiling makes the oracle's sparse CNOT layer slower to simulate (0.75x in circuit_optimizer.benchmark)
+    _, measurements = run_sweep_arrays(circuit, resolvers, copies, processes=processes, seed=seed, optimize=False)
+
+    p_zero = (~measurements['z'].any(axis=2)).mean(axis=1)
+    return pd.DataFrame({
+        'mask': [''.join(map(str, m)) for m in grid_masks],
+        'offset': grid_offsets,
+        'expected': np.where(grid_masks.any(axis=1), 'balanced', 'constant'),
+        'measured': np.where(p_zero > 0.5, 'constant', 'balanced'),
+        'p_all_zero': p_zero,
+    })
+
+
 def deutsch_jozsa(domain_size: int, func_type_to_simulate: str = 'balanced', copies:int = 1000):
     """
     :param domain_size: Number of qubits in the data register
@@ -56,8 +133,7 @@ def deutsch_jozsa(domain_size: int, func_type_to_simulate: str = 'balanced', cop
     print(circuit)
 
     # Simulate the circuit
-    sim = cirq.Simulator()
-    result = sim.run(circuit, repetitions=copies)
+    result = run(circuit, repetitions=copies, optimize=False)  # see dj_sweep
     
     # Analyze results
     print(result.histogram(key='z'))
@@ -71,5 +147,10 @@ if __name__ == '__main__':
     print("Execute Deutsch Jozsa for a Constant Function of Domain size 4")
     deutsch_jozsa(domain_size=4, func_type_to_simulate='constant', copies=1000)
 
+    print("Sweep over every linear oracle on 8 qubits")
+    table = dj_sweep(8, copies=100)
+    print(table.head())
+    print(f"{len(table)} oracles, {(table.expected == table.measured).mean():.0%} classified correctly")
+
 
 
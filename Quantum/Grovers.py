@@ -1,62 +1,147 @@
+import time
+
 import cirq
 import numpy as np
+from circuit_optimizer import run
+
+
+def _as_marked_list(secret_element, num_qubits):
+    if isinstance(secret_element, str):
+        secret_element = [secret_element]
+    marked = list(secret_element)
+    for item in marked:
+        if len(item) != num_qubits or set(item) - {'0', '1'}:
+            raise ValueError(f"Marked item {item!r} is not a {num_qubits}-bit string")
+    return marked
+
 
 def oracle(input_qubits, target_qubit, circuit, secret_element='01'):
-    """Creates an oracle for Simon's algorithm.
+    """Creates a phase oracle for Grover's algorithm.
+
+    Each marked item flips the target (prepared in |->) via an n-controlled X,
+    with X gates mapping the item onto |1...1>.
 
     Args:
         input_qubits: List of cirq.Qid, the input qubits.
-        output_qubit: cirq.Qid, the output qubit.
-        secret_element: str, the element that defines the oracle behavior.
+        target_qubit: cirq.Qid, the output qubit.
+        circuit: cirq.Circuit to append to.
+        secret_element: str or list of str, the marked element(s).
     """
-    print(f"Creating oracle for secret element: {secret_element}")
-    for i, bit in enumerate(secret_element):
-        if int(bit) == 0:
-            circuit.append(cirq.X(input_qubits[i]))
+    marked = _as_marked_list(secret_element, len(input_qubits))
+    multi_x = cirq.X.controlled(num_controls=len(input_qubits))
+    for item in marked:
+        flips = [input_qubits[i] for i, bit in enumerate(item) if bit == '0']
+        circuit.append(cirq.X.on_each(*flips))
+        circuit.append(multi_x(*input_qubits, target_qubit))
+        circuit.append(cirq.X.on_each(*flips))
+
+    return circuit
 
-    circuit.append(cirq.TOFFOLI(*input_qubits, target_qubit))
-    for i, bit in enumerate(secret_element):
-        if int(bit) == 0:
-            circuit.append(cirq.X(input_qubits[i]))
 
+def diffusion(input_qubits, circuit):
+    """Appends the Grover diffusion operator 2|s><s| - I on any number of qubits."""
+    circuit.append(cirq.H.on_each(*input_qubits))
+    circuit.append(cirq.X.on_each(*input_qubits))
+    if len(input_qubits) == 1:
+        circuit.append(cirq.Z(input_qubits[0]))
+    else:
+        multi_z = cirq.Z.controlled(num_controls=len(input_qubits) - 1)
+        circuit.append(multi_z(*input_qubits))
+    circuit.append(cirq.X.on_each(*input_qubits))
+    circuit.append(cirq.H.on_each(*input_qubits))
     return circuit
 
 
-def grovers_algorithm(num_qubits=2, copies=1000):
+def optimal_iterations(num_qubits, num_marked=1):
+    """Number of Grover iterations maximizing the success probability.
+
+    With sin(theta) = sqrt(M / N), k iterations give success probability
+    sin^2((2k + 1) theta); the best integer k is round(pi / (4 theta) - 1/2).
+    """
+    theta = np.arcsin(np.sqrt(num_marked / 2 ** num_qubits))
+    return max(int(np.round(np.pi / (4 * theta) - 0.5)), 0)
+
+
+def grover_circuit(num_qubits, secret_element, iterations=None):
+    """Builds the full Grover circuit for arbitrary n and marked set."""
+    marked = _as_marked_list(secret_element, num_qubits)
+    if iterations is None:
+        iterations = optimal_iterations(num_qubits, len(marked))
+
     input_qubits = [cirq.LineQubit(i) for i in range(num_qubits)]
     output_qubit = cirq.LineQubit(num_qubits)
     circuit = cirq.Circuit()
 
-    # Create the oracle
-    
-
-    # Add Grover's diffusion operator
     circuit.append(cirq.H.on_each(*input_qubits))
     circuit.append([cirq.X(output_qubit), cirq.H(output_qubit)])
-    circuit =oracle(input_qubits, output_qubit, circuit)
-    circuit.append(cirq.H.on_each(*input_qubits))
-    circuit.append(cirq.X.on_each(*input_qubits))
-
-    circuit.append(cirq.H.on(input_qubits[1]))
-    circuit.append(cirq.CNOT(input_qubits[0], input_qubits[1]))
+    for _ in range(iterations):
+        oracle(input_qubits, output_qubit, circuit, marked)
+        diffusion(input_qubits, circuit)
 
-    circuit.append(cirq.H.on(input_qubits[1]))
-    circuit.append(cirq.X.on_each(*input_qubits))
-    circuit.append(cirq.H.on_each(*input_qubits))
-    
-    # Measure the result.
     circuit.append(cirq.measure(*input_qubits, key='Z'))
-    print("Grover's algorithm follows")
-    print(circuit)
-    sim = cirq.Simulator()
-    result = sim.run(circuit, repetitions=copies)
+    return circuit
+
+
+def grovers_algorithm(num_qubits=2, copies=1000, secret_element=None, iterations=None, verbose=True,
+                      optimize=True):
+    if secret_element is None:
+        secret_element = format(1, f'0{num_qubits}b')
+    circuit = grover_circuit(num_qubits, secret_element, iterations)
+    if verbose:
+        print("Grover's algorithm follows")
+        print(circuit)
+    result = run(circuit, repetitions=copies, optimize=optimize)
     out = result.histogram(key='Z')
     out_result = {}
     for k in out.keys():
-        new_key = "{0:b}".format(k)
-        if len(new_key) < num_qubits:
-            new_key = (num_qubits - len(new_key))*'0'+ new_key
-    out_result[new_key] = out[k]
-    print(out_result)
-if __name__ =='__main__':
-    grovers_algorithm(2)
\ No newline at end of file
+        new_key = format(k, f'0{num_qubits}b')
+        out_result[new_key] = out[k]
+    if verbose:
+        print(out_result)
+    return out_result
+
+
+def grover_statevector(num_qubits, secret_element, iterations=None):
+    """Grover search applied directly to the amplitude array.
+
+    The oracle is a sign flip on the marked indices and the diffusion is the
+    inversion about the mean, 2 <a> - a, so each iteration is O(2^n) vector
+    work with no circuit or gate matrices involved.
+
+    Returns:
+        Final real amplitude vector of length 2**num_qubits (big-endian order).
+    """
+    marked = _as_marked_list(secret_element, num_qubits)
+    if iterations is None:
+        iterations = optimal_iterations(num_qubits, len(marked))
+    indices = np.array([int(item, 2) for item in marked])
+
+    amplitudes = np.full(2 ** num_qubits, 1.0 / np.sqrt(2 ** num_qubits))
+    for _ in range(iterations):
+        amplitudes[indices] *= -1.0
+        np.subtract(2.0 * amplitudes.mean(), amplitudes, out=amplitudes)
+    return amplitudes
+
+
+def grovers_algorithm_fast(num_qubits=20, copies=1000, secret_element=None, iterations=None, seed=None):
+    """Grover search via grover_statevector, sampled like grovers_algorithm."""
+    if secret_element is None:
+        secret_element = format(1, f'0{num_qubits}b')
+    probabilities = grover_statevector(num_qubits, secret_element, iterations) ** 2
+    rng = np.random.default_rng(seed)
+    samples = rng.choice(len(probabilities), size=copies, p=probabilities / probabilities.sum())
+    values, counts = np.unique(samples, return_counts=True)
+    return {format(v, f'0{num_qubits}b'): int(c) for v, c in zip(values, counts)}
+
+
+if __name__ == '__main__':
+    grovers_algorithm(2)
+    print(grovers_algorithm(4, secret_element=['0110', '1011'], verbose=False))
+
+    for n in (10, 16, 20, 22):
+        start = time.perf_counter()
+        secret = format(np.random.randint(2 ** n), f'0{n}b')
+        amplitudes = grover_statevector(n, secret)
+        print(f"n={n:>2}: {optimal_iterations(n)} iterations, "
+              f"P(secret)={amplitudes[int(secret, 2)] ** 2:.6f}, "
+              f"{time.perf_counter() - start:.2f}s")
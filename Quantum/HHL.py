@@ -0,0 +1,220 @@
+import time
+
+import cirq
+import numpy as np
+from circuit_optimizer import optimize_circuit, simulate
+from HamiltonianSim import HamiltonianSimulation, cached_eigh
+from Inversion import eigenvalue_inversion
+from QPE import quantum_phase_estimation
+from state_prep import householder_state_preparation
+
+# Compiled HHL cores (QPE, inversion, uncompute) keyed by (matrix bytes, shape, clock qubits)
+_HHL_CACHE = {}
+
+
+def state_preparation(vector):
+    """
+    :param vector: right-hand side b (real)
+    :return: cirq.MatrixGate mapping |0> to b / |b|
+    """
+    return cirq.MatrixGate(householder_state_preparation(vector))
+
+
+def clear_circuit_cache():
+    _HHL_CACHE.clear()
+
+
+class HHL:
+    """
+    Harrow-Hassidim-Lloyd solver for A x = b with A Hermitian positive definite.
+
+    Phase estimation of exp(iAt) (HamiltonianSimulation of -A) writes each
+    eigenvalue into the clock register, the ancilla is rotated by C / lambda,
+    and phase estimation is undone. Post-selecting the ancilla on |1> leaves
+    the b register proportional to A^-1 b.
+
+    Everything that depends only on A (the eigendecomposition, the controlled
+    powers and the compiled core circuit) is cached, so each new right-hand
+    side costs one state preparation and one simulation.
+    """
+
+    def __init__(self, A, num_clock_qubits=4, t=None, use_cache=True):
+        self.A = np.asarray(A, dtype=float)
+        self.num_clock_qubits = num_clock_qubits
+        self.use_cache = use_cache
+        self.num_system_qubits = int(np.log2(self.A.shape[0]))
+        if 2 ** self.num_system_qubits != self.A.shape[0] or not np.allclose(self.A, self.A.T):
+            raise ValueError("A must be a symmetric 2^n x 2^n matrix")
+
+        eigenvalues, _ = cached_eigh(self.A)
+        if eigenvalues[0] <= 0:
+            raise ValueError("A must be positive definite")
+        # By default the largest eigenvalue lands on the top clock value
+        # 2^m - 1; the smallest encodable eigenvalue (clock value 1) sets C.
+        scale = 2 ** num_clock_qubits
+        self.t = t or 2 * np.pi * (scale - 1) / (scale * eigenvalues[-1])
+        self.C = 2 * np.pi / (scale * self.t)
+
+        self.clock_qubits = [cirq.LineQubit(i) for i in range(num_clock_qubits)]
+        self.system_qubits = [cirq.LineQubit(num_clock_qubits + i) for i in range(self.num_system_qubits)]
+        self.ancilla = cirq.LineQubit(num_clock_qubits + self.num_system_qubits)
+
+    @property
+    def num_qubits(self):
+        return self.num_clock_qubits + self.num_system_qubits + 1
+
+    def _cache_key(self):
+        return self.A.tobytes(), self.A.shape, self.num_clock_qubits
+
+    def build_core(self):
+        """Right-hand-side independent part of the circuit."""
+        key = self._cache_key() if self.use_cache else None
+        if key is not None and key in _HHL_CACHE:
+            return _HHL_CACHE[key]
+
+        qpe = quantum_phase_estimation(HamiltonianSimulation(-self.A, self.t),
+                                       '0' * self.num_system_qubits, self.num_clock_qubits)
+        qpe.apply_hadamards()
+        qpe.apply_controlled_unitaries()
+        qpe.apply_inverse_qft()
+
+        circuit = qpe.circuit.copy()
+        circuit.append(eigenvalue_inversion(self.clock_qubits, self.ancilla, self.t, self.C))
+        circuit += cirq.inverse(qpe.circuit)
+        # Compile once here; solve() then simulates the cached core as is
+        core = cirq.FrozenCircuit(optimize_circuit(circuit))
+        if key is not None:
+            _HHL_CACHE[key] = core
+        return core
+
+    def circuit(self, b):
+        """Full circuit for one right-hand side, with the ancilla measured."""
+        return cirq.Circuit(
+            state_preparation(b).on(*self.system_qubits),
+            self.build_core(),
+            cirq.measure(self.ancilla, key='success'),
+        )
+
+    def solve(self, b, simulator=None):
+        """
+        :param b: right-hand side
+        :param simulator: cirq simulator to reuse (optional)
+        :return: (normalized solution amplitudes, post-selection success probability)
+        """
+        b = np.asarray(b, dtype=float)
+        simulator = simulator or cirq.Simulator()
+        # Load |0>_clock |b> |0>_ancilla directly as the initial state
+        initial = np.zeros(2 ** self.num_qubits, dtype=np.complex64)
+        initial[2 * np.arange(len(b))] = b / np.linalg.norm(b)
+        state = simulate(self.build_core().unfreeze(copy=False), simulator, optimize=False, initial_state=initial,
+                         qubit_order=self.clock_qubits + self.system_qubits + [self.ancilla]
+                         ).final_state_vector
+
+        # Clock back in |0>, ancilla in |1>
+        amplitudes = state.reshape(2 ** self.num_clock_qubits, 2 ** self.num_system_qubits, 2)[0, :, 1]
+        success = float(np.sum(np.abs(amplitudes) ** 2))
+        x = amplitudes / np.sqrt(success)
+        # Global phase: align with a real positive largest component
+        x = x * np.exp(-1j * np.angle(x[np.argmax(np.abs(x))]))
+        return x.real, success
+
+    def solve_many(self, B, simulator=None):
+        """Solve for every column of B, sharing the cached core."""
+        simulator = simulator or cirq.Simulator()
+        return [self.solve(b, simulator) for b in np.asarray(B, dtype=float).T]
+
+
+def fidelity(x, y):
+    x, y = np.asarray(x), np.asarray(y)
+    return float(np.abs(np.vdot(x, y)) ** 2 / (np.vdot(x, x).real * np.vdot(y, y).real))
+
+
+def mean_variance_system(returns, risk_free=0.0):
+    """
+    Tangency-portfolio system Sigma w = mu - r_f, padded to a power of two.
+    Padding adds identity rows scaled to the mean variance (zero right-hand
+    side), which leaves the solution unchanged on the original assets.
+    :param returns: array [T, n_assets] of asset returns
+    :return: (A, b, n_assets)
+    """
+    returns = np.asarray(returns, dtype=float)
+    sigma = np.cov(returns, rowvar=False)
+    mu = returns.mean(axis=0) - risk_free
+    n = sigma.shape[0]
+    size = 2 ** int(np.ceil(np.log2(max(n, 2))))
+    A = np.eye(size) * np.trace(sigma) / n
+    A[:n, :n] = sigma
+    b = np.zeros(size)
+    b[:n] = mu
+    return A, b, n
+
+
+def random_returns(n_assets, n_obs=500, seed=0):
+    """One-factor returns with moderate condition number, for the demos."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0004, 0.01, n_obs)
+    betas = rng.uniform(0.5, 1.5, n_assets)
+    idio = rng.normal(0.0, 0.01, (n_obs, n_assets))
+    drift = rng.uniform(0.0, 0.001, n_assets)
+    return drift + np.outer(market, betas) + idio
+
+
+def benchmark(asset_counts=(2, 4, 8), clock_qubits=(4, 6), num_rhs=5, seed=0):
+    """
+    Fidelity of HHL against numpy.linalg.solve as the system grows, with
+    qubit count, circuit depth and simulation time per right-hand side. The
+    first solve includes compiling the core; later ones reuse it.
+    """
+    clear_circuit_cache()
+    print(f"{'assets':>6} {'clock':>5} {'qubits':>6} {'depth':>5} {'kappa':>6} {'fidelity':>8} "
+          f"{'compile s':>9} {'per rhs s':>9} {'numpy s':>9}")
+    rows = []
+    simulator = cirq.Simulator()
+    for n_assets in asset_counts:
+        A, b, _ = mean_variance_system(random_returns(n_assets, seed=seed))
+        rng = np.random.default_rng(seed)
+        rhs = np.column_stack([b] + [rng.normal(size=len(b)) * np.abs(b).mean() for _ in range(num_rhs - 1)])
+        eigenvalues, _ = cached_eigh(A)
+        kappa = eigenvalues[-1] / eigenvalues[0]
+
+        for m in clock_qubits:
+            solver = HHL(A, m)
+            start = time.perf_counter()
+            solver.build_core()
+            compile_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            solutions = solver.solve_many(rhs, simulator)
+            per_rhs = (time.perf_counter() - start) / num_rhs
+
+            start = time.perf_counter()
+            exact = np.linalg.solve(A, rhs)
+            numpy_time = (time.perf_counter() - start) / num_rhs
+
+            fid = np.mean([fidelity(x, exact[:, j]) for j, (x, _) in enumerate(solutions)])
+            depth = len(solver.circuit(b))
+            rows.append({'assets': n_assets, 'clock_qubits': m, 'qubits': solver.num_qubits, 'depth': depth,
+                         'kappa': kappa, 'fidelity': fid, 'compile_s': compile_time,
+                         'per_rhs_s': per_rhs, 'numpy_s': numpy_time})
+            print(f"{n_assets:>6} {m:>5} {solver.num_qubits:>6} {depth:>5} {kappa:>6.1f} {fid:>8.4f} "
+                  f"{compile_time:>9.4f} {per_rhs:>9.4f} {numpy_time:>9.2e}")
+    return rows
+
+
+if __name__ == '__main__':
+    # With t = pi/2 the eigenvalues 1 and 2 sit on clock values 2 and 4, so HHL is exact
+    A = np.array([[1.5, 0.5], [0.5, 1.5]])
+    b = np.array([1.0, 0.0])
+    x, success = HHL(A, num_clock_qubits=3, t=np.pi / 2).solve(b)
+    exact = np.linalg.solve(A, b)
+    print(f"HHL: {x}, numpy: {exact / np.linalg.norm(exact)}, P(success)={success:.3f}")
+
+    returns = random_returns(4)
+    A, b, n = mean_variance_system(returns)
+    x, _ = HHL(A, num_clock_qubits=6).solve(b)
+    weights = x[:n] / x[:n].sum()
+    exact = np.linalg.solve(A, b)[:n]
+    print(f"Tangency weights  HHL: {np.round(weights, 3)}  numpy: {np.round(exact / exact.sum(), 3)}")
+
+    print()
+    benchmark()
@@ -1,5 +1,33 @@
 import cirq
 import numpy as np
 import math
+from state_prep import uniformly_controlled_ry
 
 
+def inversion_angles(num_clock_qubits, t, C):
+    """
+    RY angles for the HHL eigenvalue inversion.
+    Clock value y encodes the eigenvalue lambda_y = 2*pi*y / (2^m * t); the
+    rotation leaves amplitude C / lambda_y on |1>. y = 0 is left untouched.
+    :param num_clock_qubits: number of clock (counting) qubits m
+    :param t: evolution time used in phase estimation
+    :param C: normalization constant, at most the smallest encoded eigenvalue
+    :return: array of 2^m angles
+    """
+    y = np.arange(2 ** num_clock_qubits)
+    eigenvalues = 2 * math.pi * y / (2 ** num_clock_qubits * t)
+    ratio = np.zeros(len(y))
+    ratio[1:] = np.clip(C / eigenvalues[1:], -1.0, 1.0)
+    return 2 * np.arcsin(ratio)
+
+
+def eigenvalue_inversion(clock_qubits, ancilla, t, C):
+    """
+    :param clock_qubits: clock register holding the estimated eigenvalue (qubit 0 = MSB)
+    :param ancilla: qubit rotated to sqrt(1 - C^2/lambda^2)|0> + C/lambda|1>
+    :param t: evolution time used in phase estimation
+    :param C: normalization constant
+    :return: cirq operation
+    """
+    angles = inversion_angles(len(clock_qubits), t, C)
+    return cirq.MatrixGate(uniformly_controlled_ry(angles)).on(*clock_qubits, ancilla)
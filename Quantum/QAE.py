@@ -0,0 +1,321 @@
+import os
+import sys
+import time
+
+import cirq
+import numpy as np
+from scipy.stats import norm
+from circuit_optimizer import run
+from QPE import quantum_phase_estimation
+from state_prep import householder_state_preparation, uniformly_controlled_ry
+
+# The compiled pricers live at the repository root (`make cpp`, `make cython`)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+try:
+    from option_pricing_cpp import MonteCarlo
+except ImportError:
+    MonteCarlo = None
+try:
+    from src.cython_modules.monte_carlo_cy import monte_carlo_asian_option, monte_carlo_option_price
+except ImportError:
+    monte_carlo_option_price = monte_carlo_asian_option = None
+
+
+def distribution_loader(probabilities):
+    """
+    Loads sum_i sqrt(p_i)|i> from |0>; its own inverse.
+    :param probabilities: probabilities over 2^n basis states
+    :return: unitary matrix
+    """
+    return householder_state_preparation(np.sqrt(np.asarray(probabilities, dtype=float)))
+
+
+def payoff_rotation(payoffs):
+    """
+    Uniformly controlled RY on the ancilla (least significant qubit):
+    |i>|0> -> |i>(sqrt(1 - f_i)|0> + sqrt(f_i)|1>).
+    :param payoffs: payoff per index state, scaled into [0, 1]
+    :return: unitary matrix
+    """
+    f = np.clip(np.asarray(payoffs, dtype=float), 0.0, 1.0)
+    return uniformly_controlled_ry(2 * np.arcsin(np.sqrt(f)))
+
+
+class AmplitudeEstimationProblem:
+    """
+    A|0> = sum_i sqrt(p_i)|i>(sqrt(1 - f_i)|0> + sqrt(f_i)|1>), so the ancilla
+    reads 1 with probability a = sum_i p_i f_i. Q = -A S_0 A^dagger S_chi is the
+    Grover operator, with eigenphases +-2 theta where a = sin^2(theta).
+    """
+
+    def __init__(self, probabilities, payoffs):
+        probabilities = np.asarray(probabilities, dtype=float)
+        self.num_index_qubits = int(np.log2(len(probabilities)))
+        if 2 ** self.num_index_qubits != len(probabilities):
+            raise ValueError("Need a probability for each of 2^n basis states")
+        self.probabilities = probabilities / probabilities.sum()
+        self.payoffs = np.asarray(payoffs, dtype=float)
+        self.exact_amplitude = float(self.probabilities @ np.clip(self.payoffs, 0.0, 1.0))
+
+        self.qubits = cirq.LineQubit.range(self.num_index_qubits + 1)
+        self.ancilla = self.qubits[-1]
+        dim = 2 ** (self.num_index_qubits + 1)
+        self.A = payoff_rotation(self.payoffs) @ np.kron(distribution_loader(self.probabilities), np.eye(2))
+        s_chi = np.kron(np.eye(dim // 2), np.diag([1.0, -1.0]))
+        s_0 = np.eye(dim)
+        s_0[0, 0] = -1.0
+        self.Q = -self.A @ s_0 @ self.A.T @ s_chi
+        self._powers = {0: np.eye(dim)}
+
+    def grover_power(self, k):
+        if k not in self._powers:
+            self._powers[k] = np.linalg.matrix_power(self.Q, k)
+        return self._powers[k]
+
+    def circuit(self, k):
+        """Q^k A|0> followed by a measurement of the ancilla."""
+        return cirq.Circuit(
+            cirq.MatrixGate(self.A).on(*self.qubits),
+            cirq.MatrixGate(self.grover_power(k)).on(*self.qubits) if k else [],
+            cirq.measure(self.ancilla, key='a'),
+        )
+
+
+def qpe_amplitude_estimation(problem, num_counting_qubits=5, shots=100, simulator=None):
+    """
+    Canonical amplitude estimation: phase estimation of Q using the QPE module,
+    with A preparing the register instead of a basis eigenstate.
+    :return: (estimated amplitude, oracle calls) where every A or A^dagger counts as one call
+    """
+    n = problem.num_index_qubits + 1
+    qpe = quantum_phase_estimation(cirq.MatrixGate(problem.Q), '0' * n, num_counting_qubits)
+    circuit = cirq.Circuit(cirq.MatrixGate(problem.A).on(*qpe.eigenstate_qubits)) + qpe.build_core()
+
+    # A and Q are dense MatrixGates with nothing to cancel or merge, so compiling
+    # only adds overhead (0.91x in circuit_optimizer.benchmark)
+    histogram = run(circuit, repetitions=shots, simulator=simulator, optimize=False).histogram(key='result')
+    y = histogram.most_common(1)[0][0]
+    estimate = np.sin(np.pi * y / 2 ** num_counting_qubits) ** 2
+    calls = shots * (1 + 2 * (2 ** num_counting_qubits - 1))
+    return float(estimate), calls
+
+
+def _find_next_k(k, up, theta_l, theta_u, ratio=2):
+    """Largest K = 4k + 2 keeping [K theta_l, K theta_u] within one half circle."""
+    K_i = 4 * k + 2
+    theta_width = theta_u - theta_l
+    K = int(np.floor(np.pi / theta_width)) if theta_width > 0 else K_i
+    K -= (K - 2) % 4
+    while K >= ratio * K_i:
+        lo, hi = (K * theta_l) % (2 * np.pi), (K * theta_u) % (2 * np.pi)
+        if lo <= hi <= np.pi:
+            return (K - 2) // 4, True
+        if np.pi <= lo <= hi:
+            return (K - 2) // 4, False
+        K -= 4
+    return k, up
+
+
+def iterative_amplitude_estimation(problem, epsilon=0.01, alpha=0.05, shots=100, simulator=None, max_rounds=1000):
+    """
+    Iterative amplitude estimation (Grinko et al.) with Chernoff-Hoeffding
+    intervals: no phase estimation or ancilla register, only circuits Q^k A|0>
+    with k chosen so the running confidence interval on theta stays resolvable.
+    :param epsilon: target half-width of the confidence interval on a
+    :param alpha: overall failure probability
+    :return: (estimated amplitude, oracle calls, (lower, upper) interval)
+    """
+    simulator = simulator or cirq.Simulator()
+    T = int(np.ceil(np.log2(np.pi / (8 * epsilon))))
+    theta_l, theta_u = 0.0, np.pi / 2
+    k, up = 0, True
+    ones = count = calls = 0
+
+    for _ in range(max_rounds):
+        if np.sin(theta_u) ** 2 - np.sin(theta_l) ** 2 <= 2 * epsilon:
+            break
+        new_k, up = _find_next_k(k, up, theta_l, theta_u)
+        if new_k != k:
+            ones = count = 0
+        k = new_k
+        K = 4 * k + 2
+
+        measurements = run(problem.circuit(k), repetitions=shots, simulator=simulator,
+                           optimize=False).measurements['a']  # see qpe_amplitude_estimation
+        ones += int(measurements.sum())
+        count += shots
+        calls += shots * (2 * k + 1)
+
+        a_k = ones / count
+        eps_a = np.sqrt(np.log(2 * T / alpha) / (2 * count))
+        a_min, a_max = max(a_k - eps_a, 0.0), min(a_k + eps_a, 1.0)
+        if up:
+            lo, hi = np.arccos(1 - 2 * a_min), np.arccos(1 - 2 * a_max)
+        else:
+            lo, hi = 2 * np.pi - np.arccos(1 - 2 * a_max), 2 * np.pi - np.arccos(1 - 2 * a_min)
+        turns = 2 * np.pi * np.floor(K * theta_l / (2 * np.pi))
+        theta_l, theta_u = max(theta_l, (turns + lo) / K), min(theta_u, (turns + hi) / K)
+
+    a_l, a_u = np.sin(theta_l) ** 2, np.sin(theta_u) ** 2
+    return float((a_l + a_u) / 2), calls, (float(a_l), float(a_u))
+
+
+class QuantumOptionPricer:
+    """
+    Option price as an amplitude: the discretized payoff distribution is
+    loaded into index qubits, payoff / max_payoff into an ancilla amplitude,
+    and price = exp(-rT) * max_payoff * a.
+    """
+
+    def __init__(self, S0, K, T, r, sigma, option_type='call', num_qubits=4, n_steps=1, width=3.0):
+        """
+        :param num_qubits: qubits per time step discretizing the log-return
+        :param n_steps: averaging dates; 1 is a European option, >1 an arithmetic Asian option
+        :param width: grid half-width in standard deviations
+        """
+        if option_type not in ('call', 'put'):
+            raise ValueError("option_type must be 'call' or 'put'")
+        self.S0, self.K, self.T, self.r, self.sigma = S0, K, T, r, sigma
+        self.option_type = option_type
+        self.n_steps = n_steps
+
+        dt = T / n_steps
+        edges = np.linspace(-width, width, 2 ** num_qubits + 1)
+        z = 0.5 * (edges[1:] + edges[:-1])
+        p = np.diff(norm.cdf(edges))
+        p /= p.sum()
+
+        # Joint grid over the step increments, first step most significant
+        grids = np.meshgrid(*([z] * n_steps), indexing='ij')
+        probabilities = np.prod(np.meshgrid(*([p] * n_steps), indexing='ij'), axis=0).ravel()
+        log_paths = np.cumsum([(r - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * g for g in grids], axis=0)
+        average = (S0 * np.exp(log_paths)).mean(axis=0).ravel()
+        payoffs = np.maximum(average - K, 0.0) if option_type == 'call' else np.maximum(K - average, 0.0)
+
+        self.scale = payoffs.max() if payoffs.max() > 0 else 1.0
+        self.discount = np.exp(-r * T)
+        self.problem = AmplitudeEstimationProblem(probabilities, payoffs / self.scale)
+        self.exact_price = self.to_price(self.problem.exact_amplitude)
+
+    def to_price(self, amplitude):
+        return float(self.discount * self.scale * amplitude)
+
+    def price(self, method='iterative', **kwargs):
+        """
+        :param method: 'iterative' (IQAE) or 'qpe' (canonical AE)
+        :return: (price, oracle calls)
+        """
+        if method == 'iterative':
+            amplitude, calls, _ = iterative_amplitude_estimation(self.problem, **kwargs)
+        elif method == 'qpe':
+            amplitude, calls = qpe_amplitude_estimation(self.problem, **kwargs)
+        else:
+            raise ValueError("method must be 'iterative' or 'qpe'")
+        return self.to_price(amplitude), calls
+
+
+def black_scholes_price(S0, K, T, r, sigma, option_type='call'):
+    d1 = (np.log(S0 / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    if option_type == 'call':
+        return S0 * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+    return K * np.exp(-r * T) * norm.cdf(-d2) - S0 * norm.cdf(-d1)
+
+
+def numpy_monte_carlo(S0, K, T, r, sigma, n_simulations, n_steps=1, option_type='call', seed=None):
+    """Plain NumPy reference pricer, always available."""
+    rng = np.random.default_rng(seed)
+    dt = T / n_steps
+    log_paths = np.cumsum((r - 0.5 * sigma ** 2) * dt
+                          + sigma * np.sqrt(dt) * rng.standard_normal((n_simulations, n_steps)), axis=1)
+    average = (S0 * np.exp(log_paths)).mean(axis=1)
+    payoff = np.maximum(average - K, 0.0) if option_type == 'call' else np.maximum(K - average, 0.0)
+    return float(np.exp(-r * T) * payoff.mean())
+
+
+def classical_engines(n_steps=1):
+    """Available classical pricers as name -> f(S0, K, T, r, sigma, n_simulations, option_type)."""
+    engines = {'numpy': lambda *args, option_type='call': numpy_monte_carlo(
+        *args, n_steps=n_steps, option_type=option_type)}
+    if MonteCarlo is not None:
+        mc = MonteCarlo()
+        if n_steps == 1:
+            engines['cpp'] = lambda S0, K, T, r, sigma, n, option_type='call': mc.european_option(
+                S0, K, T, r, sigma, n, option_type == 'call')
+        else:
+            engines['cpp'] = lambda S0, K, T, r, sigma, n, option_type='call': mc.asian_option(
+                S0, K, T, r, sigma, n, n_steps, option_type == 'call')
+    if monte_carlo_option_price is not None:
+        if n_steps == 1:
+            engines['cython'] = monte_carlo_option_price
+        else:
+            engines['cython'] = lambda S0, K, T, r, sigma, n, option_type='call': monte_carlo_asian_option(
+                S0, K, T, r, sigma, n, n_steps, option_type)
+    return engines
+
+
+def benchmark(S0=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type='call',
+              num_qubits=4, n_steps=1, epsilons=(0.02, 0.01, 0.005, 0.002),
+              counting_qubits=(4, 5, 6, 7, 8), simulations=(100, 1000, 10000, 100000), repeats=5):
+    """
+    Error versus oracle calls (quantum) or paths (classical) and wall time.
+    Quantum errors are measured against the exact price of the discretized
+    model the circuit encodes; classical errors against Black-Scholes for a
+    European option and against a 10^6-path NumPy run for an Asian option.
+    Errors are root-mean-square over `repeats` runs. Canonical AE takes the
+    most frequent of 10 shots, so its error is set by the 2^-m phase grid.
+    """
+    pricer = QuantumOptionPricer(S0, K, T, r, sigma, option_type, num_qubits, n_steps)
+    if n_steps == 1:
+        reference = black_scholes_price(S0, K, T, r, sigma, option_type)
+    else:
+        reference = numpy_monte_carlo(S0, K, T, r, sigma, 10 ** 6, n_steps, option_type, seed=0)
+    kind = 'European' if n_steps == 1 else f'Asian ({n_steps} dates)'
+    print(f"{kind} {option_type}: reference {reference:.4f}, "
+          f"discretized model ({pricer.problem.num_index_qubits} index qubits) {pricer.exact_price:.4f}")
+    print(f"{'engine':>10} {'setting':>10} {'calls/paths':>12} {'rmse':>9} {'time s':>8}")
+
+    rows = []
+
+    def record(engine, setting, calls, errors, elapsed):
+        rmse = float(np.sqrt(np.mean(np.square(errors))))
+        rows.append({'engine': engine, 'setting': setting, 'calls': calls, 'rmse': rmse, 'time_s': elapsed})
+        print(f"{engine:>10} {setting:>10} {calls:>12.0f} {rmse:>9.5f} {elapsed:>8.4f}")
+
+    simulator = cirq.Simulator()
+    for eps in epsilons:
+        errors, calls = [], []
+        start = time.perf_counter()
+        for _ in range(repeats):
+            price, c = pricer.price('iterative', epsilon=eps, simulator=simulator)
+            errors.append(price - pricer.exact_price)
+            calls.append(c)
+        record('iqae', f'eps={eps}', np.mean(calls), errors, (time.perf_counter() - start) / repeats)
+
+    for m in counting_qubits:
+        errors, calls = [], []
+        start = time.perf_counter()
+        for _ in range(repeats):
+            price, c = pricer.price('qpe', num_counting_qubits=m, shots=10, simulator=simulator)
+            errors.append(price - pricer.exact_price)
+            calls.append(c)
+        record('qpe-ae', f'm={m}', np.mean(calls), errors, (time.perf_counter() - start) / repeats)
+
+    for name, engine in classical_engines(n_steps).items():
+        for n in simulations:
+            start = time.perf_counter()
+            errors = [engine(S0, K, T, r, sigma, n, option_type=option_type) - reference for _ in range(repeats)]
+            record(name, f'n={n}', n, errors, (time.perf_counter() - start) / repeats)
+    return rows
+
+
+if __name__ == '__main__':
+    pricer = QuantumOptionPricer(100.0, 100.0, 1.0, 0.05, 0.2, num_qubits=4)
+    print(f"Discretized European call: {pricer.exact_price:.4f}, "
+          f"Black-Scholes: {black_scholes_price(100.0, 100.0, 1.0, 0.05, 0.2):.4f}")
+    print(f"IQAE estimate: {pricer.price('iterative', epsilon=0.005)}")
+    print(f"QPE-based AE estimate: {pricer.price('qpe', num_counting_qubits=5)}")
+    print()
+    benchmark()
+    print()
+    benchmark(num_qubits=3, n_steps=2, counting_qubits=(4, 5, 6))
@@ -1,13 +1,48 @@
+import time
+
 import cirq
 import numpy as np
 import fire
 from elapsedtimer import ElapsedTimer
+from circuit_optimizer import simulate
+
+
+def statevector_qft(state):
+    """
+    Apply the QFT implemented by QFT.qft_circuit directly to a statevector.
+    Big-endian qubit order (cirq convention); the circuit's phase convention
+    matches numpy's forward FFT with orthonormal scaling.
+    :param state: complex statevector of length 2**n
+    :return: transformed statevector
+    """
+    return np.fft.fft(np.asarray(state, dtype=np.complex128), norm='ortho')
+
+
+def basis_state(bits):
+    """
+    :param bits: string such as '0110' (qubit 0 first)
+    :return: computational basis statevector
+    """
+    state = np.zeros(2 ** len(bits), dtype=np.complex128)
+    state[int(bits, 2) if bits else 0] = 1.0
+    return state
+
 
 class QFT:
-    def __init__(self, signal_length=16, basis_to_transform='', validate_inverse_fourier=False, qubits=None):
+    def __init__(self, signal_length=16, basis_to_transform='', validate_inverse_fourier=False, qubits=None,
+                 min_rotation_angle=0.0, verbose=False):
+        """
+        :param min_rotation_angle: controlled rotations by less than this angle
+            (radians) are dropped (approximate QFT). With a threshold around
+            2*pi/n**2 only O(log n) rotations per qubit survive, so the gate
+            count falls from O(n^2) to O(n log n).
+        :param verbose: print the circuit as it is built
+        """
         self.signal_length = signal_length
         self.basis_to_transform = basis_to_transform
         self.validate_inverse_fourier = validate_inverse_fourier
+        self.min_rotation_angle = min_rotation_angle
+        self.verbose = verbose
 
         if qubits is None:
             self.num_qubits = int(np.log2(signal_length))
@@ -35,6 +70,8 @@ class QFT:
             for j in range(self.qubit_index):
                 diff = self.qubit_index - j + 1
                 rotation_to_apply = -2.0 / (2.0 ** diff)
+                if np.pi * abs(rotation_to_apply) < self.min_rotation_angle:
+                    continue
                 self.circuit.append(cirq.CZ(self.qubits[
                 self.qubit_index],
                 self.qubits[j]) ** rotation_to_apply)
@@ -48,12 +85,14 @@ class QFT:
     def qft_circuit(self):
         while self.qubit_index < self.num_qubits:
             self.qft_circuit_iter()
-            print(f"QFT step {self.qubit_index-1} complete")
-            print(self.circuit)
+            if self.verbose:
+                print(f"QFT step {self.qubit_index-1} complete")
+                print(self.circuit)
 
         self.swap_qubits()
-        print('Circuit after swaps')
-        print(self.circuit)
+        if self.verbose:
+            print('Circuit after swaps')
+            print(self.circuit)
         self.inv_circuit = cirq.inverse(self.circuit.copy())
 
     def swap_qubits(self):
@@ -62,6 +101,93 @@ class QFT:
             self.circuit.append(cirq.SWAP(self.qubits[i], self.qubits[self.num_qubits - i - 1]))
 
     def simulate_circuit(self):
-        sim = cirq.Simulator()
-        result = sim.simulate(self.circuit)
-        return result
\ No newline at end of file
+        # Controlled phases on distinct pairs leave the optimizer nothing to merge:
+        # the compiled circuit simulates no faster and compiling doubles the call
+        return simulate(self.circuit, optimize=False)
+
+    def simulate_statevector(self):
+        """Exact QFT of the input basis state via numpy.fft (no circuit simulation)."""
+        return statevector_qft(basis_state(self.basis_to_transform.ljust(self.num_qubits, '0')))
+
+    def gate_counts(self):
+        """
+        :return: dict with the number of H, controlled-phase and SWAP gates
+        """
+        counts = {'H': 0, 'CZPow': 0, 'SWAP': 0}
+        for op in self.circuit.all_operations():
+            if op.gate == cirq.H:
+                counts['H'] += 1
+            elif op.gate == cirq.SWAP:
+                counts['SWAP'] += 1
+            elif isinstance(op.gate, cirq.CZPowGate):
+                counts['CZPow'] += 1
+        return counts
+
+
+def validate(num_qubits=6, min_rotation_angle=0.0, basis_to_transform=None):
+    """
+    Compare the cirq simulation of the QFT circuit with the numpy.fft fast path.
+    :return: fidelity |<fft|circuit>|^2 (1.0 for the exact QFT)
+    """
+    if basis_to_transform is None:
+        basis_to_transform = format(np.random.randint(2 ** num_qubits), f'0{num_qubits}b')
+    qft = QFT(signal_length=2 ** num_qubits, basis_to_transform=basis_to_transform,
+              min_rotation_angle=min_rotation_angle)
+    qft.qft_circuit()
+    result = simulate(qft.input_circuit + qft.circuit, simulator=cirq.Simulator(dtype=np.complex128),
+                      qubit_order=qft.qubits, optimize=False)  # see QFT.simulate_circuit
+    expected = qft.simulate_statevector()
+    return float(np.abs(np.vdot(expected, result.final_state_vector)) ** 2)
+
+
+def benchmark(min_qubits=4, max_qubits=24, step=2, max_circuit_sim_qubits=22):
+    """
+    Gate counts and wall times of the exact and approximate QFT.
+    Approximate QFT drops rotations below 2*pi/n**2.
+    :param max_circuit_sim_qubits: largest size simulated with cirq.Simulator
+    :return: list of dict rows (also printed as a table)
+    """
+    rows = []
+    header = (f"{'n':>3} {'gates':>7} {'aqft':>7} {'build s':>9} {'aqft build s':>13} "
+              f"{'cirq sim s':>11} {'fft s':>9} {'aqft fid':>9}")
+    print(header)
+    print('-' * len(header))
+    for n in range(min_qubits, max_qubits + 1, step):
+        basis = format(np.random.randint(2 ** n), f'0{n}b')
+        row = {'num_qubits': n}
+        for label, angle in (('exact', 0.0), ('approx', 2 * np.pi / n ** 2)):
+            start = time.perf_counter()
+            qft = QFT(signal_length=2 ** n, basis_to_transform=basis, min_rotation_angle=angle)
+            qft.qft_circuit()
+            row[f'{label}_build_s'] = time.perf_counter() - start
+            row[f'{label}_gates'] = sum(qft.gate_counts().values())
+
+        start = time.perf_counter()
+        qft.simulate_statevector()
+        row['fft_s'] = time.perf_counter() - start
+
+        row['cirq_sim_s'] = float('nan')
+        row['approx_fidelity'] = float('nan')
+        if n <= max_circuit_sim_qubits:
+            exact = QFT(signal_length=2 ** n, basis_to_transform=basis)
+            exact.qft_circuit()
+            start = time.perf_counter()
+            simulate(exact.input_circuit + exact.circuit, qubit_order=exact.qubits, optimize=False)
+            row['cirq_sim_s'] = time.perf_counter() - start
+            row['approx_fidelity'] = validate(n, 2 * np.pi / n ** 2, basis)
+
+        rows.append(row)
+        print(f"{n:>3} {row['exact_gates']:>7} {row['approx_gates']:>7} {row['exact_build_s']:>9.4f} "
+              f"{row['approx_build_s']:>13.4f} {row['cirq_sim_s']:>11.4f} {row['fft_s']:>9.4f} "
+              f"{row['approx_fidelity']:>9.5f}")
+    return rows
+
+
+def run_benchmark(**kwargs):
+    """Command-line wrapper: print the benchmark table only."""
+    benchmark(**kwargs)
+
+
+if __name__ == '__main__':
+    with ElapsedTimer('QFT'):
+        fire.Fire({'benchmark': run_benchmark, 'validate': validate})
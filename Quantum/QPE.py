@@ -1,68 +1,167 @@
+import time
+
 import cirq
 import numpy as np
+from circuit_optimizer import optimize_circuit, run as run_circuit
 from QFT import QFT
 
+# Compiled QPE cores keyed by (unitary matrix bytes, shape, counting qubits)
+_CIRCUIT_CACHE = {}
+
+
+def unitary_powers(matrix, count):
+    """
+    U^(2^k) for k = 0..count-1 by repeated squaring (count - 1 matrix products).
+    :param matrix: unitary matrix
+    :param count: number of powers
+    :return: list of matrices
+    """
+    powers = [np.asarray(matrix, dtype=np.complex128)]
+    for _ in range(count - 1):
+        powers.append(powers[-1] @ powers[-1])
+    return powers
+
+
+def clear_circuit_cache():
+    _CIRCUIT_CACHE.clear()
+
+
 class quantum_phase_estimation:
-    def __init__(self, unitary, eigenstate, num_counting_qubits=3):
+    def __init__(self, unitary, eigenstate, num_counting_qubits=3, use_cache=True):
         self.unitary = unitary
         self.eigenstate = eigenstate
         self.num_counting_qubits = num_counting_qubits
+        self.use_cache = use_cache
 
         self.counting_qubits = [cirq.LineQubit(i) for i in range(num_counting_qubits)]
         self.eigenstate_qubits = [cirq.LineQubit(i + num_counting_qubits) for i in range(len(eigenstate))]
 
         self.circuit = cirq.Circuit()
 
+    def _cache_key(self):
+        matrix = cirq.unitary(self.unitary)
+        return matrix.tobytes(), matrix.shape, self.num_counting_qubits
+
     def apply_hadamards(self):
         self.circuit.append(cirq.H.on_each(*self.counting_qubits))
 
     def apply_controlled_unitaries(self):
-        for i in range(self.num_counting_qubits):
-            exponent = 2 ** i
-            controlled_unitary = cirq.ControlledGate(self.unitary**exponent)
+        # Powers come from squaring the matrix once per counting qubit rather
+        # than asking cirq to exponentiate (and later decompose) U**(2**i).
+        # Counting qubit 0 is the most significant bit, so it controls the
+        # highest power.
+        powers = unitary_powers(cirq.unitary(self.unitary), self.num_counting_qubits)
+        for i, power in enumerate(reversed(powers)):
+            controlled_unitary = cirq.MatrixGate(power).controlled()
             self.circuit.append(controlled_unitary(self.counting_qubits[i], *self.eigenstate_qubits))
 
     def apply_inverse_qft(self):
+        # QFT.circuit uses the exp(-2*pi*i*xy/N) convention (numpy's forward
+        # FFT), i.e. it already is the inverse of the textbook QFT.
         qft_instance = QFT(signal_length=2**self.num_counting_qubits, validate_inverse_fourier=True, qubits=self.counting_qubits)
         qft_instance.qft_circuit()
-        self.circuit += qft_instance.inv_circuit
+        self.circuit += qft_instance.circuit
 
     def measure_counting_qubits(self):
         self.circuit.append(cirq.measure(*self.counting_qubits, key='result'))
 
-    def build_circuit(self):
-        # Initialize eigenstate
-        for i, bit in enumerate(self.eigenstate):
-            if int(bit) == 1:
-                self.circuit.append(cirq.X(self.eigenstate_qubits[i]))
+    def build_core(self):
+        """Eigenstate-independent part of the circuit, compiled once per (unitary, precision)."""
+        key = self._cache_key() if self.use_cache else None
+        if key is not None and key in _CIRCUIT_CACHE:
+            return _CIRCUIT_CACHE[key]
 
+        self.circuit = cirq.Circuit()
         self.apply_hadamards()
         self.apply_controlled_unitaries()
         self.apply_inverse_qft()
         self.measure_counting_qubits()
+        core = cirq.FrozenCircuit(optimize_circuit(self.circuit))
+        if key is not None:
+            _CIRCUIT_CACHE[key] = core
+        return core
+
+    def build_circuit(self):
+        # Initialize eigenstate
+        preparation = cirq.Circuit(
+            cirq.X(self.eigenstate_qubits[i]) for i, bit in enumerate(self.eigenstate) if int(bit) == 1
+        )
+        self.circuit = preparation + self.build_core().unfreeze(copy=False)
+        return self.circuit
 
-    def run(self, repetitions=1000):
+    def run(self, repetitions=1000, verbose=True, simulator=None):
         self.build_circuit()
-        print("Quantum Phase Estimation Circuit:")
-        print(self.circuit)
+        if verbose:
+            print("Quantum Phase Estimation Circuit:")
+            print(self.circuit)
 
-        simulator = cirq.Simulator()
-        result = simulator.run(self.circuit, repetitions=repetitions)
-        histogram = result.histogram(key='result')
+        # The core is compiled once in build_core; the X-gate preparation has nothing to merge
+        histogram = run_circuit(self.circuit, repetitions, simulator, optimize=False).histogram(key='result')
 
         formatted_result = {}
         for k in histogram.keys():
             binary_key = format(k, f'0{self.num_counting_qubits}b')
             formatted_result[binary_key] = histogram[k]
 
-        print("Measurement results:")
-        for outcome, count in formatted_result.items():
-            print(f"{outcome}: {count}")
+        if verbose:
+            print("Measurement results:")
+            for outcome, count in formatted_result.items():
+                print(f"{outcome}: {count}")
         return formatted_result
-    
+
+
+def _uncached_run(unitary, eigenstate, num_counting_qubits, repetitions):
+    """Reference path: cirq-exponentiated gates, circuit rebuilt on every call."""
+    counting = [cirq.LineQubit(i) for i in range(num_counting_qubits)]
+    target = [cirq.LineQubit(i + num_counting_qubits) for i in range(len(eigenstate))]
+    circuit = cirq.Circuit(cirq.X(target[i]) for i, bit in enumerate(eigenstate) if int(bit) == 1)
+    circuit.append(cirq.H.on_each(*counting))
+    for i in range(num_counting_qubits):
+        circuit.append(cirq.ControlledGate(unitary**(2**(num_counting_qubits - 1 - i)))(counting[i], *target))
+    qft_instance = QFT(signal_length=2**num_counting_qubits, qubits=counting)
+    qft_instance.qft_circuit()
+    circuit += qft_instance.circuit
+    circuit.append(cirq.measure(*counting, key='result'))
+    return run_circuit(circuit, repetitions).histogram(key='result')
+
+
+def benchmark(unitary=None, eigenstates=('000', '011', '101', '111'), counting_qubits=range(2, 11, 2),
+              repetitions=100, runs=3):
+    """
+    Sweep counting-qubit counts; time `runs` passes over every eigenstate,
+    uncached (rebuild + cirq powers) versus cached (squared powers, reused core).
+    """
+    if unitary is None:
+        # Dense three-qubit unitary, the case where cirq's own powers are costly
+        unitary = cirq.MatrixGate(cirq.testing.random_unitary(8, random_state=1))
+
+    print(f"{'counting':>8} {'uncached s':>11} {'cached s':>9} {'speedup':>8}")
+    rows = []
+    for n in counting_qubits:
+        start = time.perf_counter()
+        for _ in range(runs):
+            for state in eigenstates:
+                _uncached_run(unitary, state, n, repetitions)
+        uncached = time.perf_counter() - start
+
+        clear_circuit_cache()
+        simulator = cirq.Simulator()
+        start = time.perf_counter()
+        for _ in range(runs):
+            for state in eigenstates:
+                quantum_phase_estimation(unitary, state, n).run(repetitions, verbose=False, simulator=simulator)
+        cached = time.perf_counter() - start
+
+        rows.append({'counting_qubits': n, 'uncached_s': uncached, 'cached_s': cached})
+        print(f"{n:>8} {uncached:>11.3f} {cached:>9.3f} {uncached / cached:>7.1f}x")
+    return rows
+
+
 if __name__ == "__main__":
     # Example usage with a simple unitary (Z gate) and eigenstate |1>
     unitary = cirq.Z
     eigenstate = '1'
     qpe = quantum_phase_estimation(unitary, eigenstate, num_counting_qubits=3)
-    qpe.run(repetitions=1000)
\ No newline at end of file
+    qpe.run(repetitions=1000)
+
+    benchmark()
@@ -1,79 +1,208 @@
+import time
+
 import cirq
 import numpy as np
+from circuit_optimizer import optimize_circuit, run
+
+
+def default_secret(num_qubits):
+    """'110' for three qubits, generally '11' followed by zeros."""
+    return ('11' + '0' * num_qubits)[:num_qubits]
 
-def oracle(input_qubits, target_qubits, circuit):
+
+def oracle(input_qubits, target_qubits, circuit, secret=None):
     """Implements the oracle for Simon's algorithm.
 
+    f(x) = x xor (x_j * s), where j is the first set bit of the secret s, is
+    two-to-one with f(x) = f(x xor s): copy x into the target register, then
+    flip the secret's bits whenever x_j is set.
+
     Args:
         input_qubits: List of cirq.Qid, the input qubits.
         target_qubits: List of cirq.Qid, the target qubits.
         circuit: cirq.Circuit, the circuit implementing the function f.
+        secret: str, the secret bit string (default: default_secret).
         """
-    
-    #Oracle for 110
-    circuit.append(cirq.CNOT(input_qubits[2], target_qubits[1]))
-    circuit.append(cirq.X(target_qubits[0]))
-    circuit.append(cirq.CNOT(input_qubits[2], target_qubits[0]))
-    circuit.append(cirq.CCNOT(input_qubits[0],input_qubits[1], target_qubits[0]))
-    circuit.append(cirq.X(input_qubits[0]))
-    circuit.append(cirq.X(input_qubits[1]))
-    circuit.append(cirq.CCNOT(input_qubits[0],input_qubits[1], target_qubits[0]))
-    circuit.append(cirq.X(input_qubits[0]))
-    circuit.append(cirq.X(input_qubits[1]))
-    circuit.append(cirq.X(input_qubits[0]))
+    n = len(input_qubits)
+    secret = secret or default_secret(n)
+    if len(secret) != n or set(secret) - {'0', '1'} or '1' not in secret:
+        raise ValueError(f"secret must be a nonzero {n}-bit string")
+
+    circuit.append(cirq.CNOT(q, t) for q, t in zip(input_qubits, target_qubits))
+    j = secret.index('1')
+    circuit.append(cirq.CNOT(input_qubits[j], target_qubits[i])
+                   for i, bit in enumerate(secret) if bit == '1')
     return circuit
 
-def simons_algorithm_circuit(num_qubits=3, copies=1000):
+
+def simons_algorithm_circuit(num_qubits=3, copies=1000, secret=None):
     """Constructs the circuit for Simon's algorithm.
 
     Args:
         num_qubits: int, number of qubits in the input register.
         copies: int, number of measurement repetitions.
+        secret: str, the secret bit string (default: default_secret).
         """
     # Define qubits
     input_qubits = [cirq.LineQubit(i) for i in range(num_qubits)]
     target_qubits = [cirq.LineQubit(i + num_qubits) for i in range(num_qubits)]
-    
+
     # Create circuit
     circuit = cirq.Circuit()
-    
+
     # Apply Hadamard to input qubits
     circuit.append(cirq.H.on_each(*input_qubits))
-    
+
     # Apply oracle
-    oracle(input_qubits, target_qubits, circuit)
-    
+    oracle(input_qubits, target_qubits, circuit, secret)
+
     # Apply Hadamard to input qubits again
     circuit.append(cirq.H.on_each(*input_qubits))
-    
+
     # Measure input qubits
     circuit.append(cirq.measure(*input_qubits, key='result'))
-    
+
     return circuit, input_qubits, target_qubits
 
 
-def run_simons_algorithm(circuit, copies=1000):
+def run_simons_algorithm(circuit, copies=1000, optimize=True):
     """Runs the Simon's algorithm circuit and returns measurement results.
 
     Args:
         circuit: cirq.Circuit, the circuit to be executed.
         copies: int, number of measurement repetitions.
+        optimize: bool, compile the circuit with optimize_circuit first.
         """
+    return run(circuit, repetitions=copies, optimize=optimize).histogram(key='result')
+
+
+def sample_equations(circuit, num_qubits, copies, simulator=None):
+    """Draws all samples in one simulator call, each packed into an int (qubit 0 = MSB).
+
+    The circuit is expected to be compiled already, so repeated batches do
+    not recompile it.
+
+    Returns:
+        List of Python ints y with y . s = 0 (mod 2).
+        """
+    bits = run(circuit, repetitions=copies, simulator=simulator, optimize=False).measurements['result']
+    # int64 is exact below 63 bits; object arrays fall back to Python ints
+    dtype = np.int64 if num_qubits < 63 else object
+    weights = np.array([1 << k for k in range(num_qubits - 1, -1, -1)], dtype=dtype)
+    return [int(y) for y in bits.astype(dtype) @ weights]
+
+
+def gf2_nullspace(rows, num_bits):
+    """Null space over GF(2) of bit-packed rows, by XOR elimination on ints.
+
+    Args:
+        rows: iterable of ints, one equation per int.
+        num_bits: int, number of unknowns.
+
+    Returns:
+        List of ints spanning {v : popcount(row & v) is even for every row}.
+        """
+    # XOR basis keyed by leading bit
+    basis = {}
+    for row in rows:
+        while row:
+            lead = row.bit_length() - 1
+            if lead not in basis:
+                basis[lead] = row
+                break
+            row ^= basis[lead]
+
+    # Reduced row echelon form: clear each pivot bit from the other rows
+    for pivot in sorted(basis):
+        for lead in basis:
+            if lead != pivot and basis[lead] >> pivot & 1:
+                basis[lead] ^= basis[pivot]
+
+    nullspace = []
+    for free in range(num_bits):
+        if free in basis:
+            continue
+        vector = 1 << free
+        for pivot, row in basis.items():
+            if row >> free & 1:
+                vector |= 1 << pivot
+        nullspace.append(vector)
+    return nullspace
+
+
+def recover_secret(samples, num_qubits):
+    """Returns the secret as a bit string, or None if the samples are not yet full rank."""
+    nullspace = gf2_nullspace(samples, num_qubits)
+    if len(nullspace) != 1:
+        return None
+    return format(nullspace[0], f'0{num_qubits}b')
+
+
+def simons_algorithm(num_qubits=3, secret=None, extra_samples=10, simulator=None):
+    """Full Simon's algorithm: quantum sampling plus classical post-processing.
+
+    n - 1 independent equations are needed; drawing n + extra_samples in a
+    single call leaves them rank deficient with probability about
+    2^-extra_samples, in which case another batch is drawn.
+
+    Returns:
+        (recovered secret, number of samples used)
+        """
+    circuit, _, _ = simons_algorithm_circuit(num_qubits, secret=secret)
+    circuit = optimize_circuit(circuit)
+    simulator = simulator or cirq.Simulator()
+    samples = []
+    while True:
+        samples += sample_equations(circuit, num_qubits, num_qubits + extra_samples, simulator)
+        found = recover_secret(samples, num_qubits)
+        if found is not None:
+            return found, len(samples)
+
+
+def benchmark(max_qubits=20, seed=0):
+    """Random secrets for n = 2..max_qubits (2n simulated qubits), timing each stage.
+
+    cirq factors the state into unentangled blocks, so sampling cost grows
+    with the Hamming weight of the secret rather than with 2n alone.
+    """
+    rng = np.random.default_rng(seed)
     simulator = cirq.Simulator()
-    result = simulator.run(circuit, repetitions=copies)
-    return result.histogram(key='result')
+    print(f"{'n':>3} {'secret':>{max_qubits}} {'ok':>3} {'samples':>7} {'sample s':>9} {'solve ms':>9}")
+    rows = []
+    for n in range(2, max_qubits + 1):
+        secret = format(int(rng.integers(1, 2 ** n)), f'0{n}b')
+        circuit = optimize_circuit(simons_algorithm_circuit(n, secret=secret)[0])
+
+        start = time.perf_counter()
+        samples = sample_equations(circuit, n, n + 10, simulator)
+        sample_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = recover_secret(samples, n)
+        solve_time = time.perf_counter() - start
+
+        rows.append({'n': n, 'secret': secret, 'found': found, 'samples': len(samples),
+                     'sample_s': sample_time, 'solve_s': solve_time})
+        print(f"{n:>3} {secret:>{max_qubits}} {'yes' if found == secret else 'no':>3} "
+              f"{len(samples):>7} {sample_time:>9.3f} {solve_time * 1e3:>9.3f}")
+    return rows
+
 
 if __name__ == "__main__":
     num_qubits = 3
     copies = 1000
-    
+
     circuit, input_qubits, target_qubits = simons_algorithm_circuit(num_qubits, copies)
     print("Circuit:")
     print(circuit)
-    
+
     results = run_simons_algorithm(circuit, copies)
     print("\nMeasurement results:")
     for outcome, count in results.items():
         print(f"{outcome:0{num_qubits}b}: {count}")
 
-        
\ No newline at end of file
+    secret, used = simons_algorithm(num_qubits)
+    print(f"\nRecovered secret {secret} from {used} samples")
+
+    print("\nScaling benchmark")
+    benchmark()
@@ -0,0 +1,220 @@
+import time
+from collections import Counter
+
+import cirq
+import numpy as np
+
+
+def circuit_stats(circuit):
+    """
+    :param circuit: cirq circuit
+    :return: dict with depth (moments), total operations and counts by qubit arity
+    """
+    arity = Counter(len(op.qubits) for op in circuit.all_operations()
+                    if not cirq.is_measurement(op))
+    return {
+        'depth': len(circuit),
+        'operations': sum(arity.values()),
+        'one_qubit': arity.get(1, 0),
+        'two_qubit': arity.get(2, 0),
+        'multi_qubit': sum(c for k, c in arity.items() if k > 2),
+    }
+
+
+def _is_inverse_pair(first, second, atol):
+    if first.qubits != second.qubits:
+        return False
+    if cirq.is_parameterized(first) or cirq.is_parameterized(second):
+        return cirq.inverse(first, None) == second
+    if len(first.qubits) > 3 or not (cirq.has_unitary(first) and cirq.has_unitary(second)):
+        return False
+    product = cirq.unitary(second) @ cirq.unitary(first)
+    # Equal to the identity up to a global phase
+    return cirq.allclose_up_to_global_phase(product, np.eye(len(product)), atol=atol)
+
+
+def cancel_adjacent_inverses(circuit, atol=1e-8):
+    """
+    Removes pairs of operations that are adjacent on all of their qubits and
+    multiply to the identity (X X, CNOT CNOT, H H, U U^dagger, ...). Runs to
+    a fixed point, so nested pairs such as X H H X cancel completely.
+    """
+    ops = list(circuit.all_operations())
+    kept = []
+    last_on_qubit = {}
+    for op in ops:
+        previous = {last_on_qubit.get(q) for q in op.qubits}
+        if len(previous) == 1:
+            index = previous.pop()
+            if index is not None and kept[index] is not None and _is_inverse_pair(kept[index], op, atol):
+                kept[index] = None
+                # Restore the qubits' previous live operations
+                for q in op.qubits:
+                    last_on_qubit[q] = _last_live(kept, q, index)
+                continue
+        kept.append(op)
+        for q in op.qubits:
+            last_on_qubit[q] = len(kept) - 1
+    return cirq.Circuit(op for op in kept if op is not None)
+
+
+def _last_live(kept, qubit, before):
+    for i in range(before - 1, -1, -1):
+        if kept[i] is not None and qubit in kept[i].qubits:
+            return i
+    return None
+
+
+def _merge_run(circuit_op):
+    """One PhasedXZ per run of single-qubit gates; lone gates keep their fast native form."""
+    ops = list(circuit_op.circuit.all_operations())
+    if len(ops) == 1:
+        return ops[0]
+    return cirq.PhasedXZGate.from_matrix(cirq.unitary(circuit_op)).on(*circuit_op.qubits)
+
+
+def merge_single_qubit_gates(circuit):
+    return cirq.merge_k_qubit_unitaries(circuit, k=1, rewriter=_merge_run)
+
+
+def optimize_circuit(circuit, atol=1e-8):
+    """
+    Compile step applied before simulation:
+    cancel adjacent inverse pairs, merge runs of single-qubit gates into one
+    PhasedXZ each, drop rotations below atol and compress the result into as
+    few moments as possible.
+    Parameterized operations are left in place for later resolution.
+    :param circuit: cirq circuit
+    :param atol: tolerance for identity checks and negligible operations
+    :return: optimized cirq circuit
+    """
+    circuit = cancel_adjacent_inverses(circuit, atol)
+    if not cirq.is_parameterized(circuit):
+        circuit = merge_single_qubit_gates(circuit)
+    circuit = cirq.drop_negligible_operations(circuit, atol=atol)
+    circuit = cirq.align_left(circuit)
+    return cirq.drop_empty_moments(circuit)
+
+
+def run(circuit, repetitions=1, simulator=None, optimize=True, **kwargs):
+    """
+    Shared entry point for sampling: compile with optimize_circuit, then simulator.run.
+    :param circuit: cirq circuit with measurements
+    :param repetitions: shots
+    :param simulator: cirq simulator to reuse (default: a new cirq.Simulator)
+    :param optimize: False skips the compile step, for circuits it slows down
+    :param kwargs: passed to simulator.run (e.g. param_resolver)
+    :return: cirq.Result
+    """
+    if optimize:
+        circuit = optimize_circuit(circuit)
+    return (simulator or cirq.Simulator()).run(circuit, repetitions=repetitions, **kwargs)
+
+
+def simulate(circuit, simulator=None, optimize=True, qubit_order=None, **kwargs):
+    """
+    Shared entry point for state-vector simulation: compile, then simulator.simulate.
+    Qubits the compile step empties stay in the state, in the original order.
+    :param circuit: cirq circuit
+    :param simulator: cirq simulator to reuse (default: a new cirq.Simulator)
+    :param optimize: False skips the compile step, for circuits it slows down
+    :param qubit_order: qubit order of the state (default: sorted circuit qubits)
+    :param kwargs: passed to simulator.simulate (e.g. initial_state)
+    :return: cirq simulation result
+    """
+    if qubit_order is None:
+        qubit_order = sorted(circuit.all_qubits())
+    if optimize:
+        circuit = optimize_circuit(circuit)
+    return (simulator or cirq.Simulator()).simulate(circuit, qubit_order=qubit_order, **kwargs)
+
+
+def compile_circuit(circuit, atol=1e-8):
+    """
+    :return: (optimized circuit, {'before': stats, 'after': stats})
+    """
+    optimized = optimize_circuit(circuit, atol)
+    return optimized, {'before': circuit_stats(circuit), 'after': circuit_stats(optimized)}
+
+
+def _time_run(circuit, repetitions, runs):
+    simulator = cirq.Simulator()
+    simulator.run(circuit, repetitions=1)
+    start = time.perf_counter()
+    for _ in range(runs):
+        simulator.run(circuit, repetitions=repetitions)
+    return (time.perf_counter() - start) / runs
+
+
+def benchmark_circuits():
+    """Representative circuit from every algorithm in the folder."""
+    import Bells_Inequality
+    import DJ_algo
+    import Grovers
+    import HHL
+    import HamiltonianSim
+    import QAE
+    import QFT
+    import QPE
+    import Simons
+    import qrng
+
+    circuits = {}
+    circuits['bell'] = Bells_Inequality.bell_inequality_test_circuit()
+    dj, mask, offset = DJ_algo.dj_circuit(8)
+    circuits['deutsch-jozsa'] = cirq.resolve_parameters(
+        dj, {**{s: i % 2 for i, s in enumerate(mask)}, offset: 1})
+    circuits['grover'] = Grovers.grover_circuit(8, ['01101001', '11100010'])
+    circuits['simon'] = Simons.simons_algorithm_circuit(10, secret='1011001101')[0]
+    circuits['qrng'] = qrng.qrng_circuit(10)
+
+    qft = QFT.QFT(signal_length=2 ** 8)
+    qft.qft_circuit()
+    circuits['qft'] = qft.circuit + cirq.Circuit(cirq.measure(*qft.qubits, key='m'))
+
+    qpe = QPE.quantum_phase_estimation(cirq.Z ** 0.3, '1', num_counting_qubits=8)
+    circuits['qpe'] = qpe.build_circuit()
+
+    trotter = HamiltonianSim.trotter_circuit(HamiltonianSim.transverse_field_ising(6), 1.0, steps=4, order=2)
+    circuits['trotter'] = trotter + cirq.Circuit(cirq.measure(*sorted(trotter.all_qubits()), key='m'))
+
+    pricer = QAE.QuantumOptionPricer(100.0, 100.0, 1.0, 0.05, 0.2, num_qubits=4)
+    circuits['qae'] = pricer.problem.circuit(3)
+
+    A, b, _ = HHL.mean_variance_system(HHL.random_returns(4))
+    circuits['hhl'] = HHL.HHL(A, 5).circuit(b)
+    return circuits
+
+
+def benchmark(repetitions=1000, runs=5):
+    """Before/after depth, gate counts and simulator.run time for each algorithm."""
+    print(f"{'circuit':>14} {'depth':>11} {'operations':>11} {'2q':>9} {'raw s':>8} {'opt s':>8} {'speedup':>8}")
+    rows = []
+    for name, circuit in benchmark_circuits().items():
+        start = time.perf_counter()
+        optimized, stats = compile_circuit(circuit)
+        compile_time = time.perf_counter() - start
+        raw = _time_run(circuit, repetitions, runs)
+        opt = _time_run(optimized, repetitions, runs)
+        before, after = stats['before'], stats['after']
+        rows.append({'circuit': name, **{f'{k}_before': v for k, v in before.items()},
+                     **{f'{k}_after': v for k, v in after.items()},
+                     'compile_s': compile_time, 'raw_s': raw, 'optimized_s': opt})
+        print(f"{name:>14} {before['depth']:>5}->{after['depth']:<5} "
+              f"{before['operations']:>5}->{after['operations']:<5} "
+              f"{before['two_qubit']:>4}->{after['two_qubit']:<4} "
+              f"{raw:>8.4f} {opt:>8.4f} {raw / opt:>7.2f}x")
+    return rows
+
+
+if __name__ == '__main__':
+    q = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(q[0]), cirq.X(q[0]), cirq.H(q[1]), cirq.rz(1e-12)(q[1]),
+                           cirq.CNOT(*q), cirq.CNOT(*q), cirq.T(q[0]), cirq.S(q[0]),
+                           cirq.measure(*q, key='m'))
+    optimized, stats = compile_circuit(circuit)
+    print(circuit)
+    print(optimized)
+    print(stats)
+    print()
+    benchmark()
@@ -1,5 +1,41 @@
+import ctypes
+import threading
+
 import cirq
 import numpy as np
+from circuit_optimizer import run
+
+
+def qrng_circuit(num_qubits):
+    """
+    :param num_qubits: Number of qubits, each put in equal superposition
+    :return: cirq circuit measuring all qubits under key 'z'
+    """
+    Q_reg = [cirq.LineQubit(i) for i in range(num_qubits)]
+    circuit = cirq.Circuit()
+    circuit.append(cirq.H(Q_reg[c]) for c in range(num_qubits))
+    circuit.append(cirq.measure(*Q_reg, key='z'))
+    return circuit
+
+
+def sample_integers(circuit, num_qubits, repetitions, sim=None):
+    """
+    Draw many measurement outcomes with a single simulator call.
+    :param circuit: circuit from qrng_circuit
+    :param num_qubits: Number of measured qubits
+    :param repetitions: Number of samples
+    :param sim: cirq simulator to reuse (optional)
+    :return: np.ndarray of integers in [0, 2**num_qubits)
+    """
+    # The measured qubits are unentangled, but sampling the joint state is
+    # much cheaper than cirq's per-qubit split-state bookkeeping.
+    sim = sim or cirq.Simulator(split_untangled_states=False)
+    # Only Hadamards and measurements: compiling has nothing to merge and
+    # measured 0.86-0.99x in circuit_optimizer.benchmark.
+    bits = run(circuit, repetitions, sim, optimize=False).measurements['z']
+    weights = 1 << np.arange(num_qubits - 1, -1, -1, dtype=np.int64)
+    return bits.astype(np.int64) @ weights
+
 
 def random_number_generator(low=0, high=2**10, m=10):
     """
@@ -12,27 +48,141 @@ def random_number_generator(low=0, high=2**10, m=10):
     qubits_required = int(np.ceil(np.log2(high-low)))
     print(f"Number of qubits required: {qubits_required}")
 
-    Q_reg = [cirq.LineQubit(i) for i in range(qubits_required)]
-    circuit = cirq.Circuit()
-    circuit.append(cirq.H(Q_reg[c]) for c in range(qubits_required))
-    circuit.append(cirq.measure(*Q_reg, key='z'))
+    circuit = qrng_circuit(qubits_required)
     print("Circuit:")
     print(circuit)
 
-    sim = cirq.Simulator()
+    sim = cirq.Simulator(split_untangled_states=False)
+
+    # Rejection sampling on whole batches: draw enough samples for m
+    # acceptances on average, then top up with batches sized from the
+    # observed acceptance rate.
+    acceptance = (high - low) / 2**qubits_required
+    output = np.empty(0, dtype=np.int64)
+    needed = m
+    while needed > 0:
+        batch = int(np.ceil(needed / acceptance * 1.05)) + 16
+        rand_numbers = sample_integers(circuit, qubits_required, batch, sim) + low
+        output = np.concatenate([output, rand_numbers[rand_numbers < high][:needed]])
+        needed = m - len(output)
+    return output.tolist()
+
+
+def qrng_stream(low=0, high=2**10, batch_size=10000):
+    """
+    Endless stream of quantum random integers in [low, high).
+    :param low: lower bound of numbers to be generated
+    :param high: Upper bound of numbers to be generated
+    :param batch_size: Repetitions per simulator call
+    :return: generator of ints
+    """
+    qubits_required = int(np.ceil(np.log2(high-low)))
+    circuit = qrng_circuit(qubits_required)
+    sim = cirq.Simulator(split_untangled_states=False)
+    while True:
+        rand_numbers = sample_integers(circuit, qubits_required, batch_size, sim) + low
+        yield from rand_numbers[rand_numbers < high].tolist()
+
+
+class _BitGen(ctypes.Structure):
+    # Mirrors numpy's bitgen_t (numpy/random/bitgen.h)
+    _fields_ = [
+        ('state', ctypes.c_void_p),
+        ('next_uint64', ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)),
+        ('next_uint32', ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)),
+        ('next_double', ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)),
+        ('next_raw', ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)),
+    ]
 
-    num_gen = 0
-    output = []
-    while num_gen < m:
-        result = sim.run(circuit, repetitions=1)
-        rand_number = result.data['z'][0] + low
-        if rand_number < high:
-            output.append(rand_number)
-            num_gen += 1
-    return output
+
+class QuantumBitGenerator:
+    """
+    NumPy bit generator backed by simulated qubit measurements.
+
+    Random words are produced in bulk (pool_words 64-bit words per refill,
+    one simulator call each) and served to numpy through the bitgen_t
+    interface, so it plugs straight into np.random.Generator:
+
+        rng = np.random.Generator(QuantumBitGenerator())
+        rng.standard_normal(1000)
+    """
+
+    _CAPSULE_NAME = b'BitGenerator'
+
+    def __init__(self, num_qubits=16, pool_words=2**14):
+        if 64 % num_qubits != 0:
+            raise ValueError("num_qubits must divide 64")
+        self.num_qubits = num_qubits
+        self.pool_words = pool_words
+        self.lock = threading.Lock()
+        self._circuit = qrng_circuit(num_qubits)
+        self._sim = cirq.Simulator(split_untangled_states=False)
+        self._pool = np.empty(0, dtype=np.uint64)
+        self._pos = 0
+        self._has_uint32 = False
+        self._uint32 = 0
+
+        # Keep the ctypes callbacks alive for as long as the generator lives
+        self._next_uint64 = _BitGen._fields_[1][1](lambda st: self._next_word())
+        self._next_uint32 = _BitGen._fields_[2][1](lambda st: self._next_half())
+        self._next_double = _BitGen._fields_[3][1](
+            lambda st: (self._next_word() >> 11) * (1.0 / 9007199254740992.0))
+        self._bitgen = _BitGen(None, self._next_uint64, self._next_uint32,
+                               self._next_double, self._next_uint64)
+
+        capsule_new = ctypes.pythonapi.PyCapsule_New
+        capsule_new.restype = ctypes.py_object
+        capsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+        self.capsule = capsule_new(ctypes.addressof(self._bitgen), self._CAPSULE_NAME, None)
+
+    def _refill(self):
+        samples_per_word = 64 // self.num_qubits
+        ints = sample_integers(self._circuit, self.num_qubits,
+                               self.pool_words * samples_per_word, self._sim)
+        words = ints.astype(np.uint64).reshape(self.pool_words, samples_per_word)
+        shifts = np.arange(samples_per_word, dtype=np.uint64) * np.uint64(self.num_qubits)
+        self._pool = np.bitwise_or.reduce(words << shifts, axis=1)
+        self._pos = 0
+
+    def _next_word(self):
+        if self._pos >= len(self._pool):
+            self._refill()
+        word = int(self._pool[self._pos])
+        self._pos += 1
+        return word
+
+    def _next_half(self):
+        if self._has_uint32:
+            self._has_uint32 = False
+            return self._uint32
+        word = self._next_word()
+        self._has_uint32 = True
+        self._uint32 = word >> 32
+        return word & 0xFFFFFFFF
+
+    def random_raw(self, size=None):
+        """
+        :param size: Number of 64-bit words (None for a single int)
+        :return: raw uint64 words straight from the pool
+        """
+        if size is None:
+            return self._next_word()
+        out = np.empty(size, dtype=np.uint64)
+        filled = 0
+        while filled < size:
+            if self._pos >= len(self._pool):
+                self._refill()
+            take = min(size - filled, len(self._pool) - self._pos)
+            out[filled:filled + take] = self._pool[self._pos:self._pos + take]
+            self._pos += take
+            filled += take
+        return out
 
 
 if __name__ == "__main__":
     output = random_number_generator()
     print(output)
-    print(f'Mean of generated numbers: {np.mean(output)}')
\ No newline at end of file
+    print(f'Mean of generated numbers: {np.mean(output)}')
+
+    rng = np.random.Generator(QuantumBitGenerator())
+    print(f'Quantum-backed standard normals: {rng.standard_normal(5)}')
@@ -0,0 +1,33 @@
+import numpy as np
+
+
+def householder_state_preparation(amplitudes):
+    """
+    Householder reflection mapping |0> to amplitudes / |amplitudes| (real amplitudes).
+    It is real symmetric and unitary, so it is its own inverse.
+    :param amplitudes: real amplitudes over 2^n basis states
+    :return: unitary matrix
+    """
+    psi = np.asarray(amplitudes, dtype=float)
+    psi = psi / np.linalg.norm(psi)
+    v = psi.copy()
+    v[0] -= 1.0
+    norm_sq = v @ v
+    if norm_sq < 1e-15:
+        return np.eye(len(psi))
+    return np.eye(len(psi)) - 2.0 * np.outer(v, v) / norm_sq
+
+
+def uniformly_controlled_ry(angles):
+    """
+    Block-diagonal unitary applying RY(angles[i]) to the last qubit when the
+    control register (first qubits, big-endian) holds i.
+    :param angles: one angle per control value
+    :return: unitary matrix
+    """
+    c, s = np.cos(np.asarray(angles, dtype=float) / 2), np.sin(np.asarray(angles, dtype=float) / 2)
+    matrix = np.zeros((2 * len(c), 2 * len(c)))
+    idx = 2 * np.arange(len(c))
+    matrix[idx, idx], matrix[idx, idx + 1] = c, -s
+    matrix[idx + 1, idx], matrix[idx + 1, idx + 1] = s, c
+    return matrix
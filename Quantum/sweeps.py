@@ -0,0 +1,54 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import cirq
+import numpy as np
+from circuit_optimizer import optimize_circuit
+
+# Sweeps are split into at most N_CHUNKS chunks with one seed each. The split
+# is fixed (not the worker count), so a given seed gives the same samples on
+# any machine; workers just pick up chunks.
+N_CHUNKS = 64
+
+
+def _run_chunk(circuit, resolvers, repetitions, keys, seed):
+    sim = cirq.Simulator(seed=seed)
+    results = sim.run_sweep(circuit, params=resolvers, repetitions=repetitions)
+    return {key: np.stack([r.measurements[key] for r in results]) for key in keys}
+
+
+def run_sweep_arrays(circuit, sweep, repetitions=1000, keys=None, processes=None,
+                     parallel_threshold=64, seed=None, optimize=True):
+    """
+    Run one parameterized circuit over every point of a sweep.
+    :param circuit: cirq circuit with sympy symbols
+    :param sweep: cirq.Sweep, list of ParamResolvers or list of dicts
+    :param repetitions: shots per sweep point
+    :param keys: measurement keys to return (default: all keys in the circuit)
+    :param processes: worker processes; None picks os.cpu_count() for large grids
+    :param parallel_threshold: grids with fewer points run in-process
+    :param seed: seed for reproducible sampling, independent of processes
+    :param optimize: compile the symbolic circuit once with optimize_circuit before sweeping
+    :return: (list of ParamResolvers, {key: bool array [points, repetitions, qubits]})
+    """
+    resolvers = list(cirq.to_resolvers(sweep))
+    keys = list(keys or cirq.measurement_key_names(circuit))
+    if optimize:
+        circuit = optimize_circuit(circuit)
+    if processes is None:
+        processes = os.cpu_count() if len(resolvers) >= parallel_threshold else 1
+    processes = max(1, min(processes, len(resolvers)))
+
+    # Contiguous chunks keep the sweep order when the pieces are stacked back
+    chunks = np.array_split(np.arange(len(resolvers)), max(1, min(N_CHUNKS, len(resolvers))))
+    seeds = np.random.SeedSequence(seed).generate_state(len(chunks))
+    if processes == 1:
+        parts = [_run_chunk(circuit, [resolvers[i] for i in chunk], repetitions, keys, int(s))
+                 for chunk, s in zip(chunks, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(_run_chunk, circuit, [resolvers[i] for i in chunk],
+                                   repetitions, keys, int(s))
+                       for chunk, s in zip(chunks, seeds)]
+            parts = [f.result() for f in futures]
+    return resolvers, {key: np.concatenate([p[key] for p in parts]) for key in keys}
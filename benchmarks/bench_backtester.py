@@ -0,0 +1,55 @@
+"""Backtester.run, StreamingBacktester.run and PerformanceAnalyzer.generate_report."""
+
+import numpy as np
+import pandas as pd
+
+from qf_utils.backtester import Backtester
+from qf_utils.benchmarking import benchmark
+from qf_utils.performance import PerformanceAnalyzer
+from qf_utils.streaming import StreamingBacktester, iter_frames
+
+
+def ohlcv(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, n)))
+    index = pd.bdate_range("2000-01-03", periods=n)
+    return pd.DataFrame({
+        "Open": close * (1 + rng.normal(0, 0.002, n)),
+        "High": close * 1.01,
+        "Low": close * 0.99,
+        "Close": close,
+        "Volume": rng.integers(1_000, 10_000, n),
+    }, index=index)
+
+
+def sma_crossover(data, short_window=20, long_window=50):
+    signals = pd.Series(0, index=data.index)
+    short_ma = data["Close"].rolling(short_window).mean()
+    long_ma = data["Close"].rolling(long_window).mean()
+    signals[short_ma > long_ma] = 1
+    signals[short_ma < long_ma] = -1
+    return signals
+
+
+@benchmark("backtester.run", sizes=[252, 1_260, 5_040])
+def backtester_run(n):
+    data = ohlcv(n)
+    return lambda: Backtester(data).run(sma_crossover)
+
+
+@benchmark("backtester.streaming", sizes=[5_040, 100_000, 1_000_000])
+def streaming_run(n):
+    """Same strategy in 100,000-bar chunks, with no output files."""
+    data = ohlcv(n)
+    backtester = StreamingBacktester(lookback=49)
+    return lambda: backtester.run(iter_frames(data, 100_000), sma_crossover)
+
+
+@benchmark("performance.generate_report", sizes=[1_000, 10_000, 100_000])
+def generate_report(n):
+    rng = np.random.default_rng(1)
+    index = pd.bdate_range("2000-01-03", periods=n)
+    returns = pd.Series(rng.normal(0.0004, 0.01, n), index=index)
+    benchmark_returns = pd.Series(rng.normal(0.0003, 0.01, n), index=index)
+    analyzer = PerformanceAnalyzer(returns, benchmark_returns)
+    return analyzer.generate_report
@@ -0,0 +1,74 @@
+"""Event-driven execution engine on the compiled and interpreted event loops.
+
+Sizes are bars, split over four instruments. Two order streams submit one
+order per ten bars: market, limit (cancelled after 30 bars) and stop
+(cancelled after 60 bars). That gives about 1.2 events per bar, with
+partial fills under a 20% participation cap.
+"""
+
+import importlib.util
+
+import numpy as np
+import pandas as pd
+
+from qf_utils.benchmarking import SkipBenchmark, benchmark
+from qf_utils.execution import ExecutionEngine, FixedSlippage, PerShareCommission
+
+INSTRUMENTS = ["AAA", "BBB", "CCC", "DDD"]
+
+
+def workload(n_bars, seed=0):
+    rng = np.random.default_rng(seed)
+    per_instrument = n_bars // len(INSTRUMENTS)
+    index = pd.date_range("2024-01-02 09:31", periods=per_instrument, freq="min")
+    bars, closes = {}, []
+    for name in INSTRUMENTS:
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0, 0.0005, per_instrument)))
+        open_ = np.concatenate([[100.0], close[:-1]])
+        wick = np.abs(rng.normal(0.0, 0.0004, per_instrument)) * close
+        bars[name] = pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) + wick,
+                                   "Low": np.minimum(open_, close) - wick, "Close": close,
+                                   "Volume": rng.integers(500, 5_000, per_instrument).astype(float)}, index=index)
+        closes.append(close)
+
+    streams = {}
+    for name in ("alpha", "beta"):
+        n = n_bars // 20
+        when = np.sort(rng.integers(0, per_instrument - 1, n))
+        column = rng.integers(0, len(INSTRUMENTS), n)
+        side = rng.choice([-1, 1], n)
+        last = np.column_stack(closes)[when, column]
+        kind = rng.choice(["market", "limit", "stop"], n)
+        lifetime = np.where(kind == "stop", 60, 30)
+        streams[name] = pd.DataFrame({
+            "instrument": np.array(INSTRUMENTS)[column],
+            "type": kind,
+            "quantity": side * rng.integers(1, 10, n) * 100,
+            "limit_price": last * (1 - side * 0.0005),
+            "stop_price": last * (1 + side * 0.001),
+            "cancel_time": index[np.minimum(when + lifetime, per_instrument - 1)],
+        }, index=index[when])
+    return bars, streams
+
+
+def engine(n, backend):
+    bars, streams = workload(n)
+    engine = ExecutionEngine(bars, slippage=FixedSlippage(0.5), commission=PerShareCommission(),
+                             max_participation=0.2, backend=backend)
+    for name, orders in streams.items():
+        engine.add_stream(name, orders)
+    return engine
+
+
+@benchmark("execution.run.numba", sizes=[100_000, 1_000_000])
+def run_numba(n):
+    if importlib.util.find_spec("numba") is None:
+        raise SkipBenchmark("numba not installed")
+    compiled = engine(n, "numba")
+    compiled.run()  # compile, or load the cached machine code
+    return compiled.run
+
+
+@benchmark("execution.run.python", sizes=[10_000, 100_000])
+def run_python(n):
+    return engine(n, "python").run
@@ -0,0 +1,24 @@
+"""Cold-start import time of the package in a fresh interpreter.
+
+Process pools pay this once per worker, so ``make bench-compare`` guards it
+like any other kernel.
+"""
+
+import subprocess
+import sys
+
+from qf_utils.benchmarking import benchmark
+
+STATEMENTS = {
+    "package": "import qf_utils",
+    "risk_metrics": "from qf_utils import RiskMetrics",
+    "backtester": "from qf_utils import Backtester",
+    "pricing": "from qf_utils import PricingEngine",
+    "everything": "from qf_utils import *",
+}
+
+
+@benchmark("imports.cold_start", sizes=list(STATEMENTS))
+def cold_start(label):
+    command = [sys.executable, "-c", STATEMENTS[label]]
+    return lambda: subprocess.run(command, check=True)
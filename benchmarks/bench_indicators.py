@@ -0,0 +1,55 @@
+"""Batch, memoized and streaming technical indicators."""
+
+import numpy as np
+import pandas as pd
+
+from qf_utils import indicators
+from qf_utils.benchmarking import benchmark
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def prices(n, seed=0):
+    return pd.Series(100 * np.exp(np.cumsum(np.random.default_rng(seed).normal(0.0, 0.01, n))))
+
+
+def register(name, call):
+    @benchmark(f"indicators.{name}", sizes=SIZES)
+    def setup(n):
+        close = prices(n)
+        return lambda: call(close)
+
+
+register("sma", lambda x: indicators.sma(x, 50, cache=False))
+register("ema", lambda x: indicators.ema(x, span=50, cache=False))
+register("rolling_std", lambda x: indicators.rolling_std(x, 50, cache=False))
+register("zscore", lambda x: indicators.zscore(x, 50, cache=False))
+register("rsi", lambda x: indicators.rsi(x, 14, cache=False))
+register("atr", lambda x: indicators.atr(x * 1.01, x * 0.99, x, 14, cache=False))
+register("pandas_rolling_mean", lambda x: x.rolling(50).mean())
+
+
+@benchmark("indicators.sma_sweep_cached", sizes=[100_000])
+def sweep(n):
+    """A 5 x 5 fast/slow grid as run by parameter sweeps; every repeat after the first hits the cache."""
+    close = prices(n)
+    windows = [10, 20, 50, 100, 200]
+
+    def run():
+        for fast in windows:
+            for slow in windows:
+                indicators.sma(close, fast), indicators.sma(close, slow)
+
+    return run
+
+
+@benchmark("indicators.streaming_rsi_updates", sizes=[10_000])
+def streaming(n):
+    values = prices(n).tolist()
+
+    def run():
+        stream = indicators.StreamingRSI(14)
+        for x in values:
+            stream.update(x)
+
+    return run
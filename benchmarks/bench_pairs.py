@@ -0,0 +1,33 @@
+"""Pairs scanner on a sector-structured universe of 2,500 daily bars.
+
+Sizes are assets, in 20 equally sized sectors; about 5% of all pairs pass
+the correlation prefilter. Runs in-process so timings do not depend on the
+core count.
+"""
+
+import numpy as np
+import pandas as pd
+
+from qf_utils.benchmarking import benchmark
+from qf_utils.pairs import candidate_pairs, scan_pairs
+
+N_OBS = 2_500
+
+
+def universe(n_assets, seed=0):
+    rng = np.random.default_rng(seed)
+    factors = np.cumsum(rng.normal(0.0, 0.01, (N_OBS, 20)), axis=0)
+    idio = np.cumsum(rng.normal(0.0, 0.007, (N_OBS, n_assets)), axis=0)
+    return pd.DataFrame(np.exp(4.0 + np.repeat(factors, -(-n_assets // 20), axis=1)[:, :n_assets] + idio))
+
+
+@benchmark("pairs.scan", sizes=[100, 500, 1_000])
+def scan(n):
+    prices = universe(n)
+    return lambda: scan_pairs(prices, min_correlation=0.6, processes=1)
+
+
+@benchmark("pairs.correlation_prefilter", sizes=[1_000, 3_000])
+def prefilter(n):
+    returns = np.diff(np.log(universe(n).to_numpy()), axis=0)
+    return lambda: candidate_pairs(returns, min_correlation=0.6)
@@ -0,0 +1,40 @@
+"""Black-Scholes and Monte Carlo pricers on every available backend.
+
+Compiled backends appear only after ``make cython`` / ``make cpp`` (or with
+numba installed); missing ones are reported as skipped. Timings exclude JIT
+compilation because the runner makes one untimed call first.
+"""
+
+import numpy as np
+
+from qf_utils import pricing
+from qf_utils.benchmarking import SkipBenchmark, benchmark
+
+BACKENDS = ("numpy", "numba", "cython", "cpp")
+
+
+def backend(name, method):
+    found = pricing._BACKENDS.get(name)
+    if found is None or not found.supports(method):
+        raise SkipBenchmark(f"{name} backend not available")
+    return getattr(found, method)
+
+
+for name in BACKENDS:
+
+    @benchmark(f"pricers.black_scholes.{name}", sizes=[1, 1_000, 100_000])
+    def black_scholes(n, name=name):
+        func = backend(name, "black_scholes")
+        rng = np.random.default_rng(0)
+        K, T = rng.uniform(80, 120, n), rng.uniform(0.1, 2.0, n)
+        return lambda: func(100.0, K, T, 0.05, 0.2, "call")
+
+    @benchmark(f"pricers.european_mc.{name}", sizes=[10_000, 100_000, 1_000_000])
+    def european_mc(n, name=name):
+        func = backend(name, "european_mc")
+        return lambda: func(100.0, 100.0, 1.0, 0.05, 0.2, n, "call", 0)
+
+    @benchmark(f"pricers.asian_mc.{name}", sizes=[1_000, 10_000, 100_000])
+    def asian_mc(n, name=name):
+        func = backend(name, "asian_mc")
+        return lambda: func(100.0, 100.0, 1.0, 0.05, 0.2, n, 52, "call", 0)
@@ -0,0 +1,62 @@
+"""Simulation of the circuits in Quantum/ (skipped when cirq is missing)."""
+
+import os
+import sys
+
+from qf_utils.benchmarking import SkipBenchmark, benchmark
+
+QUANTUM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Quantum")
+
+
+def quantum(module):
+    try:
+        import cirq  # noqa: F401
+    except ImportError:
+        raise SkipBenchmark("cirq not installed")
+    if QUANTUM_DIR not in sys.path:
+        sys.path.insert(0, QUANTUM_DIR)
+    return __import__(module)
+
+
+@benchmark("quantum.qft_simulate", sizes=[8, 12, 16])
+def qft(n):
+    QFT = quantum("QFT")
+    qft = QFT.QFT(signal_length=2 ** n, basis_to_transform="1" * n)
+    qft.qft_circuit()
+    qft.circuit = qft.input_circuit + qft.circuit
+    return qft.simulate_circuit
+
+
+@benchmark("quantum.grover_run", sizes=[4, 6, 8])
+def grover(n):
+    import cirq
+    Grovers = quantum("Grovers")
+    circuit = Grovers.grover_circuit(n, format(3, f"0{n}b"))
+    simulator = cirq.Simulator()
+    return lambda: simulator.run(circuit, repetitions=100)
+
+
+@benchmark("quantum.simon_solve", sizes=[4, 8, 12])
+def simon(n):
+    Simons = quantum("Simons")
+    secret = format((1 << (n - 1)) | 1, f"0{n}b")
+    return lambda: Simons.simons_algorithm(n, secret=secret)
+
+
+@benchmark("quantum.qpe_run", sizes=[3, 5, 7])
+def qpe(n):
+    import cirq
+    QPE = quantum("QPE")
+    simulator = cirq.Simulator()
+    return lambda: QPE.quantum_phase_estimation(cirq.Z ** 0.3, "1", n).run(100, verbose=False, simulator=simulator)
+
+
+@benchmark("quantum.hhl_solve", sizes=[2, 4, 8])
+def hhl(n_assets):
+    import cirq
+    HHL = quantum("HHL")
+    A, b, _ = HHL.mean_variance_system(HHL.random_returns(n_assets))
+    solver = HHL.HHL(A, num_clock_qubits=5)
+    simulator = cirq.Simulator()
+    solver.build_core()
+    return lambda: solver.solve(b, simulator)
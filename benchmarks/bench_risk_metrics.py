@@ -0,0 +1,31 @@
+"""Every RiskMetrics method."""
+
+import numpy as np
+import pandas as pd
+
+from qf_utils.benchmarking import benchmark
+from qf_utils.risk_metrics import RiskMetrics
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def returns(n, seed=0):
+    return pd.Series(np.random.default_rng(seed).normal(0.0004, 0.01, n))
+
+
+def register(name, call):
+    @benchmark(f"risk_metrics.{name}", sizes=SIZES)
+    def setup(n):
+        r, m = returns(n), returns(n, seed=1)
+        return lambda: call(r, m)
+
+
+register("sharpe_ratio", lambda r, m: RiskMetrics.sharpe_ratio(r))
+register("sortino_ratio", lambda r, m: RiskMetrics.sortino_ratio(r))
+register("max_drawdown", lambda r, m: RiskMetrics.max_drawdown(r))
+register("calmar_ratio", lambda r, m: RiskMetrics.calmar_ratio(r))
+for method in ("historical", "parametric", "cornish-fisher"):
+    register(f"value_at_risk.{method}", lambda r, m, method=method: RiskMetrics.value_at_risk(r, 0.95, method))
+register("conditional_value_at_risk", lambda r, m: RiskMetrics.conditional_value_at_risk(r))
+register("volatility", lambda r, m: RiskMetrics.volatility(r))
+register("beta", lambda r, m: RiskMetrics.beta(r, m))
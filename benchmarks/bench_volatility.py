@@ -0,0 +1,43 @@
+"""Batched GARCH-family fits on the compiled and NumPy recursions.
+
+Sizes are assets, each with 2,500 daily observations. The warm refit adds
+one day and starts from the previous day's parameters.
+"""
+
+import importlib.util
+
+import numpy as np
+
+from qf_utils.benchmarking import SkipBenchmark, benchmark
+from qf_utils.volatility import MODELS
+
+N_OBS = 2_500
+TRUE_PARAMS = {"garch": [2e-6, 0.08, 0.90], "gjr": [2e-6, 0.03, 0.10, 0.88], "egarch": [-0.4, 0.15, -0.08, 0.96]}
+
+
+def panel(name, n_assets):
+    return MODELS[name]().simulate(TRUE_PARAMS[name], N_OBS + 1, n_paths=n_assets, random_state=0)
+
+
+for model_name in MODELS:
+    for backend in ("numpy", "numba"):
+
+        @benchmark(f"volatility.fit.{model_name}.{backend}", sizes=[10, 100, 1_000])
+        def fit(n, model_name=model_name, backend=backend):
+            if backend == "numba" and importlib.util.find_spec("numba") is None:
+                raise SkipBenchmark("numba not installed")
+            model = MODELS[model_name](backend=backend)
+            returns = panel(model_name, n)[:-1]
+            return lambda: model.fit(returns)
+
+    @benchmark(f"volatility.warm_refit.{model_name}", sizes=[100, 1_000])
+    def warm_refit(n, model_name=model_name):
+        returns = panel(model_name, n)
+        yesterday = MODELS[model_name]().fit(returns[:-1])
+        return lambda: yesterday.refit(returns)
+
+
+@benchmark("volatility.forecast.egarch", sizes=[1_000])
+def forecast(n):
+    fit = MODELS["egarch"]().fit(np.random.default_rng(0).normal(0.0, 0.01, (500, n)))
+    return lambda: fit.forecast(22)
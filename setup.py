@@ -69,6 +69,9 @@ setup(
             "backtrader>=1.9.78",
             "vectorbt>=0.25.0",
         ],
+        "jit": [
+            "numba>=0.57.0",
+        ],
     },
     entry_points={
         "console_scripts": [
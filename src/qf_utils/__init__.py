@@ -7,31 +7,129 @@ This package provides reusable utilities for quantitative finance applications.
 __version__ = "0.1.0"
 __author__ = "QF Learning Team"
 
-from .data_fetcher import DataFetcher
-from .risk_metrics import RiskMetrics
-from .performance import PerformanceAnalyzer
-from .backtester import Backtester
-from .exercise_validators import (
-    ValidationError,
-    validate_type,
-    validate_not_none,
-    validate_numeric_close,
-    validate_array_close,
-    validate_range,
-    validate_portfolio_weights,
-    validate_returns_series,
-    validate_correlation_matrix,
-    exercise_passed,
-    print_interpretation,
-    hide_traceback,
-    ExerciseValidator,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the submodule that defines them. Submodules are imported on
+# first attribute access (PEP 562), so ``from qf_utils import RiskMetrics``
+# does not pay for matplotlib, yfinance or the heavier scipy subpackages.
+_LAZY_IMPORTS = {
+    "DataFetcher": "data_fetcher",
+    "RiskMetrics": "risk_metrics",
+    "PerformanceAnalyzer": "performance",
+    "Backtester": "backtester",
+    "StreamingBacktester": "streaming",
+    "ExecutionEngine": "execution",
+    "PortfolioRiskEngine": "portfolio_risk",
+    "CarrMadanFFT": "fourier_pricing",
+    "HestonCalibrator": "fourier_pricing",
+    "heston_price": "fourier_pricing",
+    "VolatilitySurface": "vol_surface",
+    "implied_volatility": "vol_surface",
+    "CIR": "short_rate",
+    "HullWhite": "short_rate",
+    "Vasicek": "short_rate",
+    "GBM": "paths",
+    "Heston": "paths",
+    "MertonJumpDiffusion": "paths",
+    "OrnsteinUhlenbeck": "paths",
+    "monte_carlo_price": "paths",
+    "PricingEngine": "pricing",
+    "available_backends": "pricing",
+    "register_backend": "pricing",
+    "ValidationError": "exercise_validators",
+    "validate_type": "exercise_validators",
+    "validate_not_none": "exercise_validators",
+    "validate_numeric_close": "exercise_validators",
+    "validate_array_close": "exercise_validators",
+    "validate_range": "exercise_validators",
+    "validate_portfolio_weights": "exercise_validators",
+    "validate_returns_series": "exercise_validators",
+    "validate_correlation_matrix": "exercise_validators",
+    "exercise_passed": "exercise_validators",
+    "print_interpretation": "exercise_validators",
+    "hide_traceback": "exercise_validators",
+    "ExerciseValidator": "exercise_validators",
+}
+
+_SUBMODULES = frozenset(_LAZY_IMPORTS.values()) | {
+    "benchmarking",
+    "indicators",
+    "instrumentation",
+    "pairs",
+    "volatility",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBMODULES)
+
+
+if TYPE_CHECKING:
+    from .data_fetcher import DataFetcher
+    from .risk_metrics import RiskMetrics
+    from .performance import PerformanceAnalyzer
+    from .backtester import Backtester
+    from .streaming import StreamingBacktester
+    from .execution import ExecutionEngine
+    from .portfolio_risk import PortfolioRiskEngine
+    from .fourier_pricing import CarrMadanFFT, HestonCalibrator, heston_price
+    from .vol_surface import VolatilitySurface, implied_volatility
+    from .short_rate import CIR, HullWhite, Vasicek
+    from .paths import GBM, Heston, MertonJumpDiffusion, OrnsteinUhlenbeck, monte_carlo_price
+    from .pricing import PricingEngine, available_backends, register_backend
+    from .exercise_validators import (
+        ValidationError,
+        validate_type,
+        validate_not_none,
+        validate_numeric_close,
+        validate_array_close,
+        validate_range,
+        validate_portfolio_weights,
+        validate_returns_series,
+        validate_correlation_matrix,
+        exercise_passed,
+        print_interpretation,
+        hide_traceback,
+        ExerciseValidator,
+    )
 
 __all__ = [
     "DataFetcher",
     "RiskMetrics",
     "PerformanceAnalyzer",
     "Backtester",
+    "StreamingBacktester",
+    "ExecutionEngine",
+    "PortfolioRiskEngine",
+    "CarrMadanFFT",
+    "HestonCalibrator",
+    "heston_price",
+    "VolatilitySurface",
+    "implied_volatility",
+    "Vasicek",
+    "CIR",
+    "HullWhite",
+    "GBM",
+    "OrnsteinUhlenbeck",
+    "MertonJumpDiffusion",
+    "Heston",
+    "monte_carlo_price",
+    "PricingEngine",
+    "available_backends",
+    "register_backend",
     # Exercise validation
     "ValidationError",
     "validate_type",
@@ -6,6 +6,7 @@ from typing import Callable, Dict, Optional
 import numpy as np
 import pandas as pd
 
+from .instrumentation import instrumented, stage
 from .risk_metrics import RiskMetrics
 from .performance import PerformanceAnalyzer
 
@@ -40,6 +41,7 @@ class Backtester:
         self.cash = pd.Series(index=data.index, dtype=float).fillna(initial_capital)
         self.portfolio_value = pd.Series(index=data.index, dtype=float)
 
+    @instrumented("backtester.run")
     def run(self, signal_func: Callable) -> Dict:
         """
         Run backtest with given signal function.
@@ -58,47 +60,51 @@ class Backtester:
         logger.info("Starting backtest...")
 
         # Generate signals
-        signals = signal_func(self.data)
+        with stage("backtester.run.signals"):
+            signals = signal_func(self.data)
 
         # Initialize
         position = 0
         cash = self.initial_capital
         trades = []
 
-        for i, (date, signal) in enumerate(signals.items()):
-            price = self.data.loc[date, "Close"]
-
-            # Execute trades based on signal
-            if signal == 1 and position == 0:  # Buy
-                shares = int(cash / price * (1 - self.commission))
-                cost = shares * price * (1 + self.commission)
-                if cost <= cash:
-                    cash -= cost
-                    position = shares
-                    trades.append({"date": date, "action": "BUY", "shares": shares, "price": price})
-                    logger.debug(f"BUY {shares} @ {price:.2f}")
-
-            elif signal == -1 and position > 0:  # Sell
-                proceeds = position * price * (1 - self.commission)
-                cash += proceeds
-                trades.append({"date": date, "action": "SELL", "shares": position, "price": price})
-                logger.debug(f"SELL {position} @ {price:.2f}")
-                position = 0
-
-            # Track portfolio value
-            portfolio_value = cash + position * price
-            self.positions.loc[date] = position
-            self.cash.loc[date] = cash
-            self.portfolio_value.loc[date] = portfolio_value
+        with stage("backtester.run.execution"):
+            for i, (date, signal) in enumerate(signals.items()):
+                price = self.data.loc[date, "Close"]
+
+                # Execute trades based on signal
+                if signal == 1 and position == 0:  # Buy
+                    shares = int(cash / price * (1 - self.commission))
+                    cost = shares * price * (1 + self.commission)
+                    if cost <= cash:
+                        cash -= cost
+                        position = shares
+                        trades.append({"date": date, "action": "BUY", "shares": shares, "price": price})
+                        logger.debug(f"BUY {shares} @ {price:.2f}")
+
+                elif signal == -1 and position > 0:  # Sell
+                    proceeds = position * price * (1 - self.commission)
+                    cash += proceeds
+                    trades.append({"date": date, "action": "SELL", "shares": position, "price": price})
+                    logger.debug(f"SELL {position} @ {price:.2f}")
+                    position = 0
+
+                # Track portfolio value
+                portfolio_value = cash + position * price
+                self.positions.loc[date] = position
+                self.cash.loc[date] = cash
+                self.portfolio_value.loc[date] = portfolio_value
 
         logger.info(f"Backtest complete. Total trades: {len(trades)}")
 
         # Calculate returns
-        returns = self.portfolio_value.pct_change().dropna()
+        with stage("backtester.run.returns"):
+            returns = self.portfolio_value.pct_change().dropna()
 
         # Generate performance report
-        analyzer = PerformanceAnalyzer(returns)
-        metrics = analyzer.generate_report()
+        with stage("backtester.run.report"):
+            analyzer = PerformanceAnalyzer(returns)
+            metrics = analyzer.generate_report()
 
         return {
             "returns": returns,
@@ -114,6 +120,7 @@ class Backtester:
 def main():
     """Example backtest."""
     from .data_fetcher import DataFetcher
+    from .indicators import sma
 
     # Fetch data
     fetcher = DataFetcher()
@@ -124,8 +131,9 @@ def main():
         """Simple moving average crossover strategy."""
         signals = pd.Series(index=data.index, dtype=int).fillna(0)
         
-        short_ma = data["Close"].rolling(window=short_window).mean()
-        long_ma = data["Close"].rolling(window=long_window).mean()
+        # Memoized: repeated runs over the same data reuse the averages
+        short_ma = sma(data["Close"], short_window)
+        long_ma = sma(data["Close"], long_window)
 
         # Buy when short MA crosses above long MA
         signals[short_ma > long_ma] = 1
@@ -0,0 +1,307 @@
+"""Benchmark runner with JSON baselines and regression comparison."""
+
+import argparse
+import glob
+import importlib.util
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.2
+
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark setup when an optional dependency is missing."""
+
+
+@dataclass
+class Benchmark:
+    """
+    A named kernel timed at several input sizes.
+
+    Parameters
+    ----------
+    name : str
+        Identifier; results are keyed ``name[size]``
+    setup : callable
+        ``setup(size)`` prepares inputs and returns the zero-argument callable to time
+    sizes : sequence
+        Input sizes to run (the first one is used in quick mode)
+    """
+
+    name: str
+    setup: Callable[[Any], Callable[[], Any]]
+    sizes: Sequence[Any]
+
+
+_REGISTRY: List[Benchmark] = []
+
+
+def benchmark(name: Optional[str] = None, sizes: Sequence[Any] = (None,)) -> Callable:
+    """
+    Register a setup function as a benchmark.
+
+    Examples
+    --------
+    >>> @benchmark("risk.sharpe_ratio", sizes=[1_000, 100_000])
+    ... def sharpe(n):
+    ...     returns = pd.Series(np.random.normal(0, 0.01, n))
+    ...     return lambda: RiskMetrics.sharpe_ratio(returns)
+    """
+
+    def decorator(setup: Callable) -> Callable:
+        _REGISTRY.append(Benchmark(name or setup.__name__, setup, tuple(sizes)))
+        return setup
+
+    return decorator
+
+
+def load_benchmarks(path: str) -> List[Benchmark]:
+    """
+    Import every ``bench_*.py`` file under ``path`` and return what they registered.
+
+    Parameters
+    ----------
+    path : str
+        Directory of benchmark modules (or a single file)
+
+    Returns
+    -------
+    list of Benchmark
+    """
+    files = [path] if os.path.isfile(path) else sorted(glob.glob(os.path.join(path, "bench_*.py")))
+    start = len(_REGISTRY)
+    for file in files:
+        module_name = f"_qf_bench_{os.path.splitext(os.path.basename(file))[0]}"
+        spec = importlib.util.spec_from_file_location(module_name, file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return _REGISTRY[start:]
+
+
+def time_callable(func: Callable[[], Any], repeats: int = 5, min_time: float = 0.05) -> Dict[str, float]:
+    """
+    Time ``func`` like ``timeit``: enough loops per repeat to last ``min_time``.
+
+    Returns
+    -------
+    dict
+        Per-call 'min', 'median', 'mean' and 'stdev' in seconds, plus 'number' and 'repeats'
+    """
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    number = max(1, int(min_time / first)) if first > 0 else 1000
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeats": repeats,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def machine_info() -> Dict[str, Any]:
+    """Environment recorded next to every result set."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    pattern: Optional[str] = None,
+    quick: bool = False,
+    repeats: int = 5,
+    min_time: float = 0.05,
+) -> Dict[str, Any]:
+    """
+    Run benchmarks and collect a JSON-serializable result document.
+
+    Parameters
+    ----------
+    benchmarks : iterable of Benchmark
+        Benchmarks to run
+    pattern : str, optional
+        Only run benchmarks whose name contains this substring
+    quick : bool, default=False
+        Only run the first (smallest) size of each benchmark
+    repeats, min_time
+        See ``time_callable``
+
+    Returns
+    -------
+    dict
+        ``{'machine': ..., 'results': {'name[size]': timings}, 'skipped': {...}}``
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    skipped: Dict[str, str] = {}
+    for bench in benchmarks:
+        if pattern and pattern not in bench.name:
+            continue
+        for size in bench.sizes[:1] if quick else bench.sizes:
+            key = bench.name if size is None else f"{bench.name}[{size}]"
+            try:
+                func = bench.setup(size)
+            except SkipBenchmark as exc:
+                skipped[key] = str(exc)
+                logger.info(f"Skipped {key}: {exc}")
+                continue
+            results[key] = time_callable(func, repeats, min_time)
+            logger.info(f"{key}: {results[key]['median']:.3e} s")
+    return {"machine": machine_info(), "results": results, "skipped": skipped}
+
+
+def save_results(document: Dict[str, Any], path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    statistic: str = "median",
+) -> List[Dict[str, Any]]:
+    """
+    Compare two result documents benchmark by benchmark.
+
+    Parameters
+    ----------
+    baseline, current : dict
+        Documents from ``run_benchmarks`` / ``load_results``
+    threshold : float, default=0.2
+        Relative slowdown counted as a regression (0.2 = 20% slower)
+    statistic : str, default='median'
+        Timing statistic to compare
+
+    Returns
+    -------
+    list of dict
+        One row per benchmark with 'name', 'baseline', 'current', 'ratio' and
+        'status' in {'regression', 'improvement', 'unchanged', 'new', 'missing'}
+    """
+    if threshold <= 0:
+        raise ValueError("threshold must be positive")
+    base, cur = baseline["results"], current["results"]
+    rows = []
+    for name in sorted(set(base) | set(cur)):
+        old = base.get(name, {}).get(statistic)
+        new = cur.get(name, {}).get(statistic)
+        if old is None or new is None:
+            rows.append({"name": name, "baseline": old, "current": new, "ratio": None,
+                         "status": "new" if old is None else "missing"})
+            continue
+        ratio = new / old if old > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append({"name": name, "baseline": old, "current": new, "ratio": ratio, "status": status})
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    width = max([len(r["name"]) for r in rows] + [9])
+    lines = [f"{'benchmark':<{width}} {'baseline':>11} {'current':>11} {'ratio':>7}  status"]
+    for r in rows:
+        old = f"{r['baseline']:.3e}" if r["baseline"] is not None else "-"
+        new = f"{r['current']:.3e}" if r["current"] is not None else "-"
+        ratio = f"{r['ratio']:.2f}x" if r["ratio"] is not None else "-"
+        lines.append(f"{r['name']:<{width}} {old:>11} {new:>11} {ratio:>7}  {r['status']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    ``python -m qf_utils.benchmarking run benchmarks --output results.json``
+    ``python -m qf_utils.benchmarking compare baseline.json results.json --threshold 0.2``
+
+    ``compare`` exits with status 1 when any benchmark regressed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m qf_utils.benchmarking")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run benchmarks and write a JSON result file")
+    run.add_argument("path", nargs="?", default="benchmarks", help="directory of bench_*.py files")
+    run.add_argument("--output", "-o", default=None, help="result file (default: print summary only)")
+    run.add_argument("--filter", "-k", default=None, help="substring of benchmark names to run")
+    run.add_argument("--quick", action="store_true", help="smallest size only")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.05)
+
+    cmp = sub.add_parser("compare", help="flag regressions between two result files")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    cmp.add_argument("--statistic", default="median", choices=["min", "median", "mean"])
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        document = run_benchmarks(load_benchmarks(args.path), args.filter, args.quick, args.repeats, args.min_time)
+        for name, timing in document["results"].items():
+            print(f"{name:<50} {timing['median']:.3e} s")
+        for name, reason in document["skipped"].items():
+            print(f"{name:<50} skipped ({reason})")
+        if args.output:
+            save_results(document, args.output)
+            print(f"\nSaved {len(document['results'])} results to {args.output}")
+        return 0
+
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold, args.statistic)
+    print(format_comparison(rows))
+    regressions = [r for r in rows if r["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Run the importable module so benchmark files share its registry and SkipBenchmark
+    from qf_utils.benchmarking import main as _main
+
+    sys.exit(_main())
@@ -6,7 +6,8 @@ from typing import List, Optional, Union
 import numpy as np
 
 import pandas as pd
-import yfinance as yf
+
+from .instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class DataFetcher:
         self.cache_dir = cache_dir
         logger.info("DataFetcher initialized")
 
+    @instrumented("data_fetcher.fetch_stock_data")
     def fetch_stock_data(
         self,
         tickers: Union[str, List[str]],
@@ -58,6 +60,9 @@ class DataFetcher:
         >>> data = fetcher.fetch_stock_data('AAPL', period='1mo')
         >>> data.head()
         """
+        # yfinance pulls in its network stack, so it is only imported when fetching
+        import yfinance as yf
+
         try:
             if isinstance(tickers, str):
                 tickers = [tickers]
@@ -125,6 +130,7 @@ class DataFetcher:
 
         return returns.dropna()
 
+    @instrumented("data_fetcher.get_multiple_assets")
     def get_multiple_assets(
         self, tickers: List[str], start_date: str, end_date: str
     ) -> pd.DataFrame:
@@ -0,0 +1,901 @@
+"""
+Event-driven order execution against OHLCV bars.
+
+``ExecutionEngine`` replays one or more bar series and any number of order
+streams through a single event queue. Three kinds of events go through the
+queue:
+
+- bar arrivals
+- order submissions
+- cancellations
+
+At equal timestamps they are processed in that order. A bar's timestamp is
+its close, so an order stamped with a bar's time is first matched against
+the next bar. Events known before the run are sorted once. Events
+scheduled during the run go into a binary heap, and the queue pops
+whichever comes first of the sorted events and the heap.
+
+Market, limit, stop and stop-limit orders are matched against each bar's
+open, high and low. A participation cap on bar volume splits large orders
+into partial fills, and working orders on an instrument share that volume
+in submission order. Orders can carry attached child orders, which are
+submitted once the parent is completely filled, and one-cancels-other
+groups.
+
+Orders and fills are kept as parallel NumPy arrays. The event loop is plain
+Python over those arrays. When numba is installed it is compiled with Numba
+and processes several million events per second on one core. Fills
+do not depend on cash, so slippage and commission models are applied to
+the fill arrays in one vectorized pass once the loop has finished; any
+object with the model's ``apply`` method can be plugged in.
+"""
+
+import importlib.util
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import instrumented, stage
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("auto", "numba", "python")
+
+# Order types
+MARKET, LIMIT, STOP, STOP_LIMIT = 0, 1, 2, 3
+ORDER_TYPES = {"market": MARKET, "limit": LIMIT, "stop": STOP, "stop_limit": STOP_LIMIT}
+
+# Order status
+PENDING, WORKING, FILLED, CANCELLED = 0, 1, 2, 3
+STATUS_NAMES = np.array(["pending", "working", "filled", "cancelled"])
+
+# Event kinds, in processing order at equal timestamps. The queue key is
+# (time, kind << _KIND_SHIFT | event id), so ties keep submission order.
+BAR, SUBMIT, CANCEL = 0, 1, 2
+_KIND_SHIFT = 40
+
+_NO_TIME = np.iinfo(np.int64).max
+
+
+class SlippageModel:
+    """
+    Base class for slippage models.
+
+    ``apply`` maps reference prices (the bar price at which an order would
+    trade without costs) to execution prices for an array of fills.
+    Buys should pay more and sells receive less. Limit orders are capped at
+    their limit price afterwards.
+    """
+
+    def apply(self, side: np.ndarray, price: np.ndarray, quantity: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        """
+        Execution prices for a batch of fills.
+
+        Parameters
+        ----------
+        side : np.ndarray
+            1 for buys, -1 for sells
+        price : np.ndarray
+            Reference prices
+        quantity : np.ndarray
+            Unsigned fill quantities
+        volume : np.ndarray
+            Volume of the bar each fill traded in
+
+        Returns
+        -------
+        np.ndarray
+            Execution prices
+        """
+        raise NotImplementedError
+
+
+class NoSlippage(SlippageModel):
+    """Fill at the reference price."""
+
+    def apply(self, side, price, quantity, volume):
+        return np.asarray(price, dtype=float)
+
+    def __repr__(self):
+        return "NoSlippage()"
+
+
+class FixedSlippage(SlippageModel):
+    """
+    Constant adverse price move in basis points.
+
+    Parameters
+    ----------
+    bps : float, default=1.0
+        Slippage per fill, in basis points of the reference price
+    """
+
+    def __init__(self, bps: float = 1.0):
+        if bps < 0:
+            raise ValueError("bps must be non-negative")
+        self.bps = bps
+
+    def apply(self, side, price, quantity, volume):
+        return price * (1 + side * self.bps * 1e-4)
+
+    def __repr__(self):
+        return f"FixedSlippage(bps={self.bps})"
+
+
+class VolumeImpactSlippage(SlippageModel):
+    """
+    Market impact growing with the fill's share of bar volume.
+
+    The price moves by ``coefficient * (quantity / volume) ** exponent`` in
+    relative terms; the default exponent gives the square-root law.
+
+    Parameters
+    ----------
+    coefficient : float, default=0.1
+        Relative impact of trading a whole bar's volume
+    exponent : float, default=0.5
+        Power of the participation rate
+    """
+
+    def __init__(self, coefficient: float = 0.1, exponent: float = 0.5):
+        if coefficient < 0 or exponent <= 0:
+            raise ValueError("coefficient must be non-negative and exponent positive")
+        self.coefficient = coefficient
+        self.exponent = exponent
+
+    def apply(self, side, price, quantity, volume):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            share = np.where(volume > 0, quantity / volume, 0.0)
+        return price * (1 + side * self.coefficient * share**self.exponent)
+
+    def __repr__(self):
+        return f"VolumeImpactSlippage(coefficient={self.coefficient}, exponent={self.exponent})"
+
+
+class CommissionModel:
+    """
+    Base class for commission models.
+
+    ``apply`` returns the commission charged on each fill.
+    """
+
+    def apply(self, quantity: np.ndarray, price: np.ndarray) -> np.ndarray:
+        """
+        Commission per fill.
+
+        Parameters
+        ----------
+        quantity : np.ndarray
+            Unsigned fill quantities
+        price : np.ndarray
+            Execution prices
+
+        Returns
+        -------
+        np.ndarray
+            Commission charged on each fill
+        """
+        raise NotImplementedError
+
+
+class PercentCommission(CommissionModel):
+    """
+    Commission proportional to traded value, as in ``Backtester``.
+
+    Parameters
+    ----------
+    rate : float, default=0.001
+        Commission rate (0.001 = 0.1%)
+    """
+
+    def __init__(self, rate: float = 0.001):
+        if rate < 0:
+            raise ValueError("rate must be non-negative")
+        self.rate = rate
+
+    def apply(self, quantity, price):
+        return self.rate * quantity * price
+
+    def __repr__(self):
+        return f"PercentCommission(rate={self.rate})"
+
+
+class PerShareCommission(CommissionModel):
+    """
+    Commission per share with a minimum per fill.
+
+    Parameters
+    ----------
+    per_share : float, default=0.005
+        Commission per unit traded
+    minimum : float, default=1.0
+        Minimum commission per fill
+    """
+
+    def __init__(self, per_share: float = 0.005, minimum: float = 1.0):
+        if per_share < 0 or minimum < 0:
+            raise ValueError("per_share and minimum must be non-negative")
+        self.per_share = per_share
+        self.minimum = minimum
+
+    def apply(self, quantity, price):
+        return np.maximum(self.per_share * quantity, self.minimum)
+
+    def __repr__(self):
+        return f"PerShareCommission(per_share={self.per_share}, minimum={self.minimum})"
+
+
+def _event_loop(ev_time, ev_rank, ev_ref, n_events,
+                bar_time, bar_inst, bar_open, bar_high, bar_low, bar_volume,
+                order_inst, order_qty, order_type, order_limit, order_stop, order_oco,
+                child_ptr, child_idx, oco_ptr, oco_idx,
+                n_instruments, participation, lot_size):
+    """
+    Run the event queue to exhaustion.
+
+    The first ``n_events`` entries of the event arrays are the events known
+    before the run (bars, submissions, cancellations), sorted by (time,
+    rank). Child submissions are scheduled during the run into the spare
+    capacity behind them and ordered by a binary heap. Each step pops
+    whichever of the sorted cursor and the heap root comes first, so the
+    heap stays as small as the number of pending child submissions.
+    Working orders are kept in one singly linked list per instrument.
+    Cancelled and filled orders are unlinked lazily, the next time their
+    instrument's list is scanned.
+
+    Kept free of helper calls and Python objects so that
+    ``qf_utils.numba_execution`` can compile it unchanged.
+
+    Returns
+    -------
+    tuple
+        Order status, filled quantity, the fill arrays (order, bar,
+        unsigned quantity, reference price) and the number of events
+        processed
+    """
+    n_orders = len(order_qty)
+    status = np.zeros(n_orders, np.int8)
+    filled = np.zeros(n_orders)
+    triggered = np.zeros(n_orders, np.bool_)
+    nxt = np.full(n_orders, -1, np.int64)
+    head = np.full(n_instruments, -1, np.int64)
+    tail = np.full(n_instruments, -1, np.int64)
+
+    capacity = max(16, n_orders)
+    fill_order = np.empty(capacity, np.int64)
+    fill_bar = np.empty(capacity, np.int64)
+    fill_qty = np.empty(capacity)
+    fill_ref = np.empty(capacity)
+    n_fills = 0
+
+    heap = np.empty(len(ev_time) - n_events, np.int64)
+    size = 0
+    cursor = 0
+    next_id = n_events
+    processed = 0
+
+    while cursor < n_events or size > 0:
+        if size > 0 and (cursor == n_events or ev_time[heap[0]] < ev_time[cursor] or (
+                ev_time[heap[0]] == ev_time[cursor] and ev_rank[heap[0]] < ev_rank[cursor])):
+            event = heap[0]
+            size -= 1
+            if size > 0:
+                # Sift the last entry down from the root
+                last = heap[size]
+                t, r = ev_time[last], ev_rank[last]
+                pos = 0
+                while True:
+                    child = 2 * pos + 1
+                    if child >= size:
+                        break
+                    right = child + 1
+                    if right < size:
+                        a, b = heap[child], heap[right]
+                        if ev_time[b] < ev_time[a] or (ev_time[b] == ev_time[a] and ev_rank[b] < ev_rank[a]):
+                            child = right
+                    c = heap[child]
+                    if ev_time[c] < t or (ev_time[c] == t and ev_rank[c] < r):
+                        heap[pos] = c
+                        pos = child
+                    else:
+                        break
+                heap[pos] = last
+        else:
+            event = cursor
+            cursor += 1
+        processed += 1
+        kind = ev_rank[event] >> _KIND_SHIFT
+        ref = ev_ref[event]
+
+        if kind == SUBMIT:
+            if status[ref] == PENDING:
+                status[ref] = WORKING
+                k = order_inst[ref]
+                if tail[k] == -1:
+                    head[k] = ref
+                else:
+                    nxt[tail[k]] = ref
+                tail[k] = ref
+            continue
+
+        if kind == CANCEL:
+            if status[ref] == PENDING or status[ref] == WORKING:
+                status[ref] = CANCELLED
+            continue
+
+        # Bar: match the instrument's working orders in submission order
+        k = bar_inst[ref]
+        o, h, lo = bar_open[ref], bar_high[ref], bar_low[ref]
+        room = math.inf if participation == math.inf else participation * bar_volume[ref]
+        previous = -1
+        i = head[k]
+        while i != -1:
+            following = nxt[i]
+            if status[i] == WORKING:
+                qty = order_qty[i]
+                buy = qty > 0
+                typ = order_type[i]
+                price = math.nan
+                if typ == MARKET:
+                    price = o
+                else:
+                    limit_from_open = typ == LIMIT or (typ == STOP_LIMIT and triggered[i])
+                    if not limit_from_open:
+                        if triggered[i]:
+                            entry = o
+                        else:
+                            stop = order_stop[i]
+                            if buy and h >= stop:
+                                triggered[i] = True
+                                entry = max(o, stop)
+                            elif not buy and lo <= stop:
+                                triggered[i] = True
+                                entry = min(o, stop)
+                            else:
+                                entry = math.nan
+                        if typ == STOP:
+                            price = entry
+                        else:
+                            # On its trigger bar a stop-limit fills only if the entry is inside the limit
+                            limit = order_limit[i]
+                            if (buy and entry <= limit) or (not buy and entry >= limit):
+                                price = entry
+                    else:
+                        limit = order_limit[i]
+                        if buy:
+                            if o <= limit:
+                                price = o
+                            elif lo <= limit:
+                                price = limit
+                        else:
+                            if o >= limit:
+                                price = o
+                            elif h >= limit:
+                                price = limit
+
+                if price == price and room > 0:
+                    want = abs(qty) - filled[i]
+                    cap = room if lot_size <= 0 or room == math.inf else math.floor(room / lot_size) * lot_size
+                    q = min(want, cap)
+                    if q > 0:
+                        if n_fills == capacity:
+                            capacity *= 2
+                            grown = np.empty(capacity, np.int64)
+                            grown[:n_fills] = fill_order[:n_fills]
+                            fill_order = grown
+                            grown = np.empty(capacity, np.int64)
+                            grown[:n_fills] = fill_bar[:n_fills]
+                            fill_bar = grown
+                            grown_f = np.empty(capacity)
+                            grown_f[:n_fills] = fill_qty[:n_fills]
+                            fill_qty = grown_f
+                            grown_f = np.empty(capacity)
+                            grown_f[:n_fills] = fill_ref[:n_fills]
+                            fill_ref = grown_f
+                        fill_order[n_fills] = i
+                        fill_bar[n_fills] = ref
+                        fill_qty[n_fills] = q
+                        fill_ref[n_fills] = price
+                        n_fills += 1
+                        room -= q
+
+                        group = order_oco[i]
+                        if group >= 0 and filled[i] == 0:
+                            for j in oco_idx[oco_ptr[group]:oco_ptr[group + 1]]:
+                                if j != i and (status[j] == PENDING or status[j] == WORKING):
+                                    status[j] = CANCELLED
+                        if q == want:
+                            filled[i] = abs(qty)
+                            status[i] = FILLED
+                            for c in child_idx[child_ptr[i]:child_ptr[i + 1]]:
+                                # Push the child's submission and sift it up
+                                ev_time[next_id] = bar_time[ref]
+                                ev_rank[next_id] = (SUBMIT << _KIND_SHIFT) | next_id
+                                ev_ref[next_id] = c
+                                t, r = ev_time[next_id], ev_rank[next_id]
+                                pos = size
+                                while pos > 0:
+                                    parent = (pos - 1) >> 1
+                                    p = heap[parent]
+                                    if ev_time[p] < t or (ev_time[p] == t and ev_rank[p] <= r):
+                                        break
+                                    heap[pos] = p
+                                    pos = parent
+                                heap[pos] = next_id
+                                size += 1
+                                next_id += 1
+                        else:
+                            filled[i] += q
+
+            if status[i] != WORKING:
+                if previous == -1:
+                    head[k] = following
+                else:
+                    nxt[previous] = following
+                if tail[k] == i:
+                    tail[k] = previous
+            else:
+                previous = i
+            i = following
+
+    return (status, filled, fill_order[:n_fills], fill_bar[:n_fills], fill_qty[:n_fills],
+            fill_ref[:n_fills], processed)
+
+
+def _nanoseconds(values) -> np.ndarray:
+    """Datetime-like values as int64 nanoseconds since the epoch (UTC for tz-aware values)."""
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+@dataclass
+class ExecutionResult:
+    """
+    Orders, fills and timing of one ``ExecutionEngine.run``.
+
+    Attributes
+    ----------
+    orders : pd.DataFrame
+        One row per order with its stream, position in the stream
+        (``order``), submission time, instrument, type, signed quantity,
+        limit and stop prices, signed filled quantity, average execution
+        price, total commission and final status ('pending' for child
+        orders whose parent never completed, 'working', 'filled' or
+        'cancelled')
+    fills : pd.DataFrame
+        One row per fill with its bar time, stream, order, instrument,
+        signed quantity, reference price, execution price and commission
+    closes : pd.DataFrame
+        Close prices, bar times x instruments, used to mark positions
+    initial_capital : float
+        Starting cash of every stream
+    events : int
+        Events processed by the queue
+    elapsed : float
+        Seconds spent in the event loop
+    """
+
+    orders: pd.DataFrame
+    fills: pd.DataFrame
+    closes: pd.DataFrame
+    initial_capital: float
+    events: int
+    elapsed: float
+
+    @property
+    def events_per_second(self) -> float:
+        """Throughput of the event loop."""
+        return self.events / self.elapsed if self.elapsed > 0 else math.inf
+
+    def _cumulative(self, values: pd.Series, columns) -> pd.DataFrame:
+        fills = self.fills.assign(value=values)
+        table = fills.pivot_table(index="time", columns=columns, values="value", aggfunc="sum")
+        return table.reindex(self.closes.index, fill_value=0.0).fillna(0.0).cumsum()
+
+    def positions(self) -> pd.DataFrame:
+        """Holdings after each bar, bar times x (stream, instrument)."""
+        streams = self.orders["stream"].unique()
+        columns = pd.MultiIndex.from_product([streams, self.closes.columns], names=["stream", "instrument"])
+        if self.fills.empty:
+            return pd.DataFrame(0.0, index=self.closes.index, columns=columns)
+        held = self._cumulative(self.fills["quantity"], ["stream", "instrument"])
+        return held.reindex(columns=columns, fill_value=0.0)
+
+    def equity(self) -> pd.DataFrame:
+        """
+        Marked-to-market value of each stream after each bar.
+
+        Returns
+        -------
+        pd.DataFrame
+            Bar times x streams: cash after fills and commissions plus
+            holdings at the latest close of each instrument
+        """
+        streams = pd.Index(self.orders["stream"].unique(), name="stream")
+        cash = pd.DataFrame(self.initial_capital, index=self.closes.index, columns=streams)
+        if not self.fills.empty:
+            flows = -(self.fills["quantity"] * self.fills["price"]) - self.fills["commission"]
+            cash += self._cumulative(flows, "stream").reindex(columns=streams, fill_value=0.0)
+        marks = self.closes.ffill().fillna(0.0)
+        held = self.positions()
+        value = held * marks.reindex(columns=held.columns, level="instrument")
+        return cash + value.T.groupby(level="stream", sort=False).sum().T.reindex(columns=streams)
+
+
+class ExecutionEngine:
+    """
+    Event-driven execution of order streams against OHLCV bars.
+
+    Matching rules on each bar, for buys (sells mirror them):
+
+    - market: fills at the open
+    - limit L: fills at the open if it is at or below L, else at L if the low reaches it
+    - stop S: triggers when the high reaches S and fills at max(open, S);
+      if liquidity runs out it keeps filling at later opens
+    - stop-limit S, L: triggers like a stop and fills at max(open, S) when
+      that is within L; otherwise it works as a limit order from the next bar
+
+    Each bar scans the working orders of its instrument, so the cost per
+    bar grows with the number of resting orders; orders that should not
+    rest indefinitely need a ``cancel_time``.
+
+    Unlike ``Backtester``, orders carry explicit quantities and are not
+    checked against cash; each stream's cash and equity are derived from
+    its fills.
+    """
+
+    def __init__(
+        self,
+        bars: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+        slippage: Optional[SlippageModel] = None,
+        commission: Optional[CommissionModel] = None,
+        max_participation: Optional[float] = None,
+        lot_size: float = 1.0,
+        initial_capital: float = 100000.0,
+        backend: str = "auto",
+    ):
+        """
+        Initialize ExecutionEngine.
+
+        Parameters
+        ----------
+        bars : pd.DataFrame or dict of str to pd.DataFrame
+            Bars with columns Open, High, Low, Close and optionally Volume,
+            indexed by increasing bar-close time (datetimes or integers);
+            a dict holds one frame per instrument
+        slippage : SlippageModel, optional
+            Defaults to NoSlippage()
+        commission : CommissionModel, optional
+            Defaults to PercentCommission(0.001)
+        max_participation : float, optional
+            Largest fraction of a bar's volume that orders on the
+            instrument may take together; larger orders fill partially
+            over several bars. None means no volume limit
+        lot_size : float, default=1.0
+            Fill quantities are rounded down to multiples of this; 0 allows
+            any quantity
+        initial_capital : float, default=100000.0
+            Starting cash of each stream
+        backend : str, default='auto'
+            'numba', 'python', or 'auto' to use numba when it is installed
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}")
+        if backend == "numba" and importlib.util.find_spec("numba") is None:
+            raise ImportError("backend='numba' requires numba (pip install qf_utils[jit])")
+        if max_participation is not None and max_participation <= 0:
+            raise ValueError("max_participation must be positive")
+        if lot_size < 0:
+            raise ValueError("lot_size must be non-negative")
+
+        frames = bars if isinstance(bars, dict) else {"asset": bars}
+        if not frames:
+            raise ValueError("bars must contain at least one instrument")
+        for name, frame in frames.items():
+            missing = {"Open", "High", "Low", "Close"} - set(frame.columns)
+            if missing:
+                raise ValueError(f"bars for {name!r} are missing columns {sorted(missing)}")
+            if not frame.index.is_monotonic_increasing:
+                raise ValueError(f"bars for {name!r} must be sorted by time")
+        kinds = {isinstance(frame.index, pd.DatetimeIndex) for frame in frames.values()}
+        if len(kinds) > 1:
+            raise ValueError("bars must all be indexed by datetimes or all by integers")
+
+        self.bars = frames
+        self.instruments = list(frames)
+        self.slippage = slippage if slippage is not None else NoSlippage()
+        self.commission = commission if commission is not None else PercentCommission(0.001)
+        self.max_participation = max_participation
+        self.lot_size = lot_size
+        self.initial_capital = initial_capital
+        self.backend = backend
+        self._datetime = kinds.pop()
+        self.streams: Dict[str, pd.DataFrame] = {}
+
+    def _times(self, values) -> np.ndarray:
+        if self._datetime:
+            return _nanoseconds(values)
+        return np.asarray(values, dtype=np.int64)
+
+    def _optional_times(self, values: pd.Series) -> np.ndarray:
+        """Times with missing values mapped past every event."""
+        present = values.notna().to_numpy()
+        times = np.full(len(values), _NO_TIME, np.int64)
+        if present.any():
+            times[present] = self._times(values[present])
+        return times
+
+    def add_stream(self, name: str, orders: pd.DataFrame) -> "ExecutionEngine":
+        """
+        Register an order stream, e.g. one strategy's orders.
+
+        Parameters
+        ----------
+        name : str
+            Stream name, unique within the engine
+        orders : pd.DataFrame
+            One row per order, indexed by submission time, with columns:
+
+            - quantity: signed, positive to buy
+            - type: 'market' (default), 'limit', 'stop' or 'stop_limit'
+            - limit_price, stop_price: required by the types that use them
+            - instrument: required when there are several instruments
+            - cancel_time: optional; the order is cancelled at this time
+            - parent: optional row position of a parent order in the same
+              frame; the order is submitted when the parent is completely
+              filled, at the time of that fill
+            - oco: optional group label; the first fill of any order in a
+              group cancels the group's other orders
+
+        Returns
+        -------
+        ExecutionEngine
+            The engine, for chaining
+        """
+        if name in self.streams:
+            raise ValueError(f"stream {name!r} already added")
+        if "quantity" not in orders.columns:
+            raise ValueError("orders need a quantity column")
+        quantity = orders["quantity"].to_numpy(dtype=float)
+        if not np.isfinite(quantity).all() or (quantity == 0).any():
+            raise ValueError("order quantities must be finite and non-zero")
+
+        types = orders["type"] if "type" in orders.columns else pd.Series("market", index=orders.index)
+        unknown = set(types.unique()) - set(ORDER_TYPES)
+        if unknown:
+            raise ValueError(f"unknown order types {sorted(unknown)}; use one of {list(ORDER_TYPES)}")
+        for column, needs in (("limit_price", ("limit", "stop_limit")), ("stop_price", ("stop", "stop_limit"))):
+            used = types.isin(needs).to_numpy()
+            prices = orders[column].to_numpy(dtype=float) if column in orders.columns else np.full(len(orders), np.nan)
+            if np.isnan(prices[used]).any():
+                raise ValueError(f"{'/'.join(needs)} orders need a {column}")
+
+        if "instrument" in orders.columns:
+            unknown = set(orders["instrument"].unique()) - set(self.instruments)
+            if unknown:
+                raise ValueError(f"orders reference unknown instruments {sorted(unknown)}")
+        elif len(self.instruments) > 1:
+            raise ValueError("orders need an instrument column when there are several instruments")
+
+        if "parent" in orders.columns:
+            parent = orders["parent"].fillna(-1).to_numpy(dtype=np.int64)
+            if ((parent < -1) | (parent >= len(orders)) | (parent == np.arange(len(orders)))).any():
+                raise ValueError("parent must be the row position of another order in the same frame")
+        self._times(orders.index)
+        self.streams[name] = orders
+        return self
+
+    def _order_arrays(self) -> Dict[str, np.ndarray]:
+        """Concatenate all streams into the engine's parallel order arrays."""
+        parts = []
+        for name, orders in self.streams.items():
+            n = len(orders)
+            columns = orders.columns
+            part = pd.DataFrame({
+                "stream": name,
+                "order": np.arange(n),
+                "time": orders.index,
+                "instrument": orders["instrument"].to_numpy() if "instrument" in columns else self.instruments[0],
+                "type": orders["type"].to_numpy() if "type" in columns else "market",
+                "quantity": orders["quantity"].to_numpy(dtype=float),
+                "limit_price": orders["limit_price"].to_numpy(dtype=float) if "limit_price" in columns else np.nan,
+                "stop_price": orders["stop_price"].to_numpy(dtype=float) if "stop_price" in columns else np.nan,
+            })
+            part["_submit"] = self._times(orders.index)
+            part["_cancel"] = self._optional_times(orders["cancel_time"]) if "cancel_time" in columns else _NO_TIME
+            part["_parent"] = orders["parent"].fillna(-1).to_numpy(dtype=np.int64) if "parent" in columns else -1
+            part["_oco"] = orders["oco"].to_numpy() if "oco" in columns else None
+            parts.append(part)
+        table = pd.concat(parts, ignore_index=True)
+
+        # Parents are row positions within their stream; make them global
+        start = np.repeat(np.cumsum([0] + [len(o) for o in self.streams.values()])[:-1],
+                          [len(o) for o in self.streams.values()])
+        parent = table["_parent"].to_numpy(dtype=np.int64)
+        parent = np.where(parent >= 0, parent + start, -1)
+
+        oco_label = table["_oco"]
+        has_oco = oco_label.notna().to_numpy()
+        oco = np.full(len(table), -1, np.int64)
+        if has_oco.any():
+            keys = pd.MultiIndex.from_arrays([table["stream"][has_oco], oco_label[has_oco]])
+            oco[has_oco] = pd.factorize(keys)[0]
+
+        return {
+            "table": table,
+            "inst": pd.Index(self.instruments).get_indexer(table["instrument"]).astype(np.int64),
+            "qty": table["quantity"].to_numpy(dtype=float),
+            "type": table["type"].map(ORDER_TYPES).to_numpy(dtype=np.int64),
+            "limit": table["limit_price"].to_numpy(dtype=float),
+            "stop": table["stop_price"].to_numpy(dtype=float),
+            "submit": table["_submit"].to_numpy(dtype=np.int64),
+            "cancel": table["_cancel"].to_numpy(dtype=np.int64),
+            "parent": parent,
+            "oco": oco,
+        }
+
+    @staticmethod
+    def _csr(groups: np.ndarray, n_groups: int):
+        """Members of each group as (pointer, index) arrays."""
+        members = np.flatnonzero(groups >= 0)
+        members = members[np.argsort(groups[members], kind="stable")]
+        counts = np.bincount(groups[groups >= 0], minlength=n_groups)
+        return np.concatenate([[0], np.cumsum(counts)]).astype(np.int64), members.astype(np.int64)
+
+    def _loop(self):
+        if self.backend == "python" or (self.backend == "auto" and importlib.util.find_spec("numba") is None):
+            return _event_loop
+        from .numba_execution import event_loop
+
+        return event_loop
+
+    @instrumented("execution_engine.run")
+    def run(self) -> ExecutionResult:
+        """
+        Process every bar and order event.
+
+        Returns
+        -------
+        ExecutionResult
+            Orders with their final state, fills with costs applied, and
+            the event count and loop time
+        """
+        if not self.streams:
+            raise ValueError("add at least one order stream before running")
+
+        with stage("execution_engine.run.prepare"):
+            frames = list(self.bars.values())
+            bar_time = np.concatenate([self._times(f.index) for f in frames])
+            bar_inst = np.repeat(np.arange(len(frames), dtype=np.int64), [len(f) for f in frames])
+
+            def column(name, default=np.nan):
+                return np.concatenate([f[name].to_numpy(dtype=float) if name in f.columns
+                                       else np.full(len(f), default) for f in frames])
+
+            bar_open, bar_high, bar_low = column("Open"), column("High"), column("Low")
+            bar_volume = column("Volume", np.inf)
+
+            orders = self._order_arrays()
+            n_orders = len(orders["qty"])
+            ids = np.arange(n_orders, dtype=np.int64)
+            roots = orders["parent"] < 0
+            cancels = orders["cancel"] != _NO_TIME
+            when = np.concatenate([bar_time, orders["submit"][roots], orders["cancel"][cancels]])
+            kind = np.concatenate([np.full(len(bar_time), BAR), np.full(roots.sum(), SUBMIT),
+                                   np.full(cancels.sum(), CANCEL)]).astype(np.int64)
+            ref = np.concatenate([np.arange(len(bar_time), dtype=np.int64), ids[roots], ids[cancels]])
+            rank = (kind << _KIND_SHIFT) | np.arange(len(kind), dtype=np.int64)
+            order = np.lexsort((rank, when))
+            n_events = len(order)
+            n_children = int((~roots).sum())
+            # Spare capacity behind the sorted events for child submissions
+            ev_time = np.concatenate([when[order], np.zeros(n_children, np.int64)])
+            ev_rank = np.concatenate([rank[order], np.zeros(n_children, np.int64)])
+            ev_ref = np.concatenate([ref[order], np.zeros(n_children, np.int64)])
+
+            child_ptr, child_idx = self._csr(orders["parent"], n_orders)
+            n_groups = int(orders["oco"].max()) + 1 if n_orders else 0
+            oco_ptr, oco_idx = self._csr(orders["oco"], n_groups)
+            participation = math.inf if self.max_participation is None else float(self.max_participation)
+
+        loop = self._loop()
+        began = time.perf_counter()
+        with stage("execution_engine.run.events"):
+            status, filled, fill_order, fill_bar, fill_qty, fill_ref, processed = loop(
+                ev_time, ev_rank, ev_ref, n_events,
+                bar_time, bar_inst, bar_open, bar_high, bar_low, bar_volume,
+                orders["inst"], orders["qty"], orders["type"], orders["limit"], orders["stop"], orders["oco"],
+                child_ptr, child_idx, oco_ptr, oco_idx,
+                len(frames), participation, float(self.lot_size))
+        elapsed = time.perf_counter() - began
+
+        with stage("execution_engine.run.costs"):
+            table = orders["table"]
+            side = np.sign(orders["qty"][fill_order])
+            price = np.asarray(self.slippage.apply(side, fill_ref, fill_qty, bar_volume[fill_bar]), dtype=float)
+            limited = np.isin(orders["type"][fill_order], (LIMIT, STOP_LIMIT))
+            limit = orders["limit"][fill_order]
+            capped = np.where(side > 0, np.minimum(price, limit), np.maximum(price, limit))
+            price = np.where(limited, capped, price)
+            commission = np.broadcast_to(np.asarray(self.commission.apply(fill_qty, price), dtype=float), price.shape)
+
+            bar_index = frames[0].index.append([f.index for f in frames[1:]])
+            fills = pd.DataFrame({
+                "time": bar_index[fill_bar],
+                "stream": table["stream"].to_numpy()[fill_order],
+                "order": table["order"].to_numpy()[fill_order],
+                "instrument": table["instrument"].to_numpy()[fill_order],
+                "quantity": side * fill_qty,
+                "reference_price": fill_ref,
+                "price": price,
+                "commission": commission,
+            })
+
+            notional = np.bincount(fill_order, weights=fill_qty * price, minlength=n_orders)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                average = np.where(filled > 0, notional / filled, np.nan)
+            result_orders = table.drop(columns=["_submit", "_cancel", "_parent", "_oco"]).assign(
+                filled=np.sign(orders["qty"]) * filled,
+                avg_price=average,
+                commission=np.bincount(fill_order, weights=commission, minlength=n_orders),
+                status=STATUS_NAMES[status],
+            )
+            closes = pd.concat({name: f["Close"] for name, f in self.bars.items()}, axis=1).sort_index()
+
+        logger.info(f"Processed {processed} events ({len(fills)} fills) in {elapsed:.3f} s, "
+                    f"{processed / max(elapsed, 1e-12):,.0f} events/s")
+        return ExecutionResult(orders=result_orders, fills=fills, closes=closes,
+                               initial_capital=self.initial_capital, events=int(processed), elapsed=elapsed)
+
+
+def main():
+    """Example: two order streams trading four instruments on one million minute bars."""
+    rng = np.random.default_rng(0)
+    n_bars, names = 250_000, ["AAA", "BBB", "CCC", "DDD"]
+    index = pd.date_range("2024-01-02 09:31", periods=n_bars, freq="min")
+    bars = {}
+    for name in names:
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0, 0.0005, n_bars)))
+        open_ = np.concatenate([[100.0], close[:-1]])
+        spread = np.abs(rng.normal(0.0, 0.0004, n_bars)) * close
+        bars[name] = pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) + spread,
+                                   "Low": np.minimum(open_, close) - spread, "Close": close,
+                                   "Volume": rng.integers(500, 5_000, n_bars)}, index=index)
+
+    # A market-making stream resting limits around the price, and a breakout stream using stops
+    n_orders = 50_000
+    when = np.sort(rng.integers(0, n_bars - 1, n_orders))
+    column = rng.integers(0, len(names), n_orders)
+    symbol = np.array(names)[column]
+    last = np.column_stack([bars[name]["Close"].to_numpy() for name in names])[when, column]
+    side = rng.choice([-1, 1], n_orders)
+    maker = pd.DataFrame({"instrument": symbol, "type": "limit", "quantity": side * 300,
+                          "limit_price": last * (1 - side * 0.0005),
+                          "cancel_time": index[np.minimum(when + 30, n_bars - 1)]}, index=index[when])
+    breakout = pd.DataFrame({"instrument": symbol, "type": "stop", "quantity": side * 1_000,
+                             "stop_price": last * (1 + side * 0.001),
+                             "cancel_time": index[np.minimum(when + 60, n_bars - 1)]}, index=index[when])
+
+    engine = ExecutionEngine(bars, slippage=FixedSlippage(0.5), commission=PerShareCommission(0.005, 1.0),
+                             max_participation=0.2)
+    engine.add_stream("maker", maker).add_stream("breakout", breakout)
+    engine.run()  # compile
+    result = engine.run()
+    print(f"{result.events:,} events, {len(result.fills):,} fills in {result.elapsed:.3f} s "
+          f"({result.events_per_second / 1e6:.1f}M events/s)")
+    print(result.orders.groupby(["stream", "status"]).size().unstack(fill_value=0).to_string())
+    print(result.equity().iloc[-1].round(2).to_string())
+
+
+if __name__ == "__main__":
+    # Run the importable copy so the compiled loop is cached against qf_utils.execution
+    from qf_utils.execution import main as _main
+
+    _main()
@@ -0,0 +1,754 @@
+"""O(n) technical indicators with memoization and O(1) streaming variants."""
+
+import hashlib
+import logging
+import math
+import weakref
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[np.ndarray, pd.Series]
+CacheArg = Union[bool, "IndicatorCache", None]
+
+
+def _lfilter(b, a, x, zi):
+    # scipy.signal takes over a second to import; load it on the first recursive indicator
+    from scipy.signal import lfilter
+
+    return lfilter(b, a, x, zi=zi)[0]
+
+
+# ----------------------------------------------------------------------
+# Memoization
+# ----------------------------------------------------------------------
+
+# id(obj) -> (weak reference, digest). Hashing is O(n), so each read-only
+# input is hashed once and the digest reused for every indicator computed on
+# it. Anything that can still be modified in place is hashed on every call.
+_FINGERPRINTS: Dict[int, Tuple[weakref.ref, str]] = {}
+
+
+def _immutable(values: ArrayLike) -> bool:
+    """True for an ndarray that neither it nor any array it views can write to."""
+    array = values
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return array is None or isinstance(array, bytes)
+
+
+def fingerprint(values: ArrayLike) -> str:
+    """
+    Content hash of an array or Series (values, dtype, shape and index).
+
+    The digest is remembered per object only for read-only arrays
+    (``flags.writeable`` False down to the owning array). Writeable arrays
+    and Series are hashed again on every call, so editing them in place
+    never returns a stale cached result.
+    """
+    key = id(values)
+    entry = _FINGERPRINTS.get(key)
+    if entry is not None and entry[0]() is values:
+        return entry[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    array = np.ascontiguousarray(values.to_numpy() if isinstance(values, pd.Series) else values)
+    digest.update(f"{array.dtype}{array.shape}".encode())
+    digest.update(array.view(np.uint8).ravel() if array.size else b"")
+    if isinstance(values, pd.Series):
+        digest.update(pd.util.hash_pandas_object(values.index, index=False).to_numpy().tobytes())
+    result = digest.hexdigest()
+    if not _immutable(values):
+        return result
+
+    try:
+        ref = weakref.ref(values, lambda _, key=key: _FINGERPRINTS.pop(key, None))
+    except TypeError:  # not weak-referenceable; hash again next time
+        return result
+    _FINGERPRINTS[key] = (ref, result)
+    return result
+
+
+class IndicatorCache:
+    """
+    Bounded LRU cache of indicator results.
+
+    Keys combine the input fingerprints, the indicator name and its
+    parameters. Stored arrays are made read-only so a caller cannot corrupt
+    later hits; the public indicators return a copy.
+
+    Parameters
+    ----------
+    maxsize : int, default=512
+        Maximum number of cached results before the least recently used is evicted
+    """
+
+    def __init__(self, maxsize: int = 512):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        result = self._data.get(key)
+        if result is not None:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = compute()
+        result.flags.writeable = False
+        self._data[key] = result
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = 0
+
+
+_DEFAULT_CACHE = IndicatorCache()
+
+
+def default_cache() -> IndicatorCache:
+    """The process-wide cache used when ``cache=True``."""
+    return _DEFAULT_CACHE
+
+
+def _as_array(values: ArrayLike) -> np.ndarray:
+    array = values.to_numpy(dtype=float) if isinstance(values, pd.Series) else np.asarray(values, dtype=float)
+    if array.ndim != 1:
+        raise ValueError("indicators expect one-dimensional input")
+    return array
+
+
+def _run(
+    name: str,
+    params: tuple,
+    inputs: Tuple[ArrayLike, ...],
+    kernel: Callable,
+    cache: CacheArg,
+    like: Optional[ArrayLike] = None,
+) -> ArrayLike:
+    """Compute ``kernel(*arrays)`` through the cache, returning a Series if ``like`` is one."""
+    # Single-column frames (e.g. yfinance's data["Close"] for one ticker) act as Series
+    inputs = tuple(x.iloc[:, 0] if isinstance(x, pd.DataFrame) and x.shape[1] == 1 else x for x in inputs)
+    if like is not None and isinstance(like, pd.DataFrame) and like.shape[1] == 1:
+        like = like.iloc[:, 0]
+
+    def compute():
+        return kernel(*(_as_array(x) for x in inputs))
+
+    if cache is None or cache is False:
+        result = compute()
+    else:
+        store = _DEFAULT_CACHE if cache is True else cache
+        key = (tuple(fingerprint(x) for x in inputs), name, params)
+        result = store.get_or_compute(key, compute)
+    like = inputs[0] if like is None else like
+    if isinstance(like, pd.Series):
+        return pd.Series(result, index=like.index, name=like.name)
+    # Stored results are read-only; ndarray callers get their own writeable copy
+    return result if cache is None or cache is False else result.copy()
+
+
+# ----------------------------------------------------------------------
+# Batch kernels
+# ----------------------------------------------------------------------
+
+
+def _check_window(window: int) -> None:
+    if int(window) != window or window < 1:
+        raise ValueError("window must be a positive integer")
+
+
+# Rolling sums restart their cumulative sum every block (re-centered on the
+# block's first finite value), so rounding error stays proportional to local
+# values even on long trending series. Blocks overlap by ``window - 1`` and
+# are processed together as rows of one 2-D view, so the cost stays O(n).
+_BLOCK = 1024
+
+
+def _block_sums(d: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window sums of every row of ``d`` (one cumulative sum per row, in place)."""
+    c = np.empty((d.shape[0], d.shape[1] + 1))
+    c[:, 0] = 0.0
+    np.cumsum(d, axis=1, out=c[:, 1:])
+    return c[:, window:] - c[:, :-window]
+
+
+def _rolling_moments(x: np.ndarray, window: int, ddof: Optional[int] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Rolling mean and (if ``ddof`` is given) variance; NaN until the window fills.
+
+    Non-finite values add zero to the sums and, as in pandas, make every
+    window that contains them NaN.
+    """
+    n = len(x)
+    mean = np.full(n, np.nan)
+    var = np.full(n, np.nan) if ddof is not None else None
+    if n < window:
+        return mean, var
+    outputs = n - window + 1
+    block = max(_BLOCK, 4 * window)
+    n_blocks = -(-outputs // block)
+    padded = np.concatenate([x, np.full(n_blocks * block - outputs, x[-1])])
+    segments = np.lib.stride_tricks.sliding_window_view(padded, block + window - 1)[::block]
+    missing = ~np.isfinite(x)
+    if missing.any():
+        finite = np.isfinite(segments)
+        shift = np.take_along_axis(segments, finite.argmax(axis=1)[:, None], axis=1)
+        shift[~finite.any(axis=1)] = 0.0
+        d = np.where(finite, segments - shift, 0.0)
+        count = np.concatenate([[0], np.cumsum(missing)])
+        gaps = count[window:] - count[:-window] > 0
+    else:
+        shift = segments[:, :1]
+        d = segments - shift
+        gaps = None
+    s1 = _block_sums(d, window)
+    if var is not None:
+        np.multiply(d, d, out=d)
+        s2 = _block_sums(d, window)
+        s2 -= s1 * s1 / window
+        s2 /= window - ddof
+        np.maximum(s2, 0.0, out=s2)
+        var[window - 1:] = s2.ravel()[:outputs]
+        if gaps is not None:
+            var[window - 1:][gaps] = np.nan
+    s1 /= window
+    s1 += shift
+    mean[window - 1:] = s1.ravel()[:outputs]
+    if gaps is not None:
+        mean[window - 1:][gaps] = np.nan
+    return mean, var
+
+
+def _sma(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_moments(x, window)[0]
+
+
+def _rolling_std(x: np.ndarray, window: int, ddof: int) -> np.ndarray:
+    return np.sqrt(_rolling_moments(x, window, ddof)[1])
+
+
+def _ewm(x: np.ndarray, alpha: float, first: int, seed: float) -> np.ndarray:
+    """
+    ``y_t = alpha * x_t + (1 - alpha) * y_{t-1}`` from ``y_first = seed``; NaN before ``first``.
+
+    Non-finite inputs carry the last value forward, and the next observation
+    restarts the recursion with weight ``(1 - alpha) ** (gap + 1)`` on it, as
+    ``Series.ewm(adjust=False)`` does.
+    """
+    out = np.full(len(x), np.nan)
+    out[first] = seed
+    rest, tail = x[first + 1:], out[first + 1:]
+    finite = np.isfinite(rest)
+    if finite.all():
+        if len(rest):
+            tail[:] = _lfilter([alpha], [1.0, alpha - 1.0], rest, zi=[(1.0 - alpha) * seed])
+        return out
+    observed = np.flatnonzero(finite)
+    # One lfilter call per run of consecutive observations
+    runs = np.split(observed, np.flatnonzero(np.diff(observed) > 1) + 1) if len(observed) else []
+    last, value = -1, seed
+    for run in runs:
+        i, j = run[0], run[-1] + 1
+        tail[last + 1:i] = value
+        if i > last + 1:
+            w = (1.0 - alpha) ** (i - last)
+            value = tail[i] = (w * value + alpha * rest[i]) / (w + alpha)
+            i += 1
+        if i < j:
+            tail[i:j] = _lfilter([alpha], [1.0, alpha - 1.0], rest[i:j], zi=[(1.0 - alpha) * value])
+        last, value = j - 1, tail[j - 1]
+    tail[last + 1:] = value
+    return out
+
+
+def _ema(x: np.ndarray, alpha: float) -> np.ndarray:
+    # Seeded with the first finite value
+    first = 0
+    if len(x) and not np.isfinite(x[0]):
+        first = int(np.isfinite(x).argmax())
+    if first >= len(x) or not np.isfinite(x[first]):
+        return np.full(len(x), np.nan)
+    return _ewm(x, alpha, first, x[first])
+
+
+def _wilder(x: np.ndarray, window: int, start: int) -> np.ndarray:
+    """Wilder smoothing of x[start:], seeded with the mean of its first ``window`` finite values."""
+    observed = start + np.flatnonzero(np.isfinite(x[start:start + window]))
+    if len(observed) < window:
+        observed = start + np.flatnonzero(np.isfinite(x[start:]))
+        if len(observed) < window:
+            return np.full(len(x), np.nan)
+        observed = observed[:window]
+    return _ewm(x, 1.0 / window, observed[-1], x[observed].mean())
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    tr = high - low
+    if len(tr) > 1:
+        prev = close[:-1]
+        tr[1:] = np.maximum.reduce([tr[1:], np.abs(high[1:] - prev), np.abs(low[1:] - prev)])
+    return tr
+
+
+def _atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int) -> np.ndarray:
+    if not len(high) == len(low) == len(close):
+        raise ValueError("high, low and close must have the same length")
+    return _wilder(_true_range(high, low, close), window, 0)
+
+
+def _rsi(x: np.ndarray, window: int) -> np.ndarray:
+    out = np.full(len(x), np.nan)
+    if len(x) <= window:
+        return out
+    delta = np.concatenate([[0.0], np.diff(x)])
+    gain = _wilder(np.maximum(delta, 0.0), window, 1)
+    loss = _wilder(np.maximum(-delta, 0.0), window, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + gain / loss)
+    # No losses in the window: RSI is 100 (or undefined if flat, reported as 50)
+    out[(loss == 0) & (gain > 0)] = 100.0
+    out[(loss == 0) & (gain == 0)] = 50.0
+    return out
+
+
+def _alpha(span: Optional[float], alpha: Optional[float]) -> float:
+    if (span is None) == (alpha is None):
+        raise ValueError("pass exactly one of span or alpha")
+    if alpha is None:
+        if span < 1:
+            raise ValueError("span must be at least 1")
+        alpha = 2.0 / (span + 1.0)
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha must be in (0, 1]")
+    return float(alpha)
+
+
+# ----------------------------------------------------------------------
+# Public batch indicators
+# ----------------------------------------------------------------------
+
+
+def sma(values: ArrayLike, window: int, cache: CacheArg = True) -> ArrayLike:
+    """
+    Simple moving average, equal to ``Series.rolling(window).mean()``.
+
+    Parameters
+    ----------
+    values : np.ndarray or pd.Series
+        Input series; windows containing NaN or inf are NaN
+    window : int
+        Lookback length
+    cache : bool or IndicatorCache, default=True
+        Memoize in the default cache, a given cache, or not at all (False)
+
+    Returns
+    -------
+    np.ndarray or pd.Series
+        Same type as ``values``; NaN until the window fills
+
+    Examples
+    --------
+    >>> fast = sma(data["Close"], 20)
+    >>> slow = sma(data["Close"], 50)
+    """
+    _check_window(window)
+    return _run("sma", (int(window),), (values,), lambda x: _sma(x, int(window)), cache)
+
+
+def ema(
+    values: ArrayLike,
+    span: Optional[float] = None,
+    alpha: Optional[float] = None,
+    cache: CacheArg = True,
+) -> ArrayLike:
+    """
+    Exponential moving average, equal to ``Series.ewm(span=span, adjust=False).mean()``.
+
+    Missing values carry the average forward, and the next observation
+    restarts the recursion with the decayed weight pandas gives it.
+
+    Parameters
+    ----------
+    values : np.ndarray or pd.Series
+        Input series
+    span : float, optional
+        Span; ``alpha = 2 / (span + 1)``
+    alpha : float, optional
+        Smoothing factor in (0, 1] (give either span or alpha)
+    cache : bool or IndicatorCache, default=True
+
+    Returns
+    -------
+    np.ndarray or pd.Series
+    """
+    a = _alpha(span, alpha)
+    return _run("ema", (a,), (values,), lambda x: _ema(x, a), cache)
+
+
+def rolling_std(values: ArrayLike, window: int, ddof: int = 1, cache: CacheArg = True) -> ArrayLike:
+    """
+    Rolling standard deviation, equal to ``Series.rolling(window).std(ddof)``.
+
+    Parameters
+    ----------
+    values : np.ndarray or pd.Series
+    window : int
+    ddof : int, default=1
+    cache : bool or IndicatorCache, default=True
+
+    Returns
+    -------
+    np.ndarray or pd.Series
+    """
+    _check_window(window)
+    if window <= ddof:
+        raise ValueError("window must exceed ddof")
+    return _run("rolling_std", (int(window), ddof), (values,), lambda x: _rolling_std(x, int(window), ddof), cache)
+
+
+def zscore(values: ArrayLike, window: int, ddof: int = 1, cache: CacheArg = True) -> ArrayLike:
+    """
+    Distance from the rolling mean in rolling standard deviations.
+
+    Parameters
+    ----------
+    values : np.ndarray or pd.Series
+    window : int
+    ddof : int, default=1
+    cache : bool or IndicatorCache, default=True
+
+    Returns
+    -------
+    np.ndarray or pd.Series
+        NaN until the window fills (and where the window is flat)
+    """
+    _check_window(window)
+
+    def kernel(x):
+        mean, var = _rolling_moments(x, int(window), ddof)
+        std = np.sqrt(var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (x - mean) / std
+        z[std == 0] = np.nan
+        return z
+
+    return _run("zscore", (int(window), ddof), (values,), kernel, cache)
+
+
+def atr(high: ArrayLike, low: ArrayLike, close: ArrayLike, window: int = 14, cache: CacheArg = True) -> ArrayLike:
+    """
+    Average True Range with Wilder smoothing.
+
+    The first value (at ``window - 1``) is the mean of the first ``window``
+    true ranges; afterwards ``ATR_t = ATR_{t-1} + (TR_t - ATR_{t-1}) / window``.
+
+    Parameters
+    ----------
+    high, low, close : np.ndarray or pd.Series
+        Bar highs, lows and closes of equal length
+    window : int, default=14
+    cache : bool or IndicatorCache, default=True
+
+    Returns
+    -------
+    np.ndarray or pd.Series
+        Indexed like ``close``
+    """
+    _check_window(window)
+    return _run(
+        "atr", (int(window),), (high, low, close), lambda h, l, c: _atr(h, l, c, int(window)), cache, like=close
+    )
+
+
+def rsi(values: ArrayLike, window: int = 14, cache: CacheArg = True) -> ArrayLike:
+    """
+    Wilder's Relative Strength Index on a 0-100 scale.
+
+    Average gains and losses are seeded with the mean of the first ``window``
+    price changes (so the first value is at index ``window``) and then
+    smoothed with ``alpha = 1 / window``.
+
+    Parameters
+    ----------
+    values : np.ndarray or pd.Series
+        Prices
+    window : int, default=14
+    cache : bool or IndicatorCache, default=True
+
+    Returns
+    -------
+    np.ndarray or pd.Series
+    """
+    _check_window(window)
+    return _run("rsi", (int(window),), (values,), lambda x: _rsi(x, int(window)), cache)
+
+
+# ----------------------------------------------------------------------
+# Streaming indicators
+# ----------------------------------------------------------------------
+
+
+class StreamingSMA:
+    """
+    Simple moving average updated in O(1) per bar.
+
+    The running sum is rebuilt from the window every ``window`` updates so
+    rounding error does not accumulate over long sessions.
+
+    Examples
+    --------
+    >>> fast = StreamingSMA(20)
+    >>> for price in feed:
+    ...     value = fast.update(price)
+    """
+
+    __slots__ = ("window", "_values", "_sum", "_since_resync")
+
+    def __init__(self, window: int):
+        _check_window(window)
+        self.window = int(window)
+        self._values: deque = deque(maxlen=self.window)
+        self._sum = 0.0
+        self._since_resync = 0
+
+    @property
+    def ready(self) -> bool:
+        return len(self._values) == self.window
+
+    @property
+    def value(self) -> float:
+        return self._sum / self.window if self.ready else math.nan
+
+    def update(self, x: float) -> float:
+        if self.ready:
+            self._sum -= self._values[0]
+        self._values.append(x)
+        self._sum += x
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._sum = math.fsum(self._values)
+            self._since_resync = 0
+        return self.value
+
+
+class StreamingEMA:
+    """Exponential moving average (``adjust=False``) updated in O(1) per bar."""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, span: Optional[float] = None, alpha: Optional[float] = None):
+        self.alpha = _alpha(span, alpha)
+        self.value = math.nan
+
+    @property
+    def ready(self) -> bool:
+        return not math.isnan(self.value)
+
+    def update(self, x: float) -> float:
+        self.value = x if math.isnan(self.value) else self.value + self.alpha * (x - self.value)
+        return self.value
+
+
+class StreamingStd:
+    """
+    Rolling standard deviation updated in O(1) per bar.
+
+    Sums are kept relative to the first observation and rebuilt every
+    ``window`` updates, which keeps them accurate for price-level inputs.
+    """
+
+    __slots__ = ("window", "ddof", "_values", "_shift", "_s1", "_s2", "_since_resync")
+
+    def __init__(self, window: int, ddof: int = 1):
+        _check_window(window)
+        if window <= ddof:
+            raise ValueError("window must exceed ddof")
+        self.window = int(window)
+        self.ddof = ddof
+        self._values: deque = deque(maxlen=self.window)
+        self._shift: Optional[float] = None
+        self._s1 = self._s2 = 0.0
+        self._since_resync = 0
+
+    @property
+    def ready(self) -> bool:
+        return len(self._values) == self.window
+
+    @property
+    def mean(self) -> float:
+        return self._shift + self._s1 / self.window if self.ready else math.nan
+
+    @property
+    def value(self) -> float:
+        if not self.ready:
+            return math.nan
+        variance = (self._s2 - self._s1 * self._s1 / self.window) / (self.window - self.ddof)
+        return math.sqrt(max(variance, 0.0))
+
+    def update(self, x: float) -> float:
+        if self._shift is None:
+            self._shift = x
+        if self.ready:
+            old = self._values[0] - self._shift
+            self._s1 -= old
+            self._s2 -= old * old
+        self._values.append(x)
+        d = x - self._shift
+        self._s1 += d
+        self._s2 += d * d
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            # Re-center on the current window and recompute exactly
+            self._shift = self._values[0]
+            deltas = [v - self._shift for v in self._values]
+            self._s1 = math.fsum(deltas)
+            self._s2 = math.fsum(d * d for d in deltas)
+            self._since_resync = 0
+        return self.value
+
+
+class StreamingZScore:
+    """Rolling z-score updated in O(1) per bar."""
+
+    __slots__ = ("_std",)
+
+    def __init__(self, window: int, ddof: int = 1):
+        self._std = StreamingStd(window, ddof)
+
+    @property
+    def ready(self) -> bool:
+        return self._std.ready
+
+    def update(self, x: float) -> float:
+        std = self._std.update(x)
+        if not std > 0:
+            return math.nan
+        return (x - self._std.mean) / std
+
+
+class StreamingATR:
+    """Wilder Average True Range updated in O(1) per bar."""
+
+    __slots__ = ("window", "value", "_prev_close", "_count", "_seed_sum")
+
+    def __init__(self, window: int = 14):
+        _check_window(window)
+        self.window = int(window)
+        self.value = math.nan
+        self._prev_close: Optional[float] = None
+        self._count = 0
+        self._seed_sum = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self._count >= self.window
+
+    def update(self, high: float, low: float, close: float) -> float:
+        tr = high - low
+        if self._prev_close is not None:
+            tr = max(tr, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        self._count += 1
+        if self._count < self.window:
+            self._seed_sum += tr
+        elif self._count == self.window:
+            self.value = (self._seed_sum + tr) / self.window
+        else:
+            self.value += (tr - self.value) / self.window
+        return self.value
+
+
+class StreamingRSI:
+    """Wilder Relative Strength Index updated in O(1) per bar."""
+
+    __slots__ = ("window", "_prev", "_count", "_gain", "_loss")
+
+    def __init__(self, window: int = 14):
+        _check_window(window)
+        self.window = int(window)
+        self._prev: Optional[float] = None
+        self._count = 0
+        self._gain = self._loss = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self._count >= self.window
+
+    @property
+    def value(self) -> float:
+        if not self.ready:
+            return math.nan
+        if self._loss == 0:
+            return 100.0 if self._gain > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + self._gain / self._loss)
+
+    def update(self, x: float) -> float:
+        if self._prev is None:
+            self._prev = x
+            return math.nan
+        change, self._prev = x - self._prev, x
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        self._count += 1
+        if self._count <= self.window:
+            # Accumulate the seed averages over the first ``window`` changes
+            self._gain += gain / self.window
+            self._loss += loss / self.window
+        else:
+            self._gain += (gain - self._gain) / self.window
+            self._loss += (loss - self._loss) / self.window
+        return self.value
+
+
+def main():
+    """Example usage of batch and streaming indicators."""
+    import time
+
+    rng = np.random.default_rng(0)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 1_000_000))))
+
+    start = time.perf_counter()
+    ours = sma(close, 50, cache=False)
+    ours_time = time.perf_counter() - start
+    start = time.perf_counter()
+    theirs = close.rolling(50).mean()
+    pandas_time = time.perf_counter() - start
+    print(f"SMA(50) on 1e6 bars: {ours_time * 1e3:.1f} ms (pandas {pandas_time * 1e3:.1f} ms), "
+          f"max diff {np.nanmax(np.abs(ours - theirs)):.2e}")
+
+    # A parameter sweep recomputes the same windows many times
+    windows = [10, 20, 50, 100, 200]
+    start = time.perf_counter()
+    for fast in windows:
+        for slow in windows:
+            sma(close, fast), sma(close, slow)
+    cache = default_cache()
+    print(f"25-pair sweep: {time.perf_counter() - start:.3f} s, cache hits {cache.hits}, misses {cache.misses}")
+
+    stream = StreamingRSI(14)
+    start = time.perf_counter()
+    for price in close.to_numpy()[:100_000]:
+        stream.update(price)
+    per_bar = (time.perf_counter() - start) / 100_000
+    print(f"Streaming RSI: {per_bar * 1e6:.2f} us per bar, last {stream.value:.2f} "
+          f"(batch {rsi(close.iloc[:100_000]).iloc[-1]:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""Opt-in stage timing, call counts and allocation tracking with pluggable sinks."""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = "QF_INSTRUMENTATION"
+
+
+@dataclass
+class StageStats:
+    """
+    Aggregated measurements for one named stage.
+
+    Attributes
+    ----------
+    calls : int
+        Number of completed executions
+    total_seconds : float
+        Summed wall time
+    max_seconds : float
+        Slowest single execution
+    alloc_bytes : int
+        Summed peak bytes allocated above the level at stage entry
+        (only collected when memory tracking is on)
+    """
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    alloc_bytes: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+class _State:
+    enabled = False
+    track_memory = False
+    started_tracemalloc = False
+
+
+_state = _State()
+_stats: Dict[str, StageStats] = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class _NullStage:
+    """Shared do-nothing context manager returned while collection is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("name", "start", "frame")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.frame = None
+        if _state.track_memory:
+            # Each frame is [bytes at entry, highest peak seen by nested stages];
+            # reset_peak is process-wide, so nested stages report peaks upwards.
+            stack = _memory_stack()
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            self.frame = [current, current]
+            stack.append(self.frame)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        allocated = 0
+        if self.frame is not None:
+            stack = _memory_stack()
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self.frame[1])
+            if stack and stack[-1] is self.frame:
+                stack.pop()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            allocated = max(0, peak - self.frame[0])
+        _record(self.name, elapsed, allocated)
+        return False
+
+
+def _memory_stack() -> List[List[int]]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _record(name: str, elapsed: float, allocated: int) -> None:
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = StageStats()
+        stats.calls += 1
+        stats.total_seconds += elapsed
+        stats.alloc_bytes += allocated
+        if elapsed > stats.max_seconds:
+            stats.max_seconds = elapsed
+
+
+def enable(track_memory: bool = False) -> None:
+    """
+    Start collecting measurements.
+
+    Parameters
+    ----------
+    track_memory : bool, default=False
+        Also record allocated bytes per stage through ``tracemalloc``. This
+        slows every allocation in the process while active.
+    """
+    _state.track_memory = track_memory
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _state.started_tracemalloc = True
+    _state.enabled = True
+
+
+def disable() -> None:
+    """Stop collecting. Recorded measurements are kept until ``reset``."""
+    _state.enabled = False
+    _state.track_memory = False
+    if _state.started_tracemalloc:
+        tracemalloc.stop()
+        _state.started_tracemalloc = False
+    _local.stack = []
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def stage(name: str):
+    """
+    Context manager measuring the enclosed block as ``name``.
+
+    Returns a shared no-op object when collection is disabled.
+
+    Examples
+    --------
+    >>> with stage("backtester.signals"):
+    ...     signals = signal_func(data)
+    """
+    if not _state.enabled:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def instrumented(name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording every call of the wrapped function as a stage.
+
+    When collection is disabled the wrapper costs one attribute lookup.
+
+    Parameters
+    ----------
+    name : str, optional
+        Stage name (defaults to ``module.qualname`` of the function)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        stage_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            with _Stage(stage_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> Dict[str, StageStats]:
+    """Copy of the measurements recorded so far, keyed by stage name."""
+    with _lock:
+        return {name: StageStats(**asdict(stats)) for name, stats in _stats.items()}
+
+
+def reset() -> None:
+    """Discard recorded measurements."""
+    with _lock:
+        _stats.clear()
+
+
+# ----------------------------------------------------------------------
+# Sinks
+# ----------------------------------------------------------------------
+
+
+class Sink:
+    """Destination for measurements; subclasses implement ``emit``."""
+
+    def emit(self, stats: Dict[str, StageStats]) -> None:
+        raise NotImplementedError
+
+
+class LoggingSink(Sink):
+    """
+    One structured JSON log record per stage.
+
+    Parameters
+    ----------
+    log : logging.Logger, optional
+        Target logger (defaults to this module's logger)
+    level : int, default=logging.INFO
+    """
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.log = log or logger
+        self.level = level
+
+    def emit(self, stats: Dict[str, StageStats]) -> None:
+        for name, s in sorted(stats.items()):
+            record = {"stage": name, **asdict(s), "mean_seconds": s.mean_seconds}
+            self.log.log(self.level, json.dumps(record, sort_keys=True))
+
+
+class PrometheusTextSink(Sink):
+    """
+    Prometheus text exposition file, e.g. for node_exporter's textfile collector.
+
+    The file is replaced atomically on every emit.
+
+    Parameters
+    ----------
+    path : str
+        Output file (conventionally ending in ``.prom``)
+    prefix : str, default='qf_utils'
+        Metric name prefix
+    """
+
+    def __init__(self, path: str, prefix: str = "qf_utils"):
+        self.path = path
+        self.prefix = prefix
+
+    def render(self, stats: Dict[str, StageStats]) -> str:
+        metrics = [
+            ("stage_calls_total", "counter", "Completed executions of the stage", "calls"),
+            ("stage_seconds_total", "counter", "Wall time spent in the stage", "total_seconds"),
+            ("stage_max_seconds", "gauge", "Slowest single execution of the stage", "max_seconds"),
+            ("stage_alloc_bytes_total", "counter", "Peak bytes allocated inside the stage", "alloc_bytes"),
+        ]
+        lines = []
+        for suffix, kind, help_text, field in metrics:
+            metric = f"{self.prefix}_{suffix}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, s in sorted(stats.items()):
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{metric}{{stage="{label}"}} {getattr(s, field)}')
+        return "\n".join(lines) + "\n"
+
+    def emit(self, stats: Dict[str, StageStats]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render(stats))
+        os.replace(tmp, self.path)
+
+
+_SINKS: List[Sink] = []
+
+
+def add_sink(sink: Sink) -> Sink:
+    """Register a sink that receives every ``flush``."""
+    _SINKS.append(sink)
+    return sink
+
+
+def remove_sink(sink: Sink) -> None:
+    _SINKS.remove(sink)
+
+
+def flush(reset_after: bool = False) -> Dict[str, StageStats]:
+    """
+    Send the current snapshot to every registered sink.
+
+    Parameters
+    ----------
+    reset_after : bool, default=False
+        Clear measurements once they have been emitted
+
+    Returns
+    -------
+    dict
+        The snapshot that was emitted
+    """
+    stats = snapshot()
+    for sink in _SINKS:
+        try:
+            sink.emit(stats)
+        except Exception as e:
+            logger.error(f"Instrumentation sink {sink!r} failed: {e}")
+    if reset_after:
+        reset()
+    return stats
+
+
+if os.environ.get(ENV_VAR, "").lower() in ("1", "true", "memory"):
+    enable(track_memory=os.environ[ENV_VAR].lower() == "memory")
+
+
+def main():
+    """Example usage of the instrumentation layer."""
+    import numpy as np
+    import pandas as pd
+
+    from .backtester import Backtester
+
+    enable(track_memory=True)
+    add_sink(LoggingSink())
+
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-01", periods=1000, freq="B")
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, len(dates))))
+    data = pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1e6}, index=dates)
+
+    def signal(df):
+        fast, slow = df["Close"].rolling(20).mean(), df["Close"].rolling(50).mean()
+        return pd.Series(np.where(fast > slow, 1, -1), index=df.index)
+
+    Backtester(data).run(signal)
+    for name, s in sorted(flush().items()):
+        print(f"{name:<45} {s.calls:>4} calls {s.total_seconds:>9.4f} s {s.alloc_bytes / 1e6:>8.2f} MB")
+    print()
+    print(PrometheusTextSink("metrics.prom").render(snapshot()))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    # Use the importable module so the instrumented code shares its state
+    from qf_utils.instrumentation import main as _main
+
+    _main()
@@ -0,0 +1,9 @@
+"""Numba compilation of the event loop used by ``qf_utils.execution``."""
+
+from numba import njit
+
+from .execution import _event_loop
+
+# The loop is written against NumPy arrays and scalars only, so the same
+# source runs interpreted (backend='python') and compiled here.
+event_loop = njit(cache=True, nogil=True)(_event_loop)
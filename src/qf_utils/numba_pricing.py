@@ -0,0 +1,241 @@
+"""Numba kernels mirroring the Cython Black-Scholes and Monte Carlo modules."""
+
+import logging
+import math
+from typing import Optional
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+logger = logging.getLogger(__name__)
+
+# Paths are split into this many independently seeded chunks. The count is
+# fixed (not the thread count) so a given seed gives the same price on any
+# machine; each chunk runs on one thread and reseeds that thread's generator.
+N_CHUNKS = 64
+
+_SQRT2 = math.sqrt(2.0)
+
+
+@njit(cache=True, nogil=True)
+def _norm_cdf(x):
+    return 0.5 * (1.0 + math.erf(x / _SQRT2))
+
+
+@njit(cache=True, nogil=True)
+def call_price(S, K, T, r, sigma):
+    """Black-Scholes call price (same formula as ``black_scholes_cy.call_price``)."""
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * math.sqrt(T))
+    d2 = d1 - sigma * math.sqrt(T)
+    return S * _norm_cdf(d1) - K * math.exp(-r * T) * _norm_cdf(d2)
+
+
+@njit(cache=True, nogil=True)
+def put_price(S, K, T, r, sigma):
+    """Black-Scholes put price (same formula as ``black_scholes_cy.put_price``)."""
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * math.sqrt(T))
+    d2 = d1 - sigma * math.sqrt(T)
+    return K * math.exp(-r * T) * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+
+
+@njit(parallel=True, cache=True)
+def _black_scholes_kernel(S, K, T, r, sigma, is_call, out):
+    for i in prange(S.shape[0]):
+        if is_call:
+            out[i] = call_price(S[i], K[i], T[i], r, sigma[i])
+        else:
+            out[i] = put_price(S[i], K[i], T[i], r, sigma[i])
+
+
+@njit(parallel=True, cache=True)
+def _european_kernel(S0, K, T, r, sigma, n_simulations, is_call, seeds):
+    n_chunks = seeds.shape[0]
+    drift = (r - 0.5 * sigma * sigma) * T
+    vol = sigma * math.sqrt(T)
+    totals = np.zeros(n_chunks)
+    for c in prange(n_chunks):
+        np.random.seed(seeds[c])
+        start = c * n_simulations // n_chunks
+        stop = (c + 1) * n_simulations // n_chunks
+        total = 0.0
+        for _ in range(start, stop):
+            ST = S0 * math.exp(drift + vol * np.random.standard_normal())
+            total += max(ST - K, 0.0) if is_call else max(K - ST, 0.0)
+        totals[c] = total
+    return math.exp(-r * T) * totals.sum() / n_simulations
+
+
+@njit(parallel=True, cache=True)
+def _asian_kernel(S0, K, T, r, sigma, n_simulations, n_steps, is_call, seeds):
+    n_chunks = seeds.shape[0]
+    dt = T / n_steps
+    drift = (r - 0.5 * sigma * sigma) * dt
+    vol = sigma * math.sqrt(dt)
+    totals = np.zeros(n_chunks)
+    for c in prange(n_chunks):
+        np.random.seed(seeds[c])
+        start = c * n_simulations // n_chunks
+        stop = (c + 1) * n_simulations // n_chunks
+        total = 0.0
+        for _ in range(start, stop):
+            S = S0
+            avg_price = 0.0
+            for _ in range(n_steps):
+                S *= math.exp(drift + vol * np.random.standard_normal())
+                avg_price += S
+            avg_price /= n_steps
+            total += max(avg_price - K, 0.0) if is_call else max(K - avg_price, 0.0)
+        totals[c] = total
+    return math.exp(-r * T) * totals.sum() / n_simulations
+
+
+@njit(parallel=True, cache=True)
+def _bootstrap_kernel(returns, n_simulations, seeds):
+    n_chunks = seeds.shape[0]
+    n = returns.shape[0]
+    simulated = np.empty(n_simulations)
+    for c in prange(n_chunks):
+        np.random.seed(seeds[c])
+        for i in range(c * n_simulations // n_chunks, (c + 1) * n_simulations // n_chunks):
+            total = 0.0
+            for _ in range(n):
+                total += returns[np.random.randint(0, n)]
+            simulated[i] = total / n
+    return simulated
+
+
+def _chunk_seeds(seed: Optional[int]) -> np.ndarray:
+    """Independent 32-bit seeds for each chunk, derived from one user seed."""
+    return np.random.SeedSequence(seed).generate_state(N_CHUNKS, dtype=np.uint32).astype(np.int64)
+
+
+def black_scholes(S, K, T, r, sigma, option_type="call"):
+    """
+    Black-Scholes prices over broadcast arrays, evaluated in parallel.
+
+    Parameters
+    ----------
+    S, K, T, sigma : float or array-like
+        Spot, strike, maturity and volatility (broadcast together)
+    r : float
+        Risk-free rate
+    option_type : str, default='call'
+        'call' or 'put'
+
+    Returns
+    -------
+    np.ndarray
+        Prices with the broadcast shape
+    """
+    S, K, T, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S, K, T, sigma)))
+    shape = S.shape
+    # Broadcast views are materialized so the kernel sees plain contiguous arrays
+    S, K, T, sigma = (np.array(x, order="C").ravel() for x in (S, K, T, sigma))
+    out = np.empty(S.size)
+    _black_scholes_kernel(S, K, T, float(r), sigma, option_type == "call", out)
+    return out.reshape(shape)
+
+
+def monte_carlo_option_price(S0, K, T, r, sigma, n_simulations, option_type="call", seed=None):
+    """
+    European option price by Monte Carlo (``monte_carlo_cy.monte_carlo_option_price``).
+
+    Parameters
+    ----------
+    S0, K, T, r, sigma : float
+        Spot, strike, maturity, risk-free rate and volatility
+    n_simulations : int
+        Number of paths
+    option_type : str, default='call'
+        'call' or 'put'
+    seed : int, optional
+        Seed; the same seed gives the same price regardless of thread count
+
+    Returns
+    -------
+    float
+        Discounted price estimate
+    """
+    return _european_kernel(
+        float(S0), float(K), float(T), float(r), float(sigma), int(n_simulations), option_type == "call",
+        _chunk_seeds(seed),
+    )
+
+
+def monte_carlo_asian_option(S0, K, T, r, sigma, n_simulations, n_steps, option_type="call", seed=None):
+    """
+    Arithmetic-average Asian option price (``monte_carlo_cy.monte_carlo_asian_option``).
+
+    Parameters are those of ``monte_carlo_option_price`` plus ``n_steps``
+    averaging dates.
+    """
+    return _asian_kernel(
+        float(S0), float(K), float(T), float(r), float(sigma), int(n_simulations), int(n_steps),
+        option_type == "call", _chunk_seeds(seed),
+    )
+
+
+def calculate_var_mc(returns, confidence_level, n_simulations, seed=None):
+    """
+    Bootstrap VaR of the mean return (``monte_carlo_cy.calculate_var_mc``).
+
+    Parameters
+    ----------
+    returns : array-like
+        Historical returns
+    confidence_level : float
+        e.g. 0.95
+    n_simulations : int
+        Bootstrap resamples
+    seed : int, optional
+
+    Returns
+    -------
+    float
+        The (1 - confidence_level) percentile of resampled mean returns
+    """
+    simulated = _bootstrap_kernel(np.ascontiguousarray(returns, dtype=float), int(n_simulations), _chunk_seeds(seed))
+    return float(np.percentile(simulated, (1 - confidence_level) * 100))
+
+
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) every kernel."""
+    black_scholes(100.0, [100.0], 1.0, 0.05, 0.2)
+    black_scholes(100.0, [100.0], 1.0, 0.05, 0.2, option_type="put")
+    monte_carlo_option_price(100.0, 100.0, 1.0, 0.05, 0.2, N_CHUNKS, seed=0)
+    monte_carlo_asian_option(100.0, 100.0, 1.0, 0.05, 0.2, N_CHUNKS, 2, seed=0)
+    calculate_var_mc(np.zeros(4), 0.95, N_CHUNKS, seed=0)
+    logger.debug(f"Numba pricing kernels ready ({numba.get_num_threads()} threads)")
+
+
+def main():
+    """Example usage of the Numba pricers."""
+    import time
+
+    from .vol_surface import black_scholes_price
+
+    start = time.perf_counter()
+    warm_up()
+    print(f"Warm-up (compile or cache load): {time.perf_counter() - start:.2f} s, "
+          f"{numba.get_num_threads()} threads")
+
+    strikes = np.linspace(80, 120, 5)
+    print(f"Black-Scholes calls {np.round(black_scholes(100.0, strikes, 1.0, 0.05, 0.2), 4)}")
+    print(f"Closed form (NumPy) {np.round(black_scholes_price(100.0, strikes, 1.0, 0.05, 0.2), 4)}")
+
+    for n in (100_000, 1_000_000, 10_000_000):
+        start = time.perf_counter()
+        price = monte_carlo_option_price(100.0, 100.0, 1.0, 0.05, 0.2, n, seed=42)
+        print(f"European MC {n:>10,} paths: {price:.4f} in {time.perf_counter() - start:.4f} s")
+
+    start = time.perf_counter()
+    price = monte_carlo_asian_option(100.0, 100.0, 1.0, 0.05, 0.2, 1_000_000, 52, seed=42)
+    print(f"Asian MC 1,000,000 x 52 steps: {price:.4f} in {time.perf_counter() - start:.4f} s")
+
+
+if __name__ == "__main__":
+    # Kernels compiled under ``__main__`` would bypass the on-disk cache
+    from qf_utils.numba_pricing import main as _main
+
+    _main()
@@ -0,0 +1,65 @@
+"""Numba kernel for the GARCH-family variance recursion used by ``qf_utils.volatility``."""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+# Model codes shared with ``qf_utils.volatility``
+GARCH, GJR, EGARCH = 0, 1, 2
+
+_LOG_2PI = math.log(2.0 * math.pi)
+_ABS_Z_MEAN = math.sqrt(2.0 / math.pi)
+
+
+@njit(parallel=True, cache=True)
+def filter_kernel(model, theta, eps, var0, nll, grad, var):
+    """
+    Gaussian negative log-likelihood and its gradient for a batch of assets.
+
+    Each asset runs its own scalar recursion on one thread, so the arrays
+    are asset-major: ``theta`` is (n_assets, k), ``eps`` (n_assets, n_obs)
+    and ``var`` (n_assets, n_obs + 1), whose last column is the one-step
+    ahead variance. Results are written into ``nll``, ``grad`` and ``var``.
+    """
+    n_assets, n_obs = eps.shape
+    k = theta.shape[1]
+    for i in prange(n_assets):
+        beta = theta[i, k - 1]
+        x = np.empty(k)
+        ds = np.zeros(k)
+        g = np.zeros(k)
+        s = math.log(var0[i]) if model == EGARCH else var0[i]
+        total = 0.0
+        for t in range(n_obs):
+            h = math.exp(s) if model == EGARCH else s
+            var[i, t] = h
+            e = eps[i, t]
+            z2 = e * e / h
+            total += math.log(h) + z2
+            w = 0.5 * (1.0 - z2) if model == EGARCH else 0.5 * (1.0 - z2) / h
+            for j in range(k):
+                g[j] += w * ds[j]
+
+            x[0] = 1.0
+            if model == EGARCH:
+                z = e / math.sqrt(h)
+                x[1] = abs(z) - _ABS_Z_MEAN
+                x[2] = z
+                sign = 1.0 if z > 0 else (-1.0 if z < 0 else 0.0)
+                factor = beta - 0.5 * z * (theta[i, 1] * sign + theta[i, 2])
+            else:
+                x[1] = e * e
+                if model == GJR:
+                    x[2] = e * e if e < 0 else 0.0
+                factor = beta
+            x[k - 1] = s
+
+            s = 0.0
+            for j in range(k):
+                s += theta[i, j] * x[j]
+                ds[j] = x[j] + factor * ds[j]
+        var[i, n_obs] = math.exp(s) if model == EGARCH else s
+        nll[i] = 0.5 * (total + n_obs * _LOG_2PI)
+        for j in range(k):
+            grad[i, j] = g[j]
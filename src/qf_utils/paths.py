@@ -0,0 +1,493 @@
+"""Chunked, memory-bounded stochastic path generation."""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RandomState = Optional[Union[int, np.random.Generator]]
+
+
+class PathGenerator(ABC):
+    """
+    Base class for chunked path generators.
+
+    Paths are produced in blocks of at most ``chunk_size`` rows. By default
+    the same path and noise buffers are refilled for every block, so peak
+    memory is about ``2 * chunk_size * (n_steps + 1) * itemsize`` bytes
+    regardless of the total number of paths.
+
+    Subclasses implement ``_fill(out, noise, rng)``, which writes paths of
+    shape (n, n_steps + 1) into ``out`` using ``noise`` (n, n_steps) as
+    scratch space.
+
+    Parameters
+    ----------
+    T : float
+        Horizon in years
+    n_steps : int
+        Number of time steps
+    dtype : np.dtype, default=np.float64
+        np.float64 or np.float32 (halves memory and bandwidth)
+    """
+
+    def __init__(self, T: float, n_steps: int, dtype=np.float64):
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64")
+        self.T = T
+        self.n_steps = n_steps
+        self.dt = T / n_steps
+        self.dtype = dtype
+
+    @abstractmethod
+    def _fill(self, out: np.ndarray, noise: np.ndarray, rng: np.random.Generator) -> None:
+        ...
+
+    def _normals(self, rng: np.random.Generator, out: np.ndarray) -> np.ndarray:
+        return rng.standard_normal(dtype=self.dtype, out=out)
+
+    def generate_into(
+        self,
+        out: np.ndarray,
+        random_state: RandomState = None,
+        noise: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Fill a preallocated (n_paths, n_steps + 1) buffer with paths.
+
+        Parameters
+        ----------
+        out : np.ndarray
+            C-contiguous output buffer of this generator's dtype
+        random_state : int or np.random.Generator, optional
+            Seed or generator
+        noise : np.ndarray, optional
+            Scratch buffer of shape (n_paths, n_steps); allocated if omitted
+
+        Returns
+        -------
+        np.ndarray
+            ``out``
+        """
+        if out.shape[1] != self.n_steps + 1 or out.dtype != self.dtype:
+            raise ValueError(f"out must have shape (n, {self.n_steps + 1}) and dtype {self.dtype}")
+        if noise is None:
+            noise = np.empty((out.shape[0], self.n_steps), dtype=self.dtype)
+        self._fill(out, noise, np.random.default_rng(random_state))
+        return out
+
+    def generate(self, n_paths: int, random_state: RandomState = None) -> np.ndarray:
+        """Generate all paths at once (only for sizes that fit in memory)."""
+        out = np.empty((n_paths, self.n_steps + 1), dtype=self.dtype)
+        return self.generate_into(out, random_state)
+
+    def chunks(
+        self,
+        n_paths: int,
+        chunk_size: int = 50_000,
+        random_state: RandomState = None,
+        reuse_buffer: bool = True,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield paths in fixed-size blocks.
+
+        Parameters
+        ----------
+        n_paths : int
+            Total number of paths
+        chunk_size : int, default=50_000
+            Rows per block (the last block may be smaller)
+        random_state : int or np.random.Generator, optional
+            Seed or generator (one stream spans all chunks)
+        reuse_buffer : bool, default=True
+            Refill the same buffer for every block. Consumers must then
+            reduce or copy each block before requesting the next one.
+
+        Yields
+        ------
+        np.ndarray
+            Paths of shape (<= chunk_size, n_steps + 1)
+        """
+        rng = np.random.default_rng(random_state)
+        size = min(chunk_size, n_paths)
+        buffer = np.empty((size, self.n_steps + 1), dtype=self.dtype)
+        noise = np.empty((size, self.n_steps), dtype=self.dtype)
+
+        for start in range(0, n_paths, chunk_size):
+            n = min(chunk_size, n_paths - start)
+            if not reuse_buffer:
+                buffer = np.empty((size, self.n_steps + 1), dtype=self.dtype)
+            self._fill(buffer[:n], noise[:n], rng)
+            yield buffer[:n]
+
+    def reduce(
+        self,
+        payoff: Callable[[np.ndarray], np.ndarray],
+        n_paths: int,
+        chunk_size: int = 50_000,
+        random_state: RandomState = None,
+    ) -> Dict[str, float]:
+        """
+        Monte Carlo mean of a path functional, reduced chunk by chunk.
+
+        Parameters
+        ----------
+        payoff : callable
+            Maps a (n, n_steps + 1) block to n per-path values
+        n_paths : int
+            Total number of paths
+        chunk_size : int, default=50_000
+            Rows per block
+        random_state : int or np.random.Generator, optional
+            Seed or generator
+
+        Returns
+        -------
+        dict
+            'mean', 'std_error' and 'n_paths'
+
+        Examples
+        --------
+        >>> gbm = GBM(S0=100, mu=0.05, sigma=0.2, T=1.0, n_steps=252)
+        >>> gbm.reduce(european_payoff(100), n_paths=1_000_000)
+        """
+        total = 0.0
+        total_sq = 0.0
+        for block in self.chunks(n_paths, chunk_size, random_state):
+            values = np.asarray(payoff(block), dtype=np.float64)
+            total += values.sum()
+            total_sq += values @ values
+
+        mean = total / n_paths
+        variance = max(total_sq / n_paths - mean**2, 0.0) * n_paths / max(n_paths - 1, 1)
+        return {"mean": mean, "std_error": float(np.sqrt(variance / n_paths)), "n_paths": n_paths}
+
+
+class GBM(PathGenerator):
+    """
+    Geometric Brownian motion dS = mu S dt + sigma S dW (exact log-Euler).
+
+    Parameters
+    ----------
+    S0 : float
+        Initial price
+    mu : float
+        Drift (use r - q for risk-neutral pricing)
+    sigma : float
+        Volatility
+    T, n_steps, dtype
+        See ``PathGenerator``
+    """
+
+    def __init__(self, S0: float, mu: float, sigma: float, T: float, n_steps: int, dtype=np.float64):
+        super().__init__(T, n_steps, dtype)
+        self.S0 = S0
+        self.mu = mu
+        self.sigma = sigma
+
+    def _fill(self, out, noise, rng):
+        self._normals(rng, noise)
+        noise *= self.sigma * np.sqrt(self.dt)
+        noise += (self.mu - 0.5 * self.sigma**2) * self.dt
+        out[:, 0] = 0.0
+        np.cumsum(noise, axis=1, out=out[:, 1:])
+        np.exp(out, out=out)
+        out *= self.S0
+
+
+class OrnsteinUhlenbeck(PathGenerator):
+    """
+    Ornstein-Uhlenbeck process dX = kappa (theta - X) dt + sigma dW (exact).
+
+    Parameters
+    ----------
+    x0 : float
+        Initial value
+    kappa : float
+        Mean-reversion speed
+    theta : float
+        Long-run mean
+    sigma : float
+        Volatility
+    T, n_steps, dtype
+        See ``PathGenerator``
+    """
+
+    def __init__(self, x0: float, kappa: float, theta: float, sigma: float, T: float, n_steps: int, dtype=np.float64):
+        super().__init__(T, n_steps, dtype)
+        self.x0 = x0
+        self.kappa = kappa
+        self.theta = theta
+        self.sigma = sigma
+
+    def _fill(self, out, noise, rng):
+        decay = np.exp(-self.kappa * self.dt)
+        std = self.sigma * np.sqrt((1.0 - decay**2) / (2.0 * self.kappa))
+        self._normals(rng, noise)
+        noise *= std
+        noise += self.theta * (1.0 - decay)
+        out[:, 0] = self.x0
+        for j in range(self.n_steps):
+            np.multiply(out[:, j], decay, out=out[:, j + 1])
+            out[:, j + 1] += noise[:, j]
+
+
+class MertonJumpDiffusion(PathGenerator):
+    """
+    Merton jump-diffusion: GBM with compound-Poisson lognormal jumps.
+
+    The drift is compensated so that E[S_T] = S0 exp(mu T).
+
+    Parameters
+    ----------
+    S0 : float
+        Initial price
+    mu : float
+        Drift (use r - q for risk-neutral pricing)
+    sigma : float
+        Diffusion volatility
+    jump_intensity : float
+        Expected number of jumps per year
+    jump_mean : float
+        Mean of the log jump size
+    jump_std : float
+        Standard deviation of the log jump size
+    T, n_steps, dtype
+        See ``PathGenerator``
+    """
+
+    def __init__(
+        self,
+        S0: float,
+        mu: float,
+        sigma: float,
+        jump_intensity: float,
+        jump_mean: float,
+        jump_std: float,
+        T: float,
+        n_steps: int,
+        dtype=np.float64,
+    ):
+        super().__init__(T, n_steps, dtype)
+        self.S0 = S0
+        self.mu = mu
+        self.sigma = sigma
+        self.jump_intensity = jump_intensity
+        self.jump_mean = jump_mean
+        self.jump_std = jump_std
+
+    def _fill(self, out, noise, rng):
+        dt = self.dt
+        compensator = self.jump_intensity * (np.exp(self.jump_mean + 0.5 * self.jump_std**2) - 1.0)
+        drift = (self.mu - compensator - 0.5 * self.sigma**2) * dt
+
+        self._normals(rng, noise)
+        noise *= self.sigma * np.sqrt(dt)
+        noise += drift
+
+        # Given N jumps in a step, the summed log-jump is N(N m, N s^2)
+        counts = rng.poisson(self.jump_intensity * dt, size=noise.shape)
+        jumped = np.nonzero(counts)
+        n_jumps = counts[jumped]
+        noise[jumped] += n_jumps * self.jump_mean + np.sqrt(n_jumps) * self.jump_std * rng.standard_normal(
+            len(n_jumps)
+        )
+
+        out[:, 0] = 0.0
+        np.cumsum(noise, axis=1, out=out[:, 1:])
+        np.exp(out, out=out)
+        out *= self.S0
+
+
+class Heston(PathGenerator):
+    """
+    Heston stochastic volatility (full-truncation Euler on the variance).
+
+    Parameters
+    ----------
+    S0 : float
+        Initial price
+    mu : float
+        Drift (use r - q for risk-neutral pricing)
+    v0 : float
+        Initial variance
+    kappa : float
+        Variance mean-reversion speed
+    theta : float
+        Long-run variance
+    xi : float
+        Volatility of variance
+    rho : float
+        Correlation between price and variance shocks
+    T, n_steps, dtype
+        See ``PathGenerator``
+    """
+
+    def __init__(
+        self,
+        S0: float,
+        mu: float,
+        v0: float,
+        kappa: float,
+        theta: float,
+        xi: float,
+        rho: float,
+        T: float,
+        n_steps: int,
+        dtype=np.float64,
+    ):
+        super().__init__(T, n_steps, dtype)
+        self.S0 = S0
+        self.mu = mu
+        self.v0 = v0
+        self.kappa = kappa
+        self.theta = theta
+        self.xi = xi
+        self.rho = rho
+
+    def _fill(self, out, noise, rng):
+        dt = self.dt
+        sqrt_dt = np.sqrt(dt)
+        rho_c = np.sqrt(1.0 - self.rho**2)
+        n = out.shape[0]
+
+        # Reuse the noise buffer for the price shocks; variance shocks are
+        # drawn one step at a time into small per-step scratch vectors.
+        self._normals(rng, noise)
+        v = np.full(n, self.v0, dtype=self.dtype)
+        v_pos = np.empty(n, dtype=self.dtype)
+        z_v = np.empty(n, dtype=self.dtype)
+        step = np.empty(n, dtype=self.dtype)
+
+        out[:, 0] = 0.0
+        for j in range(self.n_steps):
+            np.maximum(v, 0.0, out=v_pos)
+            z_s = noise[:, j]
+            self._normals(rng, z_v)
+            # Correlate: z_v <- rho z_s + sqrt(1 - rho^2) z_v
+            z_v *= rho_c
+            z_v += self.rho * z_s
+
+            np.sqrt(v_pos, out=step)
+            np.multiply(step, z_s, out=step)
+            step *= sqrt_dt
+            step += (self.mu - 0.5 * v_pos) * dt
+            np.add(out[:, j], step, out=out[:, j + 1])
+
+            v += self.kappa * (self.theta - v_pos) * dt + self.xi * np.sqrt(v_pos) * sqrt_dt * z_v
+
+        np.exp(out, out=out)
+        out *= self.S0
+
+
+def european_payoff(K: float, option_type: str = "call") -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Terminal-value payoff for use with ``PathGenerator.reduce``.
+
+    Parameters
+    ----------
+    K : float
+        Strike
+    option_type : str, default='call'
+        'call' or 'put'
+
+    Returns
+    -------
+    callable
+        Maps a block of paths to per-path payoffs
+    """
+    if option_type not in ("call", "put"):
+        raise ValueError("option_type must be 'call' or 'put'")
+    sign = 1.0 if option_type == "call" else -1.0
+    return lambda paths: np.maximum(sign * (paths[:, -1] - K), 0.0)
+
+
+def asian_payoff(K: float, option_type: str = "call") -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Arithmetic-average payoff (average over the simulated dates, excluding S0).
+
+    Parameters
+    ----------
+    K : float
+        Strike
+    option_type : str, default='call'
+        'call' or 'put'
+
+    Returns
+    -------
+    callable
+        Maps a block of paths to per-path payoffs
+    """
+    if option_type not in ("call", "put"):
+        raise ValueError("option_type must be 'call' or 'put'")
+    sign = 1.0 if option_type == "call" else -1.0
+    return lambda paths: np.maximum(sign * (paths[:, 1:].mean(axis=1) - K), 0.0)
+
+
+def monte_carlo_price(
+    generator: PathGenerator,
+    payoff: Callable[[np.ndarray], np.ndarray],
+    r: float,
+    n_paths: int,
+    chunk_size: int = 50_000,
+    random_state: RandomState = None,
+) -> Dict[str, float]:
+    """
+    Discounted Monte Carlo price with standard error.
+
+    Parameters
+    ----------
+    generator : PathGenerator
+        Risk-neutral path generator
+    payoff : callable
+        Path functional, e.g. ``european_payoff(K)``
+    r : float
+        Risk-free rate used for discounting over ``generator.T``
+    n_paths : int
+        Total number of paths
+    chunk_size : int, default=50_000
+        Rows per block
+    random_state : int or np.random.Generator, optional
+        Seed or generator
+
+    Returns
+    -------
+    dict
+        'price', 'std_error' and 'n_paths'
+    """
+    result = generator.reduce(payoff, n_paths, chunk_size, random_state)
+    discount = np.exp(-r * generator.T)
+    return {
+        "price": discount * result["mean"],
+        "std_error": discount * result["std_error"],
+        "n_paths": n_paths,
+    }
+
+
+def main():
+    """Example: price options on 10^6 x 252 paths with bounded memory."""
+    import time
+
+    S0, K, T, r = 100.0, 100.0, 1.0, 0.05
+    n_paths, n_steps = 1_000_000, 252
+    generators = {
+        "GBM": GBM(S0, r, 0.2, T, n_steps, dtype=np.float32),
+        "Merton": MertonJumpDiffusion(S0, r, 0.15, 0.5, -0.1, 0.15, T, n_steps, dtype=np.float32),
+        "Heston": Heston(S0, r, 0.04, 2.0, 0.04, 0.3, -0.7, T, n_steps, dtype=np.float32),
+    }
+
+    print("Chunked Path Generation Example")
+    print("=" * 50)
+    for name, gen in generators.items():
+        start = time.perf_counter()
+        res = monte_carlo_price(gen, european_payoff(K), r, n_paths, chunk_size=20_000, random_state=42)
+        print(f"{name:>8}: {res['price']:.4f} +/- {res['std_error']:.4f} "
+              f"({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
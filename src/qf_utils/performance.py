@@ -5,8 +5,6 @@ from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 from .risk_metrics import RiskMetrics
 
@@ -62,6 +60,9 @@ class PerformanceAnalyzer:
 
     def plot_cumulative_returns(self, figsize=(12, 6)):
         """Plot cumulative returns."""
+        # Plotting libraries are imported on first use to keep ``import qf_utils`` light
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=figsize)
         cumulative = (1 + self.returns).cumprod()
         plt.plot(cumulative.index, cumulative.values, label="Strategy")
@@ -85,6 +86,8 @@ class PerformanceAnalyzer:
 
     def plot_drawdown(self, figsize=(12, 6)):
         """Plot drawdown over time."""
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=figsize)
         cumulative = (1 + self.returns).cumprod()
         running_max = cumulative.expanding().max()
@@ -101,6 +104,9 @@ class PerformanceAnalyzer:
 
     def plot_monthly_returns(self, figsize=(14, 6)):
         """Plot monthly returns heatmap."""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         monthly_returns = self.returns.resample("M").apply(lambda x: (1 + x).prod() - 1)
         monthly_returns.index = monthly_returns.index.to_period("M")
 
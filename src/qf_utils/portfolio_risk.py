@@ -0,0 +1,318 @@
+"""Portfolio-level Value at Risk and Expected Shortfall."""
+
+import logging
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+logger = logging.getLogger(__name__)
+
+
+def _sorted_quantile(sorted_values: np.ndarray, q: float) -> float:
+    """Linear-interpolated quantile of an already sorted array (same as np.percentile)."""
+    pos = q * (len(sorted_values) - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, len(sorted_values) - 1)
+    frac = pos - lo
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * frac
+
+
+def ewma_volatility(returns: np.ndarray, decay: float = 0.94) -> np.ndarray:
+    """
+    RiskMetrics-style EWMA volatility for every column of a return matrix.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Return matrix of shape (n_periods, n_assets)
+    decay : float, default=0.94
+        EWMA decay factor (lambda)
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_periods + 1, n_assets). Row ``t`` is the volatility
+        forecast for period ``t`` made with information up to ``t - 1``; the
+        last row is the one-step-ahead forecast.
+    """
+    returns = np.asarray(returns, dtype=float)
+    seed = returns.var(axis=0)
+    squared = np.vstack([returns**2, np.zeros((1, returns.shape[1]))])
+    # sigma2_t = decay * sigma2_{t-1} + (1 - decay) * r_{t-1}^2, run as one IIR filter
+    variance = lfilter(
+        [0.0, 1.0 - decay], [1.0, -decay], squared, axis=0, zi=seed[np.newaxis, :]
+    )[0]
+    return np.sqrt(variance)
+
+
+class PortfolioRiskEngine:
+    """
+    Portfolio VaR / ES from position weights and an asset return matrix.
+
+    The scenario P&L vector is generated once (historical, filtered historical
+    simulation or correlated Monte Carlo) and sorted once; every subsequent
+    call for a different confidence level only reads from it.
+
+    Parameters
+    ----------
+    asset_returns : pd.DataFrame or np.ndarray
+        Asset returns, one column per asset (finite; drop or fill missing
+        rows first)
+    weights : array-like
+        Portfolio weights (or position values) per asset
+    method : str, default='historical'
+        'historical', 'filtered' (volatility-rescaled historical) or 'monte-carlo'
+    n_simulations : int, default=10000
+        Number of Monte Carlo scenarios
+    decay : float, default=0.94
+        EWMA decay used by filtered historical simulation
+    tail_window : float, default=0.01
+        Fraction of scenarios on each side of the VaR quantile used to
+        estimate marginal VaR
+    random_state : int, optional
+        Seed for Monte Carlo draws
+
+    Examples
+    --------
+    >>> engine = PortfolioRiskEngine(returns_df, [0.5, 0.3, 0.2], method="filtered")
+    >>> engine.value_at_risk(0.99)
+    >>> engine.report([0.95, 0.99])
+    """
+
+    METHODS = ("historical", "filtered", "monte-carlo")
+
+    def __init__(
+        self,
+        asset_returns: Union[pd.DataFrame, np.ndarray],
+        weights: Iterable[float],
+        method: str = "historical",
+        n_simulations: int = 10000,
+        decay: float = 0.94,
+        tail_window: float = 0.01,
+        random_state: Optional[int] = None,
+    ):
+        if method not in self.METHODS:
+            raise ValueError("method must be 'historical', 'filtered', or 'monte-carlo'")
+
+        if isinstance(asset_returns, pd.DataFrame):
+            self.assets = list(asset_returns.columns)
+            returns = asset_returns.to_numpy(dtype=float)
+        else:
+            returns = np.asarray(asset_returns, dtype=float)
+            if returns.ndim != 2:
+                raise ValueError("asset_returns must be 2-dimensional (n_periods, n_assets)")
+            self.assets = list(range(returns.shape[1]))
+
+        if not np.isfinite(returns).all():
+            bad = int((~np.isfinite(returns)).any(axis=1).sum())
+            raise ValueError(f"asset_returns has {bad} rows with NaN or infinite values")
+
+        self.weights = np.asarray(list(weights), dtype=float)
+        if self.weights.shape != (returns.shape[1],):
+            raise ValueError(
+                f"Expected {returns.shape[1]} weights, got {self.weights.shape[0]}"
+            )
+        if not np.isfinite(self.weights).all():
+            raise ValueError("weights must be finite")
+
+        self.returns = returns
+        self.method = method
+        self.n_simulations = n_simulations
+        self.decay = decay
+        self.tail_window = tail_window
+        self.random_state = random_state
+
+        self._scenarios: Optional[np.ndarray] = None
+        self._pnl: Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None
+        self._sorted_pnl: Optional[np.ndarray] = None
+        self._cache: Dict[float, Dict] = {}
+
+    def _generate_scenarios(self) -> np.ndarray:
+        """Build the (n_scenarios, n_assets) matrix of asset returns."""
+        if self.method == "historical":
+            return self.returns
+
+        if self.method == "filtered":
+            sigma = ewma_volatility(self.returns, self.decay)
+            standardized = self.returns / sigma[:-1]
+            return standardized * sigma[-1]
+
+        mu = self.returns.mean(axis=0)
+        cov = np.atleast_2d(np.cov(self.returns, rowvar=False))
+        # Eigen-factor rather than Cholesky: collinear assets, or more assets
+        # than observations, leave cov only positive semi-definite
+        eigenvalues, eigenvectors = np.linalg.eigh(cov)
+        factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+        rng = np.random.default_rng(self.random_state)
+        draws = rng.standard_normal((self.n_simulations, len(mu)))
+        return mu + draws @ factor.T
+
+    @property
+    def scenarios(self) -> np.ndarray:
+        """Scenario asset returns, generated on first access."""
+        if self._scenarios is None:
+            self._scenarios = self._generate_scenarios()
+            logger.debug(f"Generated {len(self._scenarios)} {self.method} scenarios")
+        return self._scenarios
+
+    @property
+    def pnl(self) -> np.ndarray:
+        """Scenario portfolio P&L vector."""
+        if self._pnl is None:
+            self._pnl = self.scenarios @ self.weights
+            self._order = np.argsort(self._pnl, kind="stable")
+            self._sorted_pnl = self._pnl[self._order]
+        return self._pnl
+
+    def _compute(self, confidence_level: float) -> Dict:
+        """VaR, ES, marginal and component VaR for one confidence level."""
+        if confidence_level in self._cache:
+            return self._cache[confidence_level]
+
+        if not 0 < confidence_level < 1:
+            raise ValueError("confidence_level must be between 0 and 1")
+
+        self.pnl  # ensure scenarios are generated and sorted
+        sorted_pnl = self._sorted_pnl
+        n = len(sorted_pnl)
+        alpha = 1 - confidence_level
+
+        var = -_sorted_quantile(sorted_pnl, alpha)
+        n_tail = int(np.searchsorted(sorted_pnl, -var, side="right"))
+        es = -sorted_pnl[:n_tail].mean() if n_tail > 0 else 0.0
+
+        # Marginal VaR = -E[r_i | P&L = -VaR], estimated from the scenarios
+        # ranked closest to the quantile.
+        center = int(round(alpha * (n - 1)))
+        half_width = max(1, int(self.tail_window * n))
+        lo, hi = max(0, center - half_width), min(n, center + half_width + 1)
+        neighbourhood = self.scenarios[self._order[lo:hi]]
+        marginal = -neighbourhood.mean(axis=0)
+        component = self.weights * marginal
+
+        # Rescale so the Euler allocation adds up exactly to the portfolio VaR
+        total = component.sum()
+        if total != 0:
+            scale = var / total
+            marginal = marginal * scale
+            component = component * scale
+
+        result = {
+            "var": float(var),
+            "es": float(es),
+            "marginal_var": pd.Series(marginal, index=self.assets),
+            "component_var": pd.Series(component, index=self.assets),
+        }
+        self._cache[confidence_level] = result
+        return result
+
+    def value_at_risk(self, confidence_level: float = 0.95) -> float:
+        """
+        Portfolio Value at Risk.
+
+        Parameters
+        ----------
+        confidence_level : float, default=0.95
+            Confidence level (e.g., 0.95 for 95% VaR)
+
+        Returns
+        -------
+        float
+            VaR (positive value represents potential loss)
+        """
+        return self._compute(confidence_level)["var"]
+
+    def expected_shortfall(self, confidence_level: float = 0.95) -> float:
+        """
+        Portfolio Expected Shortfall (CVaR).
+
+        Parameters
+        ----------
+        confidence_level : float, default=0.95
+            Confidence level
+
+        Returns
+        -------
+        float
+            Expected loss beyond VaR (positive value)
+        """
+        return self._compute(confidence_level)["es"]
+
+    def marginal_var(self, confidence_level: float = 0.95) -> pd.Series:
+        """
+        Marginal VaR per asset (sensitivity of VaR to each weight).
+
+        Parameters
+        ----------
+        confidence_level : float, default=0.95
+            Confidence level
+
+        Returns
+        -------
+        pd.Series
+            Marginal VaR indexed by asset
+        """
+        return self._compute(confidence_level)["marginal_var"]
+
+    def component_var(self, confidence_level: float = 0.95) -> pd.Series:
+        """
+        Component VaR per asset; components sum to the portfolio VaR.
+
+        Parameters
+        ----------
+        confidence_level : float, default=0.95
+            Confidence level
+
+        Returns
+        -------
+        pd.Series
+            Component VaR indexed by asset
+        """
+        return self._compute(confidence_level)["component_var"]
+
+    def report(self, confidence_levels: Iterable[float] = (0.95, 0.99)) -> pd.DataFrame:
+        """
+        VaR, ES and component VaR for several confidence levels.
+
+        Parameters
+        ----------
+        confidence_levels : iterable of float, default=(0.95, 0.99)
+            Confidence levels to report
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per confidence level
+        """
+        rows = {}
+        for cl in confidence_levels:
+            res = self._compute(cl)
+            row = {"VaR": res["var"], "ES": res["es"]}
+            row.update({f"ComponentVaR[{a}]": v for a, v in res["component_var"].items()})
+            rows[cl] = row
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def main():
+    """Example usage of PortfolioRiskEngine."""
+    np.random.seed(42)
+    cov = np.array([[0.0004, 0.0002, 0.0001], [0.0002, 0.0009, 0.0003], [0.0001, 0.0003, 0.0016]])
+    returns = pd.DataFrame(
+        np.random.multivariate_normal([0.0005, 0.0007, 0.001], cov, 1000),
+        columns=["Bonds", "Equity", "EM"],
+    )
+    weights = [0.5, 0.3, 0.2]
+
+    print("Portfolio Risk Example")
+    print("=" * 50)
+    for method in PortfolioRiskEngine.METHODS:
+        engine = PortfolioRiskEngine(returns, weights, method=method, random_state=42)
+        print(f"\n{method}")
+        print(engine.report([0.95, 0.99]).to_string(float_format="{:.4%}".format))
+
+
+if __name__ == "__main__":
+    main()
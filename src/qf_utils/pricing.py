@@ -0,0 +1,527 @@
+"""Pricing facade dispatching to NumPy, Numba, Cython or C++ backends."""
+
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .instrumentation import stage
+from .paths import GBM, asian_payoff, european_payoff, monte_carlo_price
+from .vol_surface import black_scholes_price
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[float, np.ndarray]
+
+METHODS = ("black_scholes", "european_mc", "asian_mc")
+
+# Order used when there is no calibration: compiled code first for scalar
+# work, NumPy for anything vectorized.
+DEFAULT_PREFERENCE = ("cpp", "cython", "numba", "numpy")
+
+CALIBRATION_ENV = "QF_PRICING_CALIBRATION"
+DEFAULT_CALIBRATION_PATH = os.path.join(os.path.expanduser("~"), ".cache", "qf_utils", "pricing_calibration.json")
+
+
+@dataclass
+class PricingBackend:
+    """
+    One pricing implementation behind a common signature.
+
+    Parameters
+    ----------
+    name : str
+        Backend identifier used for pinning and reporting
+    black_scholes : callable, optional
+        ``f(S, K, T, r, sigma, option_type) -> np.ndarray`` over broadcast arrays
+    european_mc : callable, optional
+        ``f(S0, K, T, r, sigma, n_simulations, option_type, seed) -> float``
+    asian_mc : callable, optional
+        ``f(S0, K, T, r, sigma, n_simulations, n_steps, option_type, seed) -> float``
+    compiled : bool, default=False
+        Whether the backend runs native code
+    """
+
+    name: str
+    black_scholes: Optional[Callable] = None
+    european_mc: Optional[Callable] = None
+    asian_mc: Optional[Callable] = None
+    compiled: bool = False
+
+    def supports(self, method: str) -> bool:
+        return getattr(self, method, None) is not None
+
+
+def _vectorize_scalar(call: Callable, put: Callable) -> Callable:
+    """Loop a scalar (S, K, T, r, sigma) pricer over broadcast arrays."""
+
+    def price(S, K, T, r, sigma, option_type="call"):
+        S, K, T, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S, K, T, sigma)))
+        func = call if option_type == "call" else put
+        out = np.fromiter(
+            (func(s, k, t, r, v) for s, k, t, v in zip(S.ravel(), K.ravel(), T.ravel(), sigma.ravel())),
+            dtype=float,
+            count=S.size,
+        )
+        return out.reshape(S.shape)
+
+    return price
+
+
+def _numpy_backend() -> PricingBackend:
+    def european(S0, K, T, r, sigma, n_simulations, option_type="call", seed=None):
+        gen = GBM(S0, r, sigma, T, 1)
+        return monte_carlo_price(gen, european_payoff(K, option_type), r, n_simulations, random_state=seed)["price"]
+
+    def asian(S0, K, T, r, sigma, n_simulations, n_steps, option_type="call", seed=None):
+        gen = GBM(S0, r, sigma, T, n_steps)
+        return monte_carlo_price(gen, asian_payoff(K, option_type), r, n_simulations, random_state=seed)["price"]
+
+    return PricingBackend(
+        "numpy",
+        black_scholes=lambda S, K, T, r, sigma, option_type="call": black_scholes_price(
+            S, K, T, r, sigma, option_type=option_type
+        ),
+        european_mc=european,
+        asian_mc=asian,
+    )
+
+
+def _import_first(names: Sequence[str]):
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+def _cython_backend() -> Optional[PricingBackend]:
+    bs = _import_first(["src.cython_modules.black_scholes_cy", "black_scholes_cy"])
+    mc = _import_first(["src.cython_modules.monte_carlo_cy", "monte_carlo_cy"])
+    if bs is None and mc is None:
+        return None
+    # monte_carlo_cy seeds libc rand() at import, so ``seed`` is ignored
+    return PricingBackend(
+        "cython",
+        black_scholes=_vectorize_scalar(bs.call_price, bs.put_price) if bs else None,
+        european_mc=(
+            lambda S0, K, T, r, sigma, n, option_type="call", seed=None: mc.monte_carlo_option_price(
+                S0, K, T, r, sigma, int(n), option_type
+            )
+        ) if mc else None,
+        asian_mc=(
+            lambda S0, K, T, r, sigma, n, n_steps, option_type="call", seed=None: mc.monte_carlo_asian_option(
+                S0, K, T, r, sigma, int(n), int(n_steps), option_type
+            )
+        ) if mc else None,
+        compiled=True,
+    )
+
+
+def _cpp_backend() -> Optional[PricingBackend]:
+    cpp = _import_first(["option_pricing_cpp"])
+    if cpp is None:
+        return None
+
+    def engine(seed):
+        return cpp.MonteCarlo(42 if seed is None else int(seed))
+
+    return PricingBackend(
+        "cpp",
+        black_scholes=_vectorize_scalar(cpp.BlackScholes.call_price, cpp.BlackScholes.put_price),
+        european_mc=lambda S0, K, T, r, sigma, n, option_type="call", seed=None: engine(seed).european_option(
+            S0, K, T, r, sigma, int(n), option_type == "call"
+        ),
+        asian_mc=lambda S0, K, T, r, sigma, n, n_steps, option_type="call", seed=None: engine(seed).asian_option(
+            S0, K, T, r, sigma, int(n), int(n_steps), option_type == "call"
+        ),
+        compiled=True,
+    )
+
+
+def _numba_backend() -> Optional[PricingBackend]:
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    # numba itself takes most of a second to import, so the kernels module is
+    # loaded on the first call rather than at discovery
+    def kernels():
+        return importlib.import_module(".numba_pricing", __package__)
+
+    return PricingBackend(
+        "numba",
+        black_scholes=lambda S, K, T, r, sigma, option_type="call": kernels().black_scholes(
+            S, K, T, r, sigma, option_type
+        ),
+        european_mc=lambda S0, K, T, r, sigma, n, option_type="call", seed=None: kernels().monte_carlo_option_price(
+            S0, K, T, r, sigma, n, option_type, seed
+        ),
+        asian_mc=lambda S0, K, T, r, sigma, n, n_steps, option_type="call", seed=None: (
+            kernels().monte_carlo_asian_option(S0, K, T, r, sigma, n, n_steps, option_type, seed)
+        ),
+        compiled=True,
+    )
+
+
+_BACKENDS: Dict[str, PricingBackend] = {}
+
+
+def register_backend(backend: PricingBackend) -> None:
+    """Add (or replace) a backend in the registry shared by all engines."""
+    _BACKENDS[backend.name] = backend
+    logger.debug(f"Registered pricing backend {backend.name!r}")
+
+
+def available_backends() -> List[str]:
+    """Names of the backends discovered at import or registered since."""
+    return list(_BACKENDS)
+
+
+def _discover_backends() -> None:
+    register_backend(_numpy_backend())
+    for factory in (_numba_backend, _cython_backend, _cpp_backend):
+        try:
+            backend = factory()
+        except Exception as exc:  # a broken build should not break the import
+            logger.warning(f"Skipping pricing backend from {factory.__name__}: {exc}")
+            continue
+        if backend is not None:
+            register_backend(backend)
+
+
+_discover_backends()
+
+
+def _estimate_time(points: Dict[str, float], batch_size: int) -> float:
+    """Log-log interpolation of measured timings; linear per-item cost beyond the largest size."""
+    sizes = np.array(sorted(int(s) for s in points), dtype=float)
+    times = np.array([points[str(int(s))] for s in sizes])
+    if batch_size >= sizes[-1]:
+        return float(times[-1] * batch_size / sizes[-1])
+    return float(np.exp(np.interp(np.log(batch_size), np.log(sizes), np.log(np.maximum(times, 1e-12)))))
+
+
+class PricingEngine:
+    """
+    Single entry point for Black-Scholes and Monte Carlo pricing.
+
+    Each call runs on the pinned backend if there is one. Otherwise it runs on
+    the backend that the stored calibration says is fastest for the batch size
+    (number of options for Black-Scholes, number of paths for Monte Carlo).
+    The backend that served the latest call is kept in ``last_backend``, and
+    ``usage`` counts calls per (method, backend).
+
+    Parameters
+    ----------
+    backend : str, optional
+        Backend to pin; ``None`` selects automatically
+    calibration_path : str, optional
+        JSON file with timings from ``calibrate``. Defaults to
+        ``$QF_PRICING_CALIBRATION`` or ``~/.cache/qf_utils/pricing_calibration.json``
+
+    Examples
+    --------
+    >>> engine = PricingEngine()
+    >>> engine.black_scholes(100, [90, 100, 110], 1.0, 0.05, 0.2)
+    >>> engine.last_backend
+    'numpy'
+    """
+
+    def __init__(self, backend: Optional[str] = None, calibration_path: Optional[str] = None):
+        self.calibration_path = calibration_path or os.environ.get(CALIBRATION_ENV, DEFAULT_CALIBRATION_PATH)
+        self.calibration = self._load_calibration()
+        self.pinned: Optional[str] = None
+        self.pin(backend)
+        self.last_backend: Optional[str] = None
+        self.usage: Counter = Counter()
+
+    # ------------------------------------------------------------------
+    # Backend selection
+    # ------------------------------------------------------------------
+
+    def pin(self, backend: Optional[str]) -> None:
+        """Force every call onto ``backend`` (``None`` restores automatic selection)."""
+        if backend is not None and backend not in _BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; available: {available_backends()}")
+        self.pinned = backend
+
+    def _load_calibration(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        if not os.path.exists(self.calibration_path):
+            return {}
+        try:
+            with open(self.calibration_path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable pricing calibration {self.calibration_path}: {exc}")
+            return {}
+
+    def select_backend(self, method: str, batch_size: int) -> str:
+        """
+        Backend that will serve ``method`` for ``batch_size`` items.
+
+        Parameters
+        ----------
+        method : str
+            One of ``METHODS``
+        batch_size : int
+            Options in the batch (Black-Scholes) or simulated paths (Monte Carlo)
+
+        Returns
+        -------
+        str
+            Backend name
+        """
+        if method not in METHODS:
+            raise ValueError(f"method must be one of {METHODS}")
+        if self.pinned is not None:
+            if not _BACKENDS[self.pinned].supports(method):
+                raise ValueError(f"Backend {self.pinned!r} does not implement {method}")
+            return self.pinned
+
+        candidates = [name for name, b in _BACKENDS.items() if b.supports(method)]
+        timings = self.calibration.get(method, {})
+        measured = {name: _estimate_time(timings[name], batch_size) for name in candidates if timings.get(name)}
+        if measured:
+            return min(measured, key=measured.get)
+
+        if method == "black_scholes" and batch_size > 1:
+            return "numpy"
+        for name in DEFAULT_PREFERENCE:
+            if name in candidates:
+                return name
+        return candidates[0]
+
+    def _dispatch(self, method: str, batch_size: int, *args, backend: Optional[str] = None, **kwargs):
+        if backend is not None and backend not in _BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; available: {available_backends()}")
+        name = backend or self.select_backend(method, batch_size)
+        func = getattr(_BACKENDS[name], method)
+        if func is None:
+            raise ValueError(f"Backend {name!r} does not implement {method}")
+        with stage(f"pricing.{method}.{name}"):
+            result = func(*args, **kwargs)
+        self.last_backend = name
+        self.usage[(method, name)] += 1
+        logger.debug(f"{method} (batch {batch_size}) served by {name}")
+        return result
+
+    # ------------------------------------------------------------------
+    # Pricing
+    # ------------------------------------------------------------------
+
+    def black_scholes(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: float,
+        sigma: ArrayLike,
+        option_type: str = "call",
+        backend: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Black-Scholes prices over broadcast inputs.
+
+        Parameters
+        ----------
+        S, K, T, sigma : float or np.ndarray
+            Spot, strike, maturity and volatility
+        r : float
+            Risk-free rate
+        option_type : str, default='call'
+            'call' or 'put'
+        backend : str, optional
+            Override the engine's choice for this call only
+
+        Returns
+        -------
+        np.ndarray
+            Prices with the broadcast shape of the inputs
+        """
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+        batch_size = int(np.broadcast(*(np.asarray(x) for x in (S, K, T, sigma))).size)
+        return np.asarray(self._dispatch("black_scholes", batch_size, S, K, T, r, sigma, option_type, backend=backend))
+
+    def european_option_mc(
+        self,
+        S0: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        n_simulations: int,
+        option_type: str = "call",
+        seed: Optional[int] = None,
+        backend: Optional[str] = None,
+    ) -> float:
+        """
+        Monte Carlo price of a European option under GBM.
+
+        Parameters
+        ----------
+        S0, K, T, r, sigma : float
+            Spot, strike, maturity, risk-free rate and volatility
+        n_simulations : int
+            Number of paths
+        option_type : str, default='call'
+            'call' or 'put'
+        seed : int, optional
+            Seed (ignored by the Cython backend, which seeds libc ``rand`` itself)
+        backend : str, optional
+            Override the engine's choice for this call only
+
+        Returns
+        -------
+        float
+            Discounted price estimate
+        """
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+        return float(self._dispatch(
+            "european_mc", n_simulations, S0, K, T, r, sigma, n_simulations, option_type, seed, backend=backend
+        ))
+
+    def asian_option_mc(
+        self,
+        S0: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        n_simulations: int,
+        n_steps: int,
+        option_type: str = "call",
+        seed: Optional[int] = None,
+        backend: Optional[str] = None,
+    ) -> float:
+        """
+        Monte Carlo price of an arithmetic-average Asian option under GBM.
+
+        Parameters
+        ----------
+        S0, K, T, r, sigma : float
+            Spot, strike, maturity, risk-free rate and volatility
+        n_simulations : int
+            Number of paths
+        n_steps : int
+            Averaging dates
+        option_type : str, default='call'
+            'call' or 'put'
+        seed : int, optional
+            Seed (ignored by the Cython backend)
+        backend : str, optional
+            Override the engine's choice for this call only
+
+        Returns
+        -------
+        float
+            Discounted price estimate
+        """
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+        return float(self._dispatch(
+            "asian_mc", n_simulations, S0, K, T, r, sigma, n_simulations, n_steps, option_type, seed,
+            backend=backend,
+        ))
+
+    # ------------------------------------------------------------------
+    # Calibration
+    # ------------------------------------------------------------------
+
+    def calibrate(
+        self,
+        batch_sizes: Iterable[int] = (1, 10, 100, 1_000, 10_000),
+        path_counts: Iterable[int] = (1_000, 10_000, 100_000),
+        repeats: int = 3,
+        save: bool = True,
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Time every backend on every method and store the best of ``repeats`` runs.
+
+        Parameters
+        ----------
+        batch_sizes : iterable of int
+            Option counts for Black-Scholes
+        path_counts : iterable of int
+            Path counts for the Monte Carlo methods
+        repeats : int, default=3
+            Runs per measurement (the minimum is kept)
+        save : bool, default=True
+            Write the result to ``calibration_path``
+
+        Returns
+        -------
+        dict
+            ``{method: {backend: {size: seconds}}}``
+        """
+        rng = np.random.default_rng(0)
+        calibration: Dict[str, Dict[str, Dict[str, float]]] = {m: {} for m in METHODS}
+
+        def best_time(func, *args):
+            # Untimed first call so JIT compilation or cache loading is not measured
+            func(*args)
+            elapsed = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                func(*args)
+                elapsed.append(time.perf_counter() - start)
+            return min(elapsed)
+
+        for name, backend in _BACKENDS.items():
+            if backend.black_scholes is not None:
+                calibration["black_scholes"][name] = {}
+                for n in batch_sizes:
+                    K = rng.uniform(80, 120, n)
+                    T = rng.uniform(0.1, 2.0, n)
+                    calibration["black_scholes"][name][str(n)] = best_time(
+                        backend.black_scholes, 100.0, K, T, 0.05, 0.2, "call"
+                    )
+            for method, extra in (("european_mc", ()), ("asian_mc", (12,))):
+                func = getattr(backend, method)
+                if func is None:
+                    continue
+                calibration[method][name] = {
+                    str(n): best_time(func, 100.0, 100.0, 1.0, 0.05, 0.2, n, *extra) for n in path_counts
+                }
+
+        self.calibration = calibration
+        if save:
+            os.makedirs(os.path.dirname(os.path.abspath(self.calibration_path)), exist_ok=True)
+            with open(self.calibration_path, "w") as f:
+                json.dump(calibration, f, indent=2)
+            logger.info(f"Saved pricing calibration to {self.calibration_path}")
+        return calibration
+
+
+def main():
+    """Example usage of the pricing facade."""
+    engine = PricingEngine()
+    print(f"Available backends: {available_backends()}")
+
+    strikes = np.linspace(80, 120, 5)
+    prices = engine.black_scholes(100.0, strikes, 1.0, 0.05, 0.2)
+    print(f"Black-Scholes calls {np.round(prices, 4)} via {engine.last_backend}")
+
+    price = engine.european_option_mc(100.0, 100.0, 1.0, 0.05, 0.2, 200_000, seed=42)
+    print(f"European MC call {price:.4f} via {engine.last_backend}")
+
+    price = engine.asian_option_mc(100.0, 100.0, 1.0, 0.05, 0.2, 100_000, 12, seed=42)
+    print(f"Asian MC call {price:.4f} via {engine.last_backend}")
+
+    print("\nCalibrating (not saved)...")
+    engine.calibrate(save=False)
+    for n in (1, 100, 10_000):
+        print(f"  Black-Scholes batch of {n}: {engine.select_backend('black_scholes', n)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,24 @@ from typing import Optional
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+
+from .instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
 
+def _norm_ppf(q: float) -> float:
+    # scipy.stats takes over a second to import; defer it to the first parametric VaR
+    from scipy.stats import norm
+
+    return norm.ppf(q)
+
+
 class RiskMetrics:
     """Calculate various risk metrics for financial returns."""
 
     @staticmethod
+    @instrumented("risk_metrics.sharpe_ratio")
     def sharpe_ratio(
         returns: pd.Series,
         risk_free_rate: float = 0.0,
@@ -47,6 +56,7 @@ class RiskMetrics:
         return np.sqrt(periods_per_year) * excess_returns.mean() / excess_returns.std()
 
     @staticmethod
+    @instrumented("risk_metrics.sortino_ratio")
     def sortino_ratio(
         returns: pd.Series,
         risk_free_rate: float = 0.0,
@@ -79,6 +89,7 @@ class RiskMetrics:
         return np.sqrt(periods_per_year) * excess_returns.mean() / downside_std
 
     @staticmethod
+    @instrumented("risk_metrics.max_drawdown")
     def max_drawdown(returns: pd.Series) -> float:
         """
         Calculate maximum drawdown.
@@ -104,6 +115,7 @@ class RiskMetrics:
         return abs(drawdown.min())
 
     @staticmethod
+    @instrumented("risk_metrics.calmar_ratio")
     def calmar_ratio(
         returns: pd.Series,
         periods_per_year: int = 252,
@@ -132,6 +144,7 @@ class RiskMetrics:
         return annual_return / mdd
 
     @staticmethod
+    @instrumented("risk_metrics.value_at_risk")
     def value_at_risk(
         returns: pd.Series,
         confidence_level: float = 0.95,
@@ -165,7 +178,7 @@ class RiskMetrics:
         elif method == "parametric":
             mu = returns.mean()
             sigma = returns.std()
-            z_score = stats.norm.ppf(1 - confidence_level)
+            z_score = _norm_ppf(1 - confidence_level)
             return -(mu + sigma * z_score)
         
         elif method == "cornish-fisher":
@@ -174,7 +187,7 @@ class RiskMetrics:
             skew = returns.skew()
             kurt = returns.kurtosis()
             
-            z = stats.norm.ppf(1 - confidence_level)
+            z = _norm_ppf(1 - confidence_level)
             z_cf = (z +
                     (z**2 - 1) * skew / 6 +
                     (z**3 - 3*z) * kurt / 24 -
@@ -186,6 +199,7 @@ class RiskMetrics:
             raise ValueError("method must be 'historical', 'parametric', or 'cornish-fisher'")
 
     @staticmethod
+    @instrumented("risk_metrics.conditional_value_at_risk")
     def conditional_value_at_risk(
         returns: pd.Series,
         confidence_level: float = 0.95,
@@ -215,6 +229,7 @@ class RiskMetrics:
         return -tail_losses.mean() if len(tail_losses) > 0 else 0.0
 
     @staticmethod
+    @instrumented("risk_metrics.volatility")
     def volatility(
         returns: pd.Series,
         periods_per_year: int = 252,
@@ -237,6 +252,7 @@ class RiskMetrics:
         return returns.std() * np.sqrt(periods_per_year)
 
     @staticmethod
+    @instrumented("risk_metrics.beta")
     def beta(
         returns: pd.Series,
         market_returns: pd.Series,
@@ -0,0 +1,553 @@
+"""Implied volatility surface with batched inversion and SVI slice fits."""
+
+import logging
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import least_squares
+from scipy.special import ndtr
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[float, np.ndarray]
+
+SVI_PARAMS = ("a", "b", "rho", "m", "sigma")
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+def black_scholes_price(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: float,
+    sigma: ArrayLike,
+    q: float = 0.0,
+    option_type: Union[str, np.ndarray] = "call",
+) -> np.ndarray:
+    """
+    Vectorized Black-Scholes price.
+
+    Parameters
+    ----------
+    S, K, T, sigma : float or np.ndarray
+        Spot, strike, maturity and volatility (broadcast together)
+    r : float
+        Risk-free rate
+    q : float, default=0.0
+        Dividend yield
+    option_type : str or np.ndarray, default='call'
+        'call', 'put', or an array of those labels
+
+    Returns
+    -------
+    np.ndarray
+        Option prices
+    """
+    S, K, T, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S, K, T, sigma)))
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    df_q, df_r = np.exp(-q * T), np.exp(-r * T)
+    call = S * df_q * ndtr(d1) - K * df_r * ndtr(d2)
+    if isinstance(option_type, str):
+        if option_type == "call":
+            return call
+        if option_type == "put":
+            return call - S * df_q + K * df_r
+        raise ValueError("option_type must be 'call' or 'put'")
+    is_put = np.asarray(option_type) == "put"
+    return np.where(is_put, call - S * df_q + K * df_r, call)
+
+
+def black_scholes_vega(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: float,
+    sigma: ArrayLike,
+    q: float = 0.0,
+) -> np.ndarray:
+    """Vectorized Black-Scholes vega (same for calls and puts)."""
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    return S * np.exp(-q * T) * _norm_pdf(d1) * sqrt_T
+
+
+def implied_volatility(
+    prices: ArrayLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: float,
+    q: float = 0.0,
+    option_type: Union[str, np.ndarray] = "call",
+    tol: float = 1e-10,
+    max_iter: int = 50,
+) -> np.ndarray:
+    """
+    Batched implied volatility inversion.
+
+    Safeguarded Newton iteration run on all quotes at once: each quote keeps
+    a [low, high] bracket and falls back to bisection whenever the Newton
+    step leaves it, so convergence is guaranteed for attainable prices.
+
+    Parameters
+    ----------
+    prices : float or np.ndarray
+        Option prices
+    S, K, T : float or np.ndarray
+        Spot, strike and maturity
+    r : float
+        Risk-free rate
+    q : float, default=0.0
+        Dividend yield
+    option_type : str or np.ndarray, default='call'
+        'call', 'put', or an array of labels
+    tol : float, default=1e-10
+        Absolute price tolerance
+    max_iter : int, default=50
+        Maximum iterations
+
+    Returns
+    -------
+    np.ndarray
+        Implied volatilities (NaN where the price is outside no-arbitrage bounds)
+
+    Examples
+    --------
+    >>> implied_volatility([10.45, 5.57], 100, 100, 1.0, 0.05, option_type=["call", "put"])
+    """
+    prices, S, K, T = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (prices, S, K, T)))
+    if not isinstance(option_type, str):
+        option_type = np.broadcast_to(np.asarray(option_type), prices.shape)
+
+    df_q, df_r = S * np.exp(-q * T), K * np.exp(-r * T)
+    is_put = (option_type == "put") if not isinstance(option_type, str) else option_type == "put"
+    lower = np.where(is_put, np.maximum(df_r - df_q, 0.0), np.maximum(df_q - df_r, 0.0))
+    upper = np.where(is_put, df_r, df_q)
+    valid = (prices > lower) & (prices < upper)
+
+    lo = np.full(prices.shape, 1e-6)
+    hi = np.full(prices.shape, 10.0)
+    # Brenner-Subrahmanyam ATM approximation as a starting point
+    sigma = np.clip(np.sqrt(2.0 * np.pi / T) * prices / S, 0.05, 2.0)
+
+    for _ in range(max_iter):
+        diff = black_scholes_price(S, K, T, r, sigma, q, option_type) - prices
+        active = valid & (np.abs(diff) > tol)
+        if not active.any():
+            break
+        hi = np.where(diff > 0, sigma, hi)
+        lo = np.where(diff < 0, sigma, lo)
+        vega = black_scholes_vega(S, K, T, r, sigma, q)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = sigma - diff / vega
+        inside = (newton > lo) & (newton < hi) & np.isfinite(newton)
+        sigma = np.where(active, np.where(inside, newton, 0.5 * (lo + hi)), sigma)
+
+    return np.where(valid, sigma, np.nan)
+
+
+def svi_total_variance(k: ArrayLike, a: float, b: float, rho: float, m: float, sigma: float) -> np.ndarray:
+    """
+    Raw SVI total implied variance w(k) = a + b (rho (k - m) + sqrt((k - m)^2 + sigma^2)).
+
+    Parameters
+    ----------
+    k : float or np.ndarray
+        Log-moneyness ln(K / F)
+    a, b, rho, m, sigma : float
+        Raw SVI parameters
+
+    Returns
+    -------
+    np.ndarray
+        Total implied variance sigma_BS^2 * T
+    """
+    x = np.asarray(k) - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+def _svi_residuals(params, k, w, weights):
+    return (svi_total_variance(k, *params) - w) * weights
+
+
+def _svi_jacobian(params, k, w, weights):
+    a, b, rho, m, sigma = params
+    x = k - m
+    root = np.sqrt(x * x + sigma * sigma)
+    jac = np.empty((len(k), 5))
+    jac[:, 0] = 1.0
+    jac[:, 1] = rho * x + root
+    jac[:, 2] = b * x
+    jac[:, 3] = -b * (rho + x / root)
+    jac[:, 4] = b * sigma / root
+    return jac * weights[:, np.newaxis]
+
+
+def fit_svi_slice(
+    k: np.ndarray,
+    total_variance: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+    initial_guess: Optional[Sequence[float]] = None,
+    max_nfev: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Fit raw SVI parameters to one expiry slice.
+
+    Bounds enforce b >= 0, |rho| < 1 and sigma > 0; a non-negative minimum
+    variance (a + b sigma sqrt(1 - rho^2) >= 0) is enforced by clipping ``a``.
+
+    Parameters
+    ----------
+    k : np.ndarray
+        Log-moneyness of the quotes
+    total_variance : np.ndarray
+        Market total implied variance (iv^2 * T)
+    weights : np.ndarray, optional
+        Residual weights (e.g. vega)
+    initial_guess : sequence of float, optional
+        Warm start (a, b, rho, m, sigma)
+    max_nfev : int, optional
+        Cap on function evaluations (useful for warm-started refits)
+
+    Returns
+    -------
+    np.ndarray
+        Fitted (a, b, rho, m, sigma)
+    """
+    k = np.asarray(k, dtype=float)
+    w = np.asarray(total_variance, dtype=float)
+    weights = np.ones_like(w) if weights is None else np.asarray(weights, dtype=float)
+
+    if initial_guess is None:
+        initial_guess = (0.5 * w.min(), 0.1, -0.3, 0.0, 0.1)
+
+    lower = [-np.inf, 0.0, -0.999, 2 * k.min() - k.max() - 1.0, 1e-4]
+    upper = [w.max(), np.inf, 0.999, 2 * k.max() - k.min() + 1.0, 5.0]
+    x0 = np.clip(initial_guess, np.add(lower, 1e-12), np.subtract(upper, 1e-12))
+
+    result = least_squares(
+        _svi_residuals, x0, jac=_svi_jacobian, bounds=(lower, upper),
+        args=(k, w, weights), max_nfev=max_nfev,
+    )
+    a, b, rho, m, sigma = result.x
+    a = max(a, -b * sigma * np.sqrt(1.0 - rho * rho))
+    return np.array([a, b, rho, m, sigma])
+
+
+def refine_svi_slice(
+    k: np.ndarray,
+    total_variance: np.ndarray,
+    params: Sequence[float],
+    n_iter: int = 8,
+    damping: float = 1e-6,
+) -> np.ndarray:
+    """
+    Polish an existing SVI fit with a few Levenberg-Marquardt steps.
+
+    Intended for intraday updates where only a handful of quotes moved and
+    the previous parameters are already close; every step is a single 5x5
+    linear solve, avoiding the set-up cost of a general-purpose optimizer.
+
+    Parameters
+    ----------
+    k : np.ndarray
+        Log-moneyness of the quotes
+    total_variance : np.ndarray
+        Market total implied variance
+    params : sequence of float
+        Current (a, b, rho, m, sigma)
+    n_iter : int, default=8
+        Maximum number of steps
+    damping : float, default=1e-6
+        Initial Levenberg-Marquardt damping
+
+    Returns
+    -------
+    np.ndarray
+        Refined (a, b, rho, m, sigma)
+    """
+    x = np.array(params, dtype=float)
+    ones = np.ones_like(total_variance)
+    res = _svi_residuals(x, k, total_variance, ones)
+    cost = res @ res
+    for _ in range(n_iter):
+        jac = _svi_jacobian(x, k, total_variance, ones)
+        jtj = jac.T @ jac
+        step = np.linalg.solve(jtj + damping * np.diag(np.diag(jtj) + 1e-12), -jac.T @ res)
+        candidate = x + step
+        candidate[1] = max(candidate[1], 0.0)
+        candidate[2] = min(max(candidate[2], -0.999), 0.999)
+        candidate[4] = max(candidate[4], 1e-4)
+        new_res = _svi_residuals(candidate, k, total_variance, ones)
+        new_cost = new_res @ new_res
+        if new_cost < cost:
+            x, res, cost = candidate, new_res, new_cost
+            damping *= 0.1
+        else:
+            damping *= 10.0
+        if cost < 1e-20:
+            break
+    a, b, rho, m, sigma = x
+    x[0] = max(a, -b * sigma * np.sqrt(1.0 - rho * rho))
+    return x
+
+
+class VolatilitySurface:
+    """
+    Implied volatility surface built from option quotes.
+
+    Quotes are inverted to implied vols in one batched call, each expiry is
+    fitted with raw SVI, and the fitted parameters are stored in a
+    coefficient table (one row per expiry). ``vol`` and ``price`` evaluate
+    that table for arbitrary (K, T) arrays without re-solving anything:
+    total variance is interpolated linearly in T between slices, which
+    preserves the absence of calendar arbitrage whenever the slices
+    themselves do not cross (see ``calendar_violations``).
+
+    Quote data is kept as flat NumPy arrays with a (maturity, strike,
+    option_type) lookup table, so ``update_quotes`` touches only the changed entries and
+    refits only their slices with a few warm-started Levenberg-Marquardt
+    steps.
+
+    Parameters
+    ----------
+    quotes : pd.DataFrame
+        Columns 'strike', 'maturity', 'price' and optionally 'option_type'
+        (default 'call'); each (maturity, strike, option_type) at most once
+    S0 : float
+        Spot price
+    r : float
+        Risk-free rate
+    q : float, default=0.0
+        Dividend yield
+
+    Examples
+    --------
+    >>> surface = VolatilitySurface(quotes, S0=100, r=0.03)
+    >>> surface.vol([95, 100, 105], 0.5)
+    >>> surface.update_quotes(changed_quotes)
+    """
+
+    def __init__(self, quotes: pd.DataFrame, S0: float, r: float, q: float = 0.0):
+        missing = {"strike", "maturity", "price"} - set(quotes.columns)
+        if missing:
+            raise ValueError(f"quotes is missing columns: {sorted(missing)}")
+
+        self.S0 = S0
+        self.r = r
+        self.q = q
+
+        quotes = quotes.sort_values(["maturity", "strike"], kind="stable").reset_index(drop=True)
+        self.maturity = quotes["maturity"].to_numpy(dtype=float, copy=True)
+        self.strike = quotes["strike"].to_numpy(dtype=float, copy=True)
+        self.price_quotes = quotes["price"].to_numpy(dtype=float, copy=True)
+        if "option_type" in quotes.columns:
+            self.option_type = quotes["option_type"].to_numpy().astype(str)
+        else:
+            self.option_type = np.full(len(quotes), "call")
+        self.iv = np.full(len(quotes), np.nan)
+
+        self.maturities = np.unique(self.maturity)
+        self._slice_of = np.searchsorted(self.maturities, self.maturity)
+        self._slice_rows = [np.flatnonzero(self._slice_of == i) for i in range(len(self.maturities))]
+        self._row_of = {key: i for i, key in enumerate(zip(self.maturity, self.strike, self.option_type))}
+        if len(self._row_of) != len(quotes):
+            raise ValueError("quotes has duplicate (maturity, strike, option_type) entries")
+
+        self.coefficients = np.zeros((len(self.maturities), 5))
+        self._invert(np.arange(len(quotes)))
+        for i in range(len(self.maturities)):
+            self._fit_slice(i)
+        logger.info(f"Built volatility surface with {len(self.maturities)} slices")
+
+    def forward(self, T: ArrayLike) -> np.ndarray:
+        """Forward price for maturity T."""
+        return self.S0 * np.exp((self.r - self.q) * np.asarray(T, dtype=float))
+
+    def _invert(self, rows: np.ndarray) -> None:
+        """Batched implied-vol inversion for the given quote rows."""
+        self.iv[rows] = implied_volatility(
+            self.price_quotes[rows], self.S0, self.strike[rows], self.maturity[rows],
+            self.r, self.q, self.option_type[rows],
+        )
+
+    def _fit_slice(self, i: int, warm_start: bool = False) -> None:
+        T = self.maturities[i]
+        rows = self._slice_rows[i]
+        rows = rows[np.isfinite(self.iv[rows])]
+        if len(rows) < 5:
+            raise ValueError(f"Need at least 5 valid quotes to fit SVI at T={T}")
+        k = np.log(self.strike[rows] / self.forward(T))
+        w = self.iv[rows] ** 2 * T
+        if warm_start:
+            self.coefficients[i] = refine_svi_slice(k, w, self.coefficients[i])
+        else:
+            self.coefficients[i] = fit_svi_slice(k, w)
+
+    def update_quotes(self, quotes: pd.DataFrame) -> None:
+        """
+        Incrementally refit after a subset of quotes changed.
+
+        Only the changed quotes are re-inverted and only the expiries they
+        belong to are refitted, warm-started from the current coefficients.
+
+        Parameters
+        ----------
+        quotes : pd.DataFrame
+            Columns 'strike', 'maturity', 'price' (existing quotes only), and
+            'option_type' when the surface holds both calls and puts
+        """
+        if "option_type" in quotes.columns:
+            option_type = quotes["option_type"].to_numpy().astype(str)
+        else:
+            kinds = np.unique(self.option_type)
+            if len(kinds) > 1:
+                raise ValueError("quotes must have an 'option_type' column when the surface holds calls and puts")
+            option_type = np.full(len(quotes), kinds[0])
+        keys = zip(quotes["maturity"].to_numpy(dtype=float), quotes["strike"].to_numpy(dtype=float), option_type)
+        try:
+            rows = np.array([self._row_of[key] for key in keys], dtype=int)
+        except KeyError as e:
+            raise KeyError(f"Unknown quote (maturity, strike, option_type): {e.args[0]}") from None
+
+        self.price_quotes[rows] = quotes["price"].to_numpy(dtype=float)
+        self._invert(rows)
+
+        for i in np.unique(self._slice_of[rows]):
+            self._fit_slice(int(i), warm_start=True)
+
+    def total_variance(self, K: ArrayLike, T: ArrayLike) -> np.ndarray:
+        """
+        Total implied variance w(K, T) from the coefficient table.
+
+        Parameters
+        ----------
+        K, T : float or np.ndarray
+            Strikes and maturities (broadcast together)
+
+        Returns
+        -------
+        np.ndarray
+            Total variance
+        """
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        k = np.log(K / self.forward(T))
+        mats = self.maturities
+
+        hi = np.clip(np.searchsorted(mats, T), 0, len(mats) - 1)
+        lo = np.clip(hi - 1, 0, len(mats) - 1)
+        w_lo = svi_total_variance(k, *self.coefficients[lo].T)
+        w_hi = svi_total_variance(k, *self.coefficients[hi].T)
+
+        span = mats[hi] - mats[lo]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(span > 0, (T - mats[lo]) / span, 0.0)
+        w = w_lo + frac * (w_hi - w_lo)
+
+        # Flat implied vol outside the quoted maturity range
+        w = np.where(T < mats[0], w_hi * T / mats[0], w)
+        w = np.where(T > mats[-1], w_hi * T / mats[-1], w)
+        return w
+
+    def vol(self, K: ArrayLike, T: ArrayLike) -> np.ndarray:
+        """
+        Implied volatility for arbitrary strikes and maturities.
+
+        Parameters
+        ----------
+        K, T : float or np.ndarray
+            Strikes and maturities (broadcast together)
+
+        Returns
+        -------
+        np.ndarray
+            Implied volatilities; at T = 0 the limit of the flat short-end
+            extrapolation
+        """
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        if np.any(T < 0):
+            raise ValueError("maturities must be non-negative")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vol = np.sqrt(np.maximum(self.total_variance(K, T), 0.0) / T)
+        if np.any(T == 0):
+            w = svi_total_variance(np.log(K / self.S0), *self.coefficients[0])
+            vol = np.where(T == 0, np.sqrt(np.maximum(w, 0.0) / self.maturities[0]), vol)
+        return vol
+
+    def price(self, K: ArrayLike, T: ArrayLike, option_type: str = "call") -> np.ndarray:
+        """
+        Black-Scholes price at the surface volatility.
+
+        Parameters
+        ----------
+        K, T : float or np.ndarray
+            Strikes and maturities (broadcast together)
+        option_type : str, default='call'
+            'call' or 'put'
+
+        Returns
+        -------
+        np.ndarray
+            Option prices
+        """
+        return black_scholes_price(self.S0, K, T, self.r, self.vol(K, T), self.q, option_type)
+
+    def calendar_violations(self, n_points: int = 101) -> Dict[float, int]:
+        """
+        Count log-moneyness points where total variance decreases in T.
+
+        Parameters
+        ----------
+        n_points : int, default=101
+            Number of log-moneyness points in [-1, 1] to check
+
+        Returns
+        -------
+        dict
+            Maturity of the later slice -> number of violating points
+        """
+        k = np.linspace(-1.0, 1.0, n_points)
+        w = svi_total_variance(k[np.newaxis, :], *self.coefficients.T[:, :, np.newaxis])
+        crossings = (np.diff(w, axis=0) < 0).sum(axis=1)
+        return {float(T): int(c) for T, c in zip(self.maturities[1:], crossings) if c > 0}
+
+    def to_frame(self) -> pd.DataFrame:
+        """Coefficient table as a DataFrame indexed by maturity."""
+        return pd.DataFrame(self.coefficients, index=self.maturities, columns=SVI_PARAMS)
+
+
+def main():
+    """Example: build a surface from synthetic SVI quotes and update it."""
+    import time
+
+    S0, r = 100.0, 0.02
+    rows = []
+    for T in (0.1, 0.25, 0.5, 1.0, 2.0):
+        strikes = S0 * np.exp(np.linspace(-0.4, 0.4, 21) * np.sqrt(T))
+        k = np.log(strikes / (S0 * np.exp(r * T)))
+        w = svi_total_variance(k, 0.03 * T, 0.1 * np.sqrt(T), -0.5, 0.0, 0.2)
+        prices = black_scholes_price(S0, strikes, T, r, np.sqrt(w / T))
+        rows += [{"strike": K, "maturity": T, "price": p} for K, p in zip(strikes, prices)]
+    quotes = pd.DataFrame(rows)
+
+    surface = VolatilitySurface(quotes, S0, r)
+    print("Volatility Surface Example")
+    print("=" * 50)
+    print(surface.to_frame().to_string(float_format="{:.4f}".format))
+
+    changed = quotes.iloc[[3, 4]].copy()
+    changed["price"] *= 1.01
+    start = time.perf_counter()
+    surface.update_quotes(changed)
+    print(f"\nIncremental refit: {(time.perf_counter() - start) * 1e3:.2f} ms")
+    print(f"vol(100, 0.75) = {surface.vol(100.0, 0.75):.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Tests for the benchmark runner and regression comparison."""
+
+import pytest
+
+from qf_utils import benchmarking
+from qf_utils.benchmarking import (
+    Benchmark,
+    SkipBenchmark,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+    time_callable,
+)
+
+
+def _document(timings):
+    return {"results": {name: {"median": t, "min": t} for name, t in timings.items()}}
+
+
+def test_time_callable_reports_statistics():
+    """Timings contain per-call statistics with at least one loop per repeat."""
+    stats = time_callable(lambda: sum(range(100)), repeats=3, min_time=0.001)
+    assert stats["repeats"] == 3
+    assert stats["number"] >= 1
+    assert 0 < stats["min"] <= stats["median"]
+
+
+def test_run_benchmarks_records_skips_and_quick_mode():
+    """Quick mode runs the first size only and SkipBenchmark is recorded, not raised."""
+    calls = []
+
+    def setup(n):
+        calls.append(n)
+        return lambda: n * 2
+
+    def missing(n):
+        raise SkipBenchmark("not installed")
+
+    benches = [Benchmark("double", setup, (10, 1000)), Benchmark("native", missing, (10,))]
+    document = run_benchmarks(benches, quick=True, repeats=2, min_time=0.0)
+    assert list(document["results"]) == ["double[10]"]
+    assert document["skipped"] == {"native[10]": "not installed"}
+    assert calls == [10]
+    assert "python" in document["machine"]
+
+
+def test_compare_flags_regressions_and_improvements():
+    """Slowdowns beyond the threshold are regressions; added/removed cases are reported."""
+    baseline = _document({"a": 1.0, "b": 1.0, "c": 1.0, "gone": 1.0})
+    current = _document({"a": 1.1, "b": 1.5, "c": 0.5, "added": 1.0})
+    status = {row["name"]: row["status"] for row in compare_results(baseline, current, threshold=0.2)}
+    assert status == {"a": "unchanged", "b": "regression", "c": "improvement",
+                      "gone": "missing", "added": "new"}
+
+    with pytest.raises(ValueError):
+        compare_results(baseline, current, threshold=0.0)
+
+
+def test_compare_cli_exit_code(tmp_path):
+    """The compare command exits non-zero when anything regressed."""
+    base, fast, slow = tmp_path / "base.json", tmp_path / "fast.json", tmp_path / "slow.json"
+    save_results(_document({"kernel[100]": 1e-3}), str(base))
+    save_results(_document({"kernel[100]": 1.05e-3}), str(fast))
+    save_results(_document({"kernel[100]": 2e-3}), str(slow))
+    assert load_results(str(base))["results"]["kernel[100]"]["median"] == 1e-3
+
+    assert benchmarking.main(["compare", str(base), str(fast)]) == 0
+    assert benchmarking.main(["compare", str(base), str(slow)]) == 1
+    assert benchmarking.main(["compare", str(base), str(slow), "--threshold", "1.5"]) == 0
@@ -0,0 +1,229 @@
+"""Tests for the event-driven execution engine."""
+
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qf_utils.execution import (
+    ExecutionEngine,
+    FixedSlippage,
+    NoSlippage,
+    PercentCommission,
+    PerShareCommission,
+    VolumeImpactSlippage,
+)
+
+FREE = {"slippage": NoSlippage(), "commission": PercentCommission(0.0)}
+
+
+def make_bars(rows, volume=1_000.0):
+    """Integer-indexed bars from (open, high, low, close) rows."""
+    frame = pd.DataFrame(rows, columns=["Open", "High", "Low", "Close"], dtype=float)
+    frame["Volume"] = volume
+    return frame
+
+
+def random_bars(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0, 0.002, n)))
+    open_ = np.concatenate([[100.0], close[:-1]])
+    wick = np.abs(rng.normal(0.0, 0.001, (2, n))) * close
+    return pd.DataFrame({"Open": open_, "High": np.maximum(open_, close) + wick[0],
+                         "Low": np.minimum(open_, close) - wick[1], "Close": close,
+                         "Volume": rng.integers(100, 2_000, n).astype(float)})
+
+
+def test_market_orders_fill_at_next_open():
+    """An order stamped with a bar's time trades at the following bar's open, with costs applied."""
+    bars = make_bars([(10, 11, 9, 10), (12, 13, 11, 12), (14, 15, 13, 14), (16, 17, 15, 16)])
+    orders = pd.DataFrame({"quantity": [100, -100]}, index=[0, 2])
+    engine = ExecutionEngine(bars, slippage=FixedSlippage(10), commission=PercentCommission(0.001),
+                             initial_capital=10_000)
+    result = engine.add_stream("s", orders).run()
+
+    fills = result.fills
+    assert list(fills["time"]) == [1, 3]
+    np.testing.assert_allclose(fills["reference_price"], [12, 16])
+    np.testing.assert_allclose(fills["price"], [12 * 1.001, 16 * 0.999])
+    np.testing.assert_allclose(fills["commission"], 0.001 * 100 * fills["price"])
+    assert list(result.orders["status"]) == ["filled", "filled"]
+    assert result.events == 4 + 2
+
+    equity = result.equity()["s"]
+    cash = 10_000 - 100 * 12 * 1.001 * 1.001
+    np.testing.assert_allclose(equity, [10_000, cash + 100 * 12, cash + 100 * 14,
+                                        cash + 100 * 16 * 0.999 * 0.999])
+    np.testing.assert_array_equal(result.positions()[("s", "asset")], [0, 100, 100, 0])
+
+
+def test_limit_stop_and_stop_limit_prices():
+    bars = make_bars([
+        (100, 100, 100, 100),
+        (98, 99, 95, 97),
+        (97, 101, 96, 100),
+        (104, 106, 103, 105),
+        (104, 105, 102, 103),
+    ])
+    orders = pd.DataFrame({
+        "type": ["limit", "limit", "limit", "stop", "stop_limit", "stop", "stop"],
+        "quantity": [10, -10, 10, -10, 10, 10, -10],
+        "limit_price": [99, 101, 90, np.nan, 103, np.nan, np.nan],
+        "stop_price": [np.nan, np.nan, np.nan, 96.5, 102, 105, 95],
+    }, index=[0, 1, 0, 1, 2, 3, 3])
+    result = ExecutionEngine(bars, **FREE).add_stream("s", orders).run()
+    table = result.orders
+
+    expected = [
+        98,      # buy limit 99: the open gaps below it
+        101,     # sell limit 101: the high touches it
+        np.nan,  # buy limit 90: never reached
+        96.5,    # sell stop 96.5: triggered by the low, below the open
+        103,     # buy stop-limit 102/103: bar 3 gaps past the limit, bar 4 fills it as a limit
+        105,     # buy stop 105: triggered intrabar, above the open
+        np.nan,  # sell stop 95: never triggered
+    ]
+    np.testing.assert_allclose(table["avg_price"], expected)
+    assert list(table["status"]) == ["filled", "filled", "working", "filled", "filled", "filled", "working"]
+    assert result.fills.set_index("order").loc[4, "time"] == 4
+
+
+def test_partial_fills_share_bar_volume_across_streams():
+    """A participation cap splits orders over bars, earlier submissions first, in whole lots."""
+    bars = make_bars([(10, 10, 10, 10)] * 6, volume=2_500.0)
+    engine = ExecutionEngine(bars, max_participation=0.1, lot_size=100, **FREE)
+    engine.add_stream("a", pd.DataFrame({"quantity": [500]}, index=[0]))
+    engine.add_stream("b", pd.DataFrame({"quantity": [-300]}, index=[0]))
+    fills = engine.run().fills
+
+    # 10% of 2,500 is 250, rounded down to 200 in lots of 100
+    a, b = fills[fills["stream"] == "a"], fills[fills["stream"] == "b"]
+    assert list(a["time"]) == [1, 2, 3] and list(a["quantity"]) == [200, 200, 100]
+    assert list(b["time"]) == [3, 4] and list(b["quantity"]) == [-100, -200]
+
+
+def test_cancellation_keeps_partial_fills():
+    """A cancel stamped with a bar's time lands after that bar has traded."""
+    bars = make_bars([(10, 10, 10, 10)] * 5, volume=2_000.0)
+    orders = pd.DataFrame({"quantity": [500, 100], "cancel_time": [2, 0]}, index=[0, 0])
+    result = ExecutionEngine(bars, max_participation=0.1, **FREE).add_stream("s", orders).run()
+    assert list(result.orders["filled"]) == [400, 0]
+    assert list(result.orders["status"]) == ["cancelled", "cancelled"]
+    assert list(result.fills["time"]) == [1, 2]
+
+
+def test_bracket_children_and_one_cancels_other():
+    bars = make_bars([
+        (100, 100, 100, 100),
+        (100, 101, 99, 100),
+        (100, 102, 98, 101),
+        (101, 106, 100, 105),
+        (105, 105, 90, 92),
+    ])
+    orders = pd.DataFrame({
+        "type": ["market", "limit", "stop", "limit", "limit", "stop"],
+        "quantity": [10, -10, -10, 10, -10, -10],
+        "limit_price": [np.nan, 105, np.nan, 50, 60, np.nan],
+        "stop_price": [np.nan, np.nan, 95, np.nan, np.nan, 40],
+        "parent": [np.nan, 0, 0, np.nan, 3, 3],
+        "oco": [None, "exit", "exit", None, "exit2", "exit2"],
+    }, index=[0, 0, 0, 0, 0, 0])
+    result = ExecutionEngine(bars, **FREE).add_stream("s", orders).run()
+
+    # The entry fills on bar 1, its exits start working after it, and the
+    # take-profit on bar 3 cancels the stop that bar 4 would have triggered
+    assert list(result.orders["status"]) == ["filled", "filled", "cancelled", "working", "pending", "pending"]
+    assert list(result.fills["time"]) == [1, 3]
+    np.testing.assert_allclose(result.fills["price"], [100, 105])
+    assert result.positions().iloc[-1].sum() == 0
+    assert result.equity()["s"].iloc[-1] == pytest.approx(100_000 + 10 * 5)
+
+
+def test_multiple_instruments_on_their_own_clocks():
+    minutes = pd.date_range("2024-03-01 09:30", periods=6, freq="min", tz="America/New_York")
+    fast = make_bars([(100 + i, 101 + i, 99 + i, 100 + i) for i in range(6)]).set_axis(minutes)
+    slow = make_bars([(50, 51, 49, 50), (52, 53, 51, 52), (54, 55, 53, 54)]).set_axis(minutes[::2])
+    orders = pd.DataFrame({"instrument": ["fast", "slow"], "quantity": [1, 2]}, index=minutes[[1, 1]])
+    result = ExecutionEngine({"fast": fast, "slow": slow}, **FREE).add_stream("s", orders).run()
+
+    fills = result.fills.set_index("instrument")
+    assert fills.loc["fast", "time"] == minutes[2] and fills.loc["fast", "price"] == 102
+    assert fills.loc["slow", "time"] == minutes[2] and fills.loc["slow", "price"] == 52
+    assert result.events == 6 + 3 + 2
+    held = result.positions().loc[:, "s"]
+    assert list(held.columns) == ["fast", "slow"] and held.iloc[-1].tolist() == [1, 2]
+    # Marks carry the slow instrument's last close between its bars
+    equity = result.equity()["s"]
+    assert equity.iloc[3] == pytest.approx(100_000 + (103 - 102) + 2 * (52 - 52))
+    assert equity.iloc[4] == pytest.approx(100_000 + (104 - 102) + 2 * (54 - 52))
+
+
+def test_slippage_and_commission_models():
+    bars = make_bars([(100, 100, 100, 100), (100, 102, 99, 101)], volume=10_000.0)
+    orders = pd.DataFrame({"type": ["market", "limit", "market"], "quantity": [100, 100, -1_000],
+                           "limit_price": [np.nan, 100.5, np.nan]}, index=[0, 0, 0])
+    engine = ExecutionEngine(bars, slippage=VolumeImpactSlippage(0.1), commission=PerShareCommission(0.005, 1.0))
+    fills = engine.add_stream("s", orders).run().fills
+
+    # 0.1 * sqrt(100 / 10,000) = 1%; the limit buy is capped at its limit
+    np.testing.assert_allclose(fills["price"], [101, 100.5, 100 * (1 - 0.1 * np.sqrt(0.1))])
+    np.testing.assert_allclose(fills["commission"], [1.0, 1.0, 5.0])
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numba") is None, reason="numba not installed")
+def test_numba_and_python_backends_agree():
+    rng = np.random.default_rng(5)
+    bars = {name: random_bars(1_500, seed) for seed, name in enumerate(["x", "y"])}
+    n = 600
+    when = rng.integers(0, 1_500, n)
+    last = np.where(rng.random(n) < 0.5, 1, -1)
+    reference = bars["x"]["Close"].to_numpy()[when]
+    orders = pd.DataFrame({
+        "instrument": rng.choice(["x", "y"], n),
+        "type": rng.choice(["market", "limit", "stop", "stop_limit"], n),
+        "quantity": last * rng.integers(1, 20, n) * 100,
+        "limit_price": reference * (1 - last * 0.002),
+        "stop_price": reference * (1 + last * 0.002),
+        "cancel_time": np.where(rng.random(n) < 0.5, when + rng.integers(0, 50, n), np.nan),
+        "oco": np.where(rng.random(n) < 0.2, rng.integers(0, 20, n), np.nan),
+    }, index=when)
+    results = []
+    for backend in ("numba", "python"):
+        engine = ExecutionEngine(bars, max_participation=0.2, backend=backend,
+                                 slippage=FixedSlippage(2), commission=PercentCommission(0.0005))
+        results.append(engine.add_stream("a", orders).add_stream("b", orders.iloc[::-1]).run())
+    compiled, interpreted = results
+    assert len(compiled.fills) > 100
+    pd.testing.assert_frame_equal(compiled.fills, interpreted.fills)
+    pd.testing.assert_frame_equal(compiled.orders, interpreted.orders)
+    assert compiled.events == interpreted.events
+
+
+def test_invalid_input():
+    bars = make_bars([(10, 10, 10, 10)] * 3)
+    engine = ExecutionEngine(bars)
+    with pytest.raises(ValueError):
+        engine.run()
+    with pytest.raises(ValueError):
+        ExecutionEngine(bars.drop(columns="Low"))
+    with pytest.raises(ValueError):
+        ExecutionEngine(bars.iloc[::-1])
+    with pytest.raises(ValueError):
+        ExecutionEngine(bars, backend="gpu")
+    with pytest.raises(ValueError):
+        ExecutionEngine({"a": bars, "b": bars.set_axis(pd.date_range("2024-01-01", periods=3))})
+    for orders in (
+        pd.DataFrame({"quantity": [0]}, index=[0]),
+        pd.DataFrame({"quantity": [1], "type": ["iceberg"]}, index=[0]),
+        pd.DataFrame({"quantity": [1], "type": ["limit"]}, index=[0]),
+        pd.DataFrame({"quantity": [1], "instrument": ["other"]}, index=[0]),
+        pd.DataFrame({"quantity": [1], "parent": [0]}, index=[0]),
+    ):
+        with pytest.raises(ValueError):
+            engine.add_stream("s", orders)
+    engine.add_stream("s", pd.DataFrame({"quantity": [1]}, index=[0]))
+    with pytest.raises(ValueError):
+        engine.add_stream("s", pd.DataFrame({"quantity": [1]}, index=[0]))
+    with pytest.raises(ValueError):
+        ExecutionEngine({"a": bars, "b": bars}).add_stream("s", pd.DataFrame({"quantity": [1]}, index=[0]))
@@ -0,0 +1,195 @@
+"""Tests for technical indicators."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qf_utils import indicators
+from qf_utils.indicators import (
+    IndicatorCache,
+    StreamingATR,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingSMA,
+    StreamingStd,
+    StreamingZScore,
+    atr,
+    ema,
+    rolling_std,
+    rsi,
+    sma,
+    zscore,
+)
+
+
+@pytest.fixture
+def bars(sample_prices):
+    """OHLC bars around the sample close prices."""
+    rng = np.random.default_rng(0)
+    spread = sample_prices * rng.uniform(0.001, 0.02, len(sample_prices))
+    return pd.DataFrame({"High": sample_prices + spread, "Low": sample_prices - spread, "Close": sample_prices})
+
+
+def wilder_rsi(close, window):
+    """Loop reference for Wilder's RSI."""
+    delta = np.diff(close)
+    out = np.full(len(close), np.nan)
+    gain = np.maximum(delta[:window], 0).mean()
+    loss = np.maximum(-delta[:window], 0).mean()
+    out[window] = 100 - 100 / (1 + gain / loss)
+    for i in range(window, len(delta)):
+        gain = (gain * (window - 1) + max(delta[i], 0)) / window
+        loss = (loss * (window - 1) + max(-delta[i], 0)) / window
+        out[i + 1] = 100 - 100 / (1 + gain / loss)
+    return out
+
+
+def test_batch_indicators_match_pandas(sample_prices):
+    """SMA, rolling std, EMA and z-score agree with the pandas equivalents."""
+    pd.testing.assert_series_equal(sma(sample_prices, 20, cache=False), sample_prices.rolling(20).mean())
+    pd.testing.assert_series_equal(rolling_std(sample_prices, 20, cache=False), sample_prices.rolling(20).std())
+    pd.testing.assert_series_equal(ema(sample_prices, span=12, cache=False),
+                                   sample_prices.ewm(span=12, adjust=False).mean())
+    expected = (sample_prices - sample_prices.rolling(30).mean()) / sample_prices.rolling(30).std()
+    pd.testing.assert_series_equal(zscore(sample_prices, 30, cache=False), expected)
+
+
+def test_missing_values_match_pandas():
+    """Leading and interior NaNs only blank the windows that contain them; EMA restarts like pandas."""
+    prices = pd.Series(100 * np.exp(np.cumsum(np.random.default_rng(2).normal(0.0, 0.01, 500))))
+    leading = prices.pct_change()
+    interior = leading.copy()
+    interior.iloc[[200, 350, 351]] = np.nan
+    for returns in (leading, interior):
+        pd.testing.assert_series_equal(sma(returns, 20, cache=False), returns.rolling(20).mean())
+        pd.testing.assert_series_equal(rolling_std(returns, 20, cache=False), returns.rolling(20).std())
+        expected = (returns - returns.rolling(20).mean()) / returns.rolling(20).std()
+        pd.testing.assert_series_equal(zscore(returns, 20, cache=False), expected)
+        pd.testing.assert_series_equal(ema(returns, span=10, cache=False),
+                                       returns.ewm(span=10, adjust=False).mean())
+    assert sma(leading, 20, cache=False).count() == 480
+
+
+def test_wilder_smoothing_restarts_after_missing_values(bars):
+    """RSI and ATR skip a leading NaN and resume after an interior one."""
+    close = bars["Close"].to_numpy().copy()
+    close[0] = np.nan
+    np.testing.assert_allclose(rsi(close, 14, cache=False)[1:], rsi(close[1:], 14, cache=False), rtol=1e-12)
+
+    high, low = bars["High"].to_numpy(), bars["Low"].to_numpy()
+    close[[0, 100]] = bars["Close"].iloc[0], np.nan
+    tr = pd.concat([pd.Series(high - low), (pd.Series(high) - pd.Series(close).shift()).abs(),
+                    (pd.Series(low) - pd.Series(close).shift()).abs()], axis=1).max(axis=1, skipna=False)
+    tr.iloc[0] = high[0] - low[0]
+    seeded = pd.concat([pd.Series([tr.iloc[:14].mean()]), tr.iloc[14:]], ignore_index=True)
+    expected = seeded.ewm(alpha=1 / 14, adjust=False).mean().to_numpy()
+    result = atr(high, low, close, 14, cache=False)
+    assert np.isnan(result[:13]).all()
+    np.testing.assert_allclose(result[13:], expected, rtol=1e-10)
+
+
+def test_accurate_on_long_trending_series():
+    """Blocked cumulative sums keep SMA exact-to-rounding on a million trending bars."""
+    x = 100 * np.exp(np.cumsum(np.random.default_rng(1).normal(0.0002, 0.01, 1_000_000)))
+    expected = pd.Series(x).rolling(50).mean().to_numpy()
+    np.testing.assert_allclose(sma(x, 50, cache=False), expected, rtol=1e-12)
+
+
+def test_rsi_and_atr_follow_wilder(bars):
+    """RSI and ATR use Wilder smoothing seeded with simple averages."""
+    close = bars["Close"].to_numpy()
+    np.testing.assert_allclose(rsi(close, 14, cache=False), wilder_rsi(close, 14), rtol=1e-10)
+
+    prev = bars["Close"].shift()
+    tr = pd.concat([bars["High"] - bars["Low"], (bars["High"] - prev).abs(), (bars["Low"] - prev).abs()],
+                   axis=1).max(axis=1)
+    expected = np.full(len(tr), np.nan)
+    expected[13] = tr.iloc[:14].mean()
+    for i in range(14, len(tr)):
+        expected[i] = expected[i - 1] + (tr.iloc[i] - expected[i - 1]) / 14
+    result = atr(bars["High"], bars["Low"], bars["Close"], 14, cache=False)
+    assert result.index.equals(bars.index)
+    np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+
+def test_cache_hits_and_lru_eviction(sample_prices):
+    """Repeated requests hit the cache; the least recently used entry is evicted."""
+    cache = IndicatorCache(maxsize=2)
+    first = sma(sample_prices, 10, cache=cache)
+    sma(sample_prices, 10, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # An equal copy shares the fingerprint, so it hits as well
+    sma(sample_prices.copy(), 10, cache=cache)
+    assert cache.hits == 2
+
+    sma(sample_prices, 20, cache=cache)
+    ema(sample_prices, span=5, cache=cache)
+    assert len(cache) == 2
+    sma(sample_prices, 10, cache=cache)
+    assert cache.misses == 4
+
+    with pytest.raises(ValueError):
+        first.to_numpy()[0] = 1.0
+
+
+def test_fingerprint_distinguishes_data_and_index(sample_prices):
+    """Different values or a different index give a different key."""
+    shifted = sample_prices.copy()
+    shifted.iloc[-1] += 1e-9
+    reindexed = sample_prices.reset_index(drop=True)
+    keys = {indicators.fingerprint(x) for x in (sample_prices, shifted, reindexed)}
+    assert len(keys) == 3
+
+
+def test_in_place_edits_are_not_served_stale(sample_prices):
+    """Writeable inputs are re-hashed on every call; hits come back writeable."""
+    cache = IndicatorCache()
+    values = np.arange(10.0)
+    sma(values, 3, cache=cache)
+    values[:] = 100.0
+    result = sma(values, 3, cache=cache)
+    assert result[-1] == 100.0
+    assert cache.misses == 2
+
+    again = sma(values, 3, cache=cache)
+    assert cache.hits == 1
+    again[5] = 0.0
+    assert sma(values, 3, cache=cache)[5] == 100.0
+
+    frozen = sample_prices.to_numpy().copy()
+    frozen.flags.writeable = False
+    assert indicators.fingerprint(frozen) is indicators.fingerprint(frozen)
+
+
+@pytest.mark.parametrize("window", [1, 5, 20])
+def test_streaming_matches_batch(bars, window):
+    """Every streaming indicator reproduces its batch counterpart bar by bar."""
+    close = bars["Close"].to_numpy()
+    streams = {
+        "sma": (StreamingSMA(window), sma(close, window, cache=False)),
+        "ema": (StreamingEMA(span=window), ema(close, span=window, cache=False)),
+        "rsi": (StreamingRSI(window), rsi(close, window, cache=False)),
+    }
+    if window > 1:
+        streams["std"] = (StreamingStd(window), rolling_std(close, window, cache=False))
+        streams["zscore"] = (StreamingZScore(window), zscore(close, window, cache=False))
+    for name, (stream, batch) in streams.items():
+        online = np.array([stream.update(x) for x in close])
+        np.testing.assert_allclose(online, batch, rtol=1e-9, err_msg=name)
+
+    stream = StreamingATR(window)
+    online = [stream.update(h, l, c) for h, l, c in bars[["High", "Low", "Close"]].to_numpy()]
+    np.testing.assert_allclose(online, atr(bars["High"], bars["Low"], bars["Close"], window, cache=False),
+                               rtol=1e-9)
+
+
+def test_invalid_parameters(sample_prices):
+    with pytest.raises(ValueError):
+        sma(sample_prices, 0)
+    with pytest.raises(ValueError):
+        ema(sample_prices)
+    with pytest.raises(ValueError):
+        rolling_std(sample_prices, 1)
+    with pytest.raises(ValueError):
+        IndicatorCache(maxsize=0)
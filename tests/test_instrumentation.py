@@ -0,0 +1,101 @@
+"""Tests for the opt-in instrumentation layer."""
+
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qf_utils import instrumentation
+from qf_utils.backtester import Backtester
+from qf_utils.instrumentation import LoggingSink, PrometheusTextSink, Sink
+from qf_utils.pricing import PricingEngine
+from qf_utils.risk_metrics import RiskMetrics
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+    instrumentation._SINKS.clear()
+
+
+def ohlcv(prices):
+    return pd.DataFrame({"Open": prices, "High": prices, "Low": prices, "Close": prices, "Volume": 1e6})
+
+
+def alternating_signal(data):
+    return pd.Series(np.where(np.arange(len(data)) % 20 < 10, 1, -1), index=data.index)
+
+
+def test_disabled_records_nothing(sample_returns):
+    """Instrumented code runs normally and leaves no measurements when off."""
+    RiskMetrics.sharpe_ratio(sample_returns)
+    with instrumentation.stage("manual"):
+        pass
+    assert instrumentation.snapshot() == {}
+
+
+def test_backtester_phases_recorded(sample_prices):
+    """Backtester.run reports each phase plus the nested risk metrics."""
+    instrumentation.enable(track_memory=True)
+    Backtester(ohlcv(sample_prices)).run(alternating_signal)
+    stats = instrumentation.snapshot()
+
+    for name in ("backtester.run", "backtester.run.signals", "backtester.run.execution",
+                 "backtester.run.returns", "backtester.run.report", "risk_metrics.sharpe_ratio"):
+        assert stats[name].calls == 1
+    # calmar_ratio calls max_drawdown internally
+    assert stats["risk_metrics.max_drawdown"].calls == 2
+    phases = sum(stats[f"backtester.run.{p}"].total_seconds for p in ("signals", "execution", "returns", "report"))
+    assert phases <= stats["backtester.run"].total_seconds
+    assert stats["backtester.run"].alloc_bytes >= stats["backtester.run.execution"].alloc_bytes > 0
+
+
+def test_pricing_calls_recorded(tmp_path):
+    """Calls through the pricing facade are recorded per method and backend."""
+    instrumentation.enable()
+    engine = PricingEngine(calibration_path=str(tmp_path / "calibration.json"))
+    engine.black_scholes(100.0, [90.0, 110.0], 1.0, 0.05, 0.2, backend="numpy")
+    engine.black_scholes(100.0, 100.0, 1.0, 0.05, 0.2, backend="numpy")
+    assert instrumentation.snapshot()["pricing.black_scholes.numpy"].calls == 2
+
+
+def test_prometheus_sink_writes_exposition(tmp_path):
+    """The Prometheus sink writes one sample per stage and metric."""
+    instrumentation.enable()
+    with instrumentation.stage('odd "name"'):
+        pass
+    path = tmp_path / "metrics" / "qf.prom"
+    instrumentation.add_sink(PrometheusTextSink(str(path), prefix="qf"))
+    instrumentation.flush()
+
+    text = path.read_text()
+    assert "# TYPE qf_stage_calls_total counter" in text
+    assert 'qf_stage_calls_total{stage="odd \\"name\\""} 1' in text
+    assert "qf_stage_alloc_bytes_total" in text
+
+
+def test_custom_and_logging_sinks(caplog):
+    """Any Sink subclass receives flushes; reset_after clears the measurements."""
+    received = []
+
+    class ListSink(Sink):
+        def emit(self, stats):
+            received.append(stats)
+
+    instrumentation.enable()
+    RiskMetrics.volatility(pd.Series([0.01, -0.02, 0.005]))
+    instrumentation.add_sink(ListSink())
+    instrumentation.add_sink(LoggingSink(level=logging.WARNING))
+    with caplog.at_level(logging.WARNING, logger="qf_utils.instrumentation"):
+        instrumentation.flush(reset_after=True)
+
+    assert received[0]["risk_metrics.volatility"].calls == 1
+    record = json.loads(caplog.records[0].getMessage())
+    assert record["stage"] == "risk_metrics.volatility" and record["calls"] == 1
+    assert instrumentation.snapshot() == {}
@@ -0,0 +1,50 @@
+"""Tests for lazy loading of qf_utils submodules."""
+
+import subprocess
+import sys
+
+import pytest
+
+import qf_utils
+
+HEAVY = ("yfinance", "matplotlib", "seaborn", "scipy.stats", "numba")
+
+
+def loaded_after(statement):
+    """Heavy modules present in a fresh interpreter after running ``statement``."""
+    probe = f"{statement}\nimport sys\nprint(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return set(out.stdout.split())
+
+
+@pytest.mark.parametrize("statement", [
+    "import qf_utils",
+    "from qf_utils import RiskMetrics",
+    "from qf_utils import Backtester, PerformanceAnalyzer",
+    "from qf_utils import DataFetcher",
+    "from qf_utils import PricingEngine",
+])
+def test_import_does_not_load_heavy_dependencies(statement):
+    """Plotting, network and scipy.stats stay unloaded until used."""
+    assert loaded_after(statement) == set()
+
+
+def test_dependencies_load_on_first_use():
+    """Parametric VaR pulls in scipy.stats only when called."""
+    statement = (
+        "import pandas as pd\n"
+        "from qf_utils import RiskMetrics\n"
+        "RiskMetrics.value_at_risk(pd.Series([0.01, -0.02, 0.005]), 0.95, 'parametric')"
+    )
+    assert loaded_after(statement) == {"scipy.stats"}
+
+
+def test_lazy_attributes_resolve():
+    """Public names and submodules resolve through the module __getattr__."""
+    from qf_utils.risk_metrics import RiskMetrics
+
+    assert qf_utils.RiskMetrics is RiskMetrics
+    assert qf_utils.paths.GBM is qf_utils.GBM
+    assert set(qf_utils.__all__) <= set(dir(qf_utils))
+    with pytest.raises(AttributeError):
+        qf_utils.not_a_name
@@ -0,0 +1,88 @@
+"""Tests for the Numba pricing backend."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from qf_utils import numba_pricing, pricing
+from qf_utils.pricing import PricingEngine
+from qf_utils.vol_surface import black_scholes_price
+
+PARAMS = (100.0, 100.0, 1.0, 0.05, 0.2)
+
+
+def agree(a, b, paths, payoff_std, z=4.0):
+    """Two independent MC estimates differ by less than ``z`` standard errors."""
+    return abs(a - b) < z * payoff_std * np.sqrt(2.0 / paths)
+
+
+def test_black_scholes_matches_closed_form():
+    """Vectorized kernel reproduces the NumPy closed form for calls and puts."""
+    rng = np.random.default_rng(0)
+    K, T = rng.uniform(60, 140, (4, 50)), rng.uniform(0.05, 3.0, (4, 50))
+    for option_type in ("call", "put"):
+        np.testing.assert_allclose(
+            numba_pricing.black_scholes(100.0, K, T, 0.03, 0.25, option_type),
+            black_scholes_price(100.0, K, T, 0.03, 0.25, option_type=option_type),
+            rtol=1e-10,
+            atol=1e-12,
+        )
+    assert numba_pricing.call_price(*PARAMS) == pytest.approx(black_scholes_price(*PARAMS), rel=1e-12)
+
+
+def test_european_mc_converges_and_is_reproducible():
+    """Seeded runs repeat exactly and land within sampling error of Black-Scholes."""
+    n = 400_000
+    price = numba_pricing.monte_carlo_option_price(*PARAMS, n, "call", seed=7)
+    assert price == numba_pricing.monte_carlo_option_price(*PARAMS, n, "call", seed=7)
+    assert price != numba_pricing.monte_carlo_option_price(*PARAMS, n, "call", seed=8)
+    assert agree(price, black_scholes_price(*PARAMS), n / 2, 15.0)
+
+    put = numba_pricing.monte_carlo_option_price(*PARAMS, n, "put", seed=7)
+    assert agree(put, black_scholes_price(*PARAMS, option_type="put"), n / 2, 9.0)
+
+
+def test_asian_mc_matches_numpy_backend():
+    """Asian prices agree statistically with the NumPy path generator."""
+    n = 100_000
+    nb = numba_pricing.monte_carlo_asian_option(*PARAMS, n, 12, "call", seed=1)
+    ref = pricing._BACKENDS["numpy"].asian_mc(*PARAMS, n, 12, "call", seed=1)
+    assert agree(nb, ref, n, 9.0)
+
+
+def test_bootstrap_var():
+    """Bootstrap VaR of mean returns sits near the normal approximation."""
+    returns = np.random.default_rng(3).normal(0.001, 0.02, 250)
+    var = numba_pricing.calculate_var_mc(returns, 0.95, 20_000, seed=0)
+    expected = returns.mean() - 1.645 * returns.std() / np.sqrt(len(returns))
+    assert var == pytest.approx(expected, abs=3e-4)
+
+
+@pytest.mark.parametrize("other", ["cython", "cpp"])
+def test_matches_compiled_backends(other):
+    """Numba agrees with the Cython and C++ pricers when they are built."""
+    if other not in pricing.available_backends():
+        pytest.skip(f"{other} backend not built")
+    engine = PricingEngine()
+    np.testing.assert_allclose(
+        engine.black_scholes(100.0, [80.0, 100.0, 120.0], 1.0, 0.05, 0.2, backend="numba"),
+        engine.black_scholes(100.0, [80.0, 100.0, 120.0], 1.0, 0.05, 0.2, backend=other),
+        rtol=1e-10,
+    )
+    n = 400_000
+    assert agree(engine.european_option_mc(*PARAMS, n, seed=5, backend="numba"),
+                 engine.european_option_mc(*PARAMS, n, seed=5, backend=other), n, 15.0)
+    n = 100_000
+    assert agree(engine.asian_option_mc(*PARAMS, n, 12, seed=5, backend="numba"),
+                 engine.asian_option_mc(*PARAMS, n, 12, seed=5, backend=other), n, 9.0)
+
+
+def test_registered_in_pricing_facade():
+    """The facade discovers the backend and prefers it for uncalibrated MC."""
+    assert "numba" in pricing.available_backends()
+    engine = PricingEngine(calibration_path="/nonexistent/calibration.json")
+    if not {"cpp", "cython"} & set(pricing.available_backends()):
+        assert engine.select_backend("european_mc", 10_000) == "numba"
+    price = engine.european_option_mc(*PARAMS, 10_000, seed=0, backend="numba")
+    assert engine.last_backend == "numba" and price > 0
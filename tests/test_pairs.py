@@ -0,0 +1,89 @@
+"""Tests for the pairs-trading scanner."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qf_utils.pairs import candidate_pairs, engle_granger_critical_value, scan_pairs
+
+
+def universe(n_obs=1_000, n_assets=12, seed=0, phi=0.9):
+    """Random walks sharing one factor, with asset B cointegrated to asset A."""
+    rng = np.random.default_rng(seed)
+    factor = np.cumsum(rng.normal(0.0, 0.01, n_obs))[:, None]
+    log_prices = 4.0 + factor + np.cumsum(rng.normal(0.0, 0.006, (n_obs, n_assets)), axis=0)
+    noise = np.zeros(n_obs)
+    for t in range(1, n_obs):
+        noise[t] = phi * noise[t - 1] + rng.normal(0.0, 0.005)
+    log_prices[:, 1] = 0.2 + 0.8 * log_prices[:, 0] + noise
+    names = ["A", "B"] + [f"X{i}" for i in range(n_assets - 2)]
+    return pd.DataFrame(np.exp(log_prices), columns=names)
+
+
+def test_planted_pair_ranks_first():
+    """The cointegrated pair tops the table with its hedge ratio and half-life."""
+    table = scan_pairs(universe(n_obs=4_000), min_correlation=0.3)
+    top = table.iloc[0]
+    assert (top["asset_y"], top["asset_x"]) == ("A", "B")
+    assert top["cointegrated"] and table["cointegrated"].sum() <= 3
+    # A = (log B - 0.2 - noise) / 0.8, so regressing A on B recovers 1 / 0.8
+    assert top["hedge_ratio"] == pytest.approx(1.25, rel=0.02)
+    assert top["half_life"] == pytest.approx(np.log(2) / -np.log(0.9), rel=0.25)
+    assert top["ou_theta"] == pytest.approx(-np.log(0.9) * 252, rel=0.25)
+
+
+def test_adf_statistic_matches_per_pair_regression():
+    prices = universe()
+    table = scan_pairs(prices, min_correlation=-1.0, adf_lags=2)
+    assert len(table) == 12 * 11 // 2
+    for _, row in table.iloc[[0, 20, -1]].iterrows():
+        y, x = np.log(prices[row["asset_y"]].to_numpy()), np.log(prices[row["asset_x"]].to_numpy())
+        a, b = np.linalg.lstsq(np.column_stack([np.ones_like(x), x]), y, rcond=None)[0]
+        e = y - a - b * x
+        d = np.diff(e)
+        X = np.column_stack([e[2:-1], d[1:-1], d[:-2]])
+        coef = np.linalg.lstsq(X, d[2:], rcond=None)[0]
+        s2 = ((d[2:] - X @ coef) ** 2).sum() / (len(X) - 3)
+        t_stat = coef[0] / np.sqrt(s2 * np.linalg.inv(X.T @ X)[0, 0])
+        assert row["adf_stat"] == pytest.approx(t_stat, rel=1e-9)
+        assert row["hedge_ratio"] == pytest.approx(b, rel=1e-9)
+
+
+def test_critical_value_has_nominal_size():
+    """Independent random walks are flagged at about the requested rate."""
+    rng = np.random.default_rng(3)
+    prices = pd.DataFrame(np.exp(np.cumsum(rng.normal(0.0, 0.01, (500, 120)), axis=0)))
+    table = scan_pairs(prices, min_correlation=-1.0, significance=0.05)
+    # Pairs share assets, so the rejection rate is noisier than 7,140 independent tests
+    assert 0.03 < table["cointegrated"].mean() < 0.075
+    assert engle_granger_critical_value(500, 0.01) < engle_granger_critical_value(500, 0.10)
+
+
+def test_process_pool_matches_in_process():
+    prices = universe(n_assets=20)
+    serial = scan_pairs(prices, min_correlation=-1.0, chunk_size=25, processes=1)
+    pooled = scan_pairs(prices, min_correlation=-1.0, chunk_size=25, processes=2)
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_prefilter_and_table_filters():
+    prices = universe()
+    returns = np.diff(np.log(prices.to_numpy()), axis=0)
+    first, second, corr = candidate_pairs(returns, min_correlation=0.5, max_pairs=5)
+    assert len(corr) <= 5 and (first < second).all() and (np.diff(corr) <= 0).all()
+    expected = np.corrcoef(returns, rowvar=False)[first, second]
+    np.testing.assert_allclose(corr, expected)
+
+    table = scan_pairs(prices, min_correlation=-1.0, cointegrated_only=True, max_half_life=50)
+    assert table["cointegrated"].all() and (table["half_life"] <= 50).all()
+    assert table["adf_stat"].is_monotonic_increasing
+
+
+def test_invalid_input():
+    prices = universe()
+    with pytest.raises(ValueError):
+        scan_pairs(prices.where(prices.index != 5))
+    with pytest.raises(ValueError):
+        scan_pairs(prices, significance=0.2)
+    with pytest.raises(ValueError):
+        scan_pairs(-prices)
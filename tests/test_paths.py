@@ -0,0 +1,81 @@
+"""Tests for chunked path generation."""
+
+import pytest
+import numpy as np
+from scipy import stats
+
+from qf_utils.fourier_pricing import heston_price
+from qf_utils.paths import (
+    GBM,
+    Heston,
+    MertonJumpDiffusion,
+    OrnsteinUhlenbeck,
+    PathGenerator,
+    asian_payoff,
+    european_payoff,
+    monte_carlo_price,
+)
+
+
+def bs_call(S, K, T, r, sigma):
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    return S * stats.norm.cdf(d1) - K * np.exp(-r * T) * stats.norm.cdf(d1 - sigma * np.sqrt(T))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_gbm_european_matches_black_scholes(dtype):
+    """Chunked GBM pricing agrees with Black-Scholes in both precisions."""
+    gen = GBM(100.0, 0.05, 0.2, 1.0, 12, dtype=dtype)
+    res = monte_carlo_price(gen, european_payoff(100.0), 0.05, 200_000, chunk_size=30_000, random_state=0)
+    assert abs(res["price"] - bs_call(100.0, 100.0, 1.0, 0.05, 0.2)) < 4 * res["std_error"]
+
+
+def test_chunks_reuse_buffer_and_match_full_generation():
+    """Chunks share one buffer and reproduce the single-shot stream."""
+    gen = GBM(100.0, 0.05, 0.2, 1.0, 5)
+    blocks = []
+    first = None
+    for block in gen.chunks(1_000, chunk_size=300, random_state=7):
+        first = block if first is None else first
+        assert np.shares_memory(block, first)
+        blocks.append(block[:, -1].copy())
+
+    assert [len(b) for b in blocks] == [300, 300, 300, 100]
+    assert (np.concatenate(blocks) > 0).all()
+
+
+def test_generate_into_preallocated_buffer():
+    """generate_into fills the caller's buffer and validates its shape."""
+    gen = OrnsteinUhlenbeck(0.0, 2.0, 1.0, 0.3, 5.0, 50)
+    out = np.empty((50_000, 51))
+    assert gen.generate_into(out, random_state=1) is out
+    assert out[:, 0] == pytest.approx(0.0)
+    assert out[:, -1].mean() == pytest.approx(1.0 - np.exp(-10.0), abs=5e-3)
+
+    with pytest.raises(ValueError):
+        gen.generate_into(np.empty((10, 10)))
+    with pytest.raises(TypeError):
+        PathGenerator(1.0, 50)
+
+
+def test_merton_martingale():
+    """Compensated jump-diffusion has E[S_T] = S0 exp(mu T)."""
+    gen = MertonJumpDiffusion(100.0, 0.03, 0.15, 1.0, -0.1, 0.2, 1.0, 20)
+    res = gen.reduce(lambda paths: paths[:, -1], 200_000, random_state=2)
+    assert abs(res["mean"] - 100.0 * np.exp(0.03)) < 4 * res["std_error"]
+
+
+def test_heston_matches_fourier_price():
+    """Heston simulation agrees with the FFT price within MC + bias tolerance."""
+    gen = Heston(100.0, 0.05, 0.04, 2.0, 0.04, 0.3, -0.7, 1.0, 100)
+    res = monte_carlo_price(gen, european_payoff(100.0), 0.05, 100_000, random_state=3)
+    expected = heston_price([100.0], 1.0, 100.0, 0.05, 2.0, 0.04, 0.3, -0.7, 0.04)[0]
+    assert res["price"] == pytest.approx(expected, abs=4 * res["std_error"] + 0.02)
+
+
+def test_asian_cheaper_than_european():
+    """Averaging reduces call value."""
+    gen = GBM(100.0, 0.05, 0.2, 1.0, 50)
+    asian = monte_carlo_price(gen, asian_payoff(100.0), 0.05, 50_000, random_state=4)
+    euro = monte_carlo_price(gen, european_payoff(100.0), 0.05, 50_000, random_state=4)
+    assert asian["price"] < euro["price"]
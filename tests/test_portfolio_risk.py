@@ -0,0 +1,82 @@
+"""Tests for portfolio risk engine."""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from qf_utils.portfolio_risk import PortfolioRiskEngine, ewma_volatility
+from qf_utils.risk_metrics import RiskMetrics
+
+
+@pytest.fixture
+def asset_returns():
+    """Correlated three-asset return matrix."""
+    rng = np.random.default_rng(42)
+    cov = np.array([[4.0, 2.0, 1.0], [2.0, 9.0, 3.0], [1.0, 3.0, 16.0]]) * 1e-4
+    data = rng.multivariate_normal([0.0005, 0.0007, 0.001], cov, 1000)
+    return pd.DataFrame(data, columns=["A", "B", "C"])
+
+
+def test_historical_matches_single_series(asset_returns):
+    """Historical VaR/ES of the aggregated P&L match RiskMetrics."""
+    weights = [0.5, 0.3, 0.2]
+    engine = PortfolioRiskEngine(asset_returns, weights)
+    portfolio = asset_returns @ np.array(weights)
+
+    assert engine.value_at_risk(0.95) == pytest.approx(RiskMetrics.value_at_risk(portfolio, 0.95))
+    assert engine.expected_shortfall(0.95) == pytest.approx(
+        RiskMetrics.conditional_value_at_risk(portfolio, 0.95)
+    )
+
+
+@pytest.mark.parametrize("method", PortfolioRiskEngine.METHODS)
+def test_component_var_sums_to_var(asset_returns, method):
+    """Euler components add up to the portfolio VaR for every method."""
+    engine = PortfolioRiskEngine(asset_returns, [0.5, 0.3, 0.2], method=method, random_state=0)
+    for cl in (0.95, 0.99):
+        var = engine.value_at_risk(cl)
+        assert var > 0
+        assert engine.expected_shortfall(cl) >= var
+        assert engine.component_var(cl).sum() == pytest.approx(var)
+        assert list(engine.marginal_var(cl).index) == ["A", "B", "C"]
+
+
+def test_scenarios_reused_across_confidence_levels(asset_returns):
+    """Scenario P&L is generated once and shared by all confidence levels."""
+    engine = PortfolioRiskEngine(asset_returns, [0.5, 0.3, 0.2], method="monte-carlo", random_state=1)
+    engine.value_at_risk(0.95)
+    pnl = engine.pnl
+    report = engine.report([0.9, 0.95, 0.99])
+    assert engine.pnl is pnl
+    assert report["VaR"].is_monotonic_increasing
+    assert [c for c in report.columns if c.startswith("ComponentVaR[")] == [
+        f"ComponentVaR[{a}]" for a in asset_returns.columns]
+
+
+def test_ewma_volatility_shape(asset_returns):
+    """EWMA volatility has one extra row holding the forecast."""
+    sigma = ewma_volatility(asset_returns.to_numpy())
+    assert sigma.shape == (len(asset_returns) + 1, 3)
+    assert (sigma > 0).all()
+
+
+def test_invalid_inputs(asset_returns):
+    """Unknown methods, mismatched weights and non-finite returns are rejected."""
+    with pytest.raises(ValueError):
+        PortfolioRiskEngine(asset_returns, [0.5, 0.5, 0.0], method="delta-normal")
+    with pytest.raises(ValueError):
+        PortfolioRiskEngine(asset_returns, [0.5, 0.5])
+    nan_row = asset_returns.copy()
+    nan_row.iloc[10, 1] = np.nan
+    with pytest.raises(ValueError):
+        PortfolioRiskEngine(nan_row, [0.5, 0.3, 0.2])
+
+
+def test_monte_carlo_with_singular_covariance(asset_returns):
+    """A duplicated asset leaves the covariance singular; MC VaR still matches the merged position."""
+    duplicated = asset_returns.assign(A2=asset_returns["A"])
+    split = PortfolioRiskEngine(duplicated, [0.25, 0.3, 0.2, 0.25], method="monte-carlo",
+                                n_simulations=200_000, random_state=0)
+    merged = PortfolioRiskEngine(asset_returns, [0.5, 0.3, 0.2], method="monte-carlo",
+                                 n_simulations=200_000, random_state=0)
+    assert split.value_at_risk(0.99) == pytest.approx(merged.value_at_risk(0.99), rel=0.02)
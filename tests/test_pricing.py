@@ -0,0 +1,91 @@
+"""Tests for the pricing backend facade."""
+
+import json
+
+import numpy as np
+import pytest
+
+from qf_utils import pricing
+from qf_utils.pricing import PricingBackend, PricingEngine, available_backends, register_backend
+from qf_utils.vol_surface import black_scholes_price
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return PricingEngine(calibration_path=str(tmp_path / "calibration.json"))
+
+
+@pytest.fixture
+def fake_backend():
+    calls = []
+    backend = PricingBackend(
+        "fake",
+        black_scholes=lambda S, K, T, r, sigma, option_type="call": calls.append("bs")
+        or np.zeros(np.broadcast(np.asarray(S), np.asarray(K)).shape),
+    )
+    register_backend(backend)
+    yield calls
+    pricing._BACKENDS.pop("fake", None)
+
+
+def test_numpy_backend_always_available(engine):
+    """The NumPy fallback is discovered and serves uncalibrated batches."""
+    assert "numpy" in available_backends()
+    prices = engine.black_scholes(100.0, [90.0, 100.0, 110.0], 1.0, 0.05, 0.2)
+    assert engine.last_backend == "numpy"
+    np.testing.assert_allclose(prices, black_scholes_price(100.0, [90.0, 100.0, 110.0], 1.0, 0.05, 0.2))
+
+
+def test_every_backend_agrees_on_black_scholes(engine):
+    """All discovered backends return the same closed-form prices."""
+    strikes = np.array([80.0, 100.0, 120.0])
+    reference = black_scholes_price(100.0, strikes, 0.5, 0.03, 0.25, option_type="put")
+    for name in available_backends():
+        prices = engine.black_scholes(100.0, strikes, 0.5, 0.03, 0.25, option_type="put", backend=name)
+        np.testing.assert_allclose(prices, reference, rtol=1e-8)
+        assert engine.last_backend == name
+
+
+def test_monte_carlo_close_to_black_scholes(engine):
+    """European MC on the default backend lands near the analytic price."""
+    price = engine.european_option_mc(100.0, 100.0, 1.0, 0.05, 0.2, 200_000, seed=0, backend="numpy")
+    assert abs(price - black_scholes_price(100.0, 100.0, 1.0, 0.05, 0.2)) < 0.15
+    assert engine.usage[("european_mc", "numpy")] == 1
+
+
+def test_pin_unknown_backend_raises(engine):
+    """Pinning a backend that was never discovered is rejected."""
+    with pytest.raises(ValueError):
+        engine.pin("fortran")
+
+
+def test_pinned_backend_serves_every_call(engine, fake_backend):
+    """A pinned backend wins over automatic selection."""
+    engine.pin("fake")
+    engine.black_scholes(100.0, np.full(1000, 100.0), 1.0, 0.05, 0.2)
+    assert engine.last_backend == "fake"
+    assert fake_backend == ["bs"]
+    with pytest.raises(ValueError):
+        engine.european_option_mc(100.0, 100.0, 1.0, 0.05, 0.2, 1000)
+
+
+def test_calibration_picks_fastest_for_batch_size(tmp_path, fake_backend):
+    """Stored timings decide the backend per batch size."""
+    path = tmp_path / "calibration.json"
+    path.write_text(json.dumps({
+        "black_scholes": {
+            "numpy": {"1": 1e-4, "1000": 2e-4},
+            "fake": {"1": 1e-6, "1000": 1e-3},
+        }
+    }))
+    engine = PricingEngine(calibration_path=str(path))
+    assert engine.select_backend("black_scholes", 1) == "fake"
+    assert engine.select_backend("black_scholes", 5000) == "numpy"
+
+
+def test_calibrate_writes_json(engine):
+    """calibrate() measures every backend and persists the result."""
+    result = engine.calibrate(batch_sizes=(1, 10), path_counts=(100,), repeats=1)
+    assert set(result) == set(pricing.METHODS)
+    stored = json.loads(open(engine.calibration_path).read())
+    assert stored["black_scholes"]["numpy"].keys() == {"1", "10"}
@@ -0,0 +1,76 @@
+"""Tests for short-rate models."""
+
+import pytest
+import numpy as np
+
+from qf_utils.short_rate import CIR, HullWhite, ShortRateModel, Vasicek, pathwise_discount
+
+TENORS = np.array([0.25, 0.5, 1, 2, 3, 5, 7, 10])
+YIELDS = np.array([0.030, 0.031, 0.033, 0.035, 0.036, 0.038, 0.039, 0.040])
+
+
+@pytest.mark.parametrize(
+    "model",
+    [Vasicek(0.03, 0.8, 0.05, 0.015), CIR(0.03, 0.8, 0.05, 0.08)],
+    ids=["vasicek", "cir"],
+)
+def test_closed_form_bond_matches_monte_carlo(model):
+    """Simulated discount factors agree with the affine bond formula."""
+    paths = model.simulate(T=2.0, n_steps=200, n_paths=20_000, random_state=0)
+    mc = pathwise_discount(paths, 2.0 / 200).mean()
+    assert mc == pytest.approx(model.zero_coupon_bond([2.0])[0], rel=2e-3)
+
+
+def test_vasicek_terminal_moments():
+    """Exact discretization reproduces the Vasicek transition moments."""
+    model = Vasicek(0.02, 1.5, 0.05, 0.02)
+    terminal = model.simulate(T=1.0, n_steps=4, n_paths=200_000, random_state=1)[:, -1]
+    mean = 0.05 + (0.02 - 0.05) * np.exp(-1.5)
+    std = 0.02 * np.sqrt((1 - np.exp(-3.0)) / 3.0)
+    assert terminal.mean() == pytest.approx(mean, abs=1e-4)
+    assert terminal.std() == pytest.approx(std, rel=1e-2)
+
+
+def test_cir_rates_non_negative():
+    """CIR paths stay non-negative even when the Feller condition fails."""
+    paths = CIR(0.01, 0.5, 0.02, 0.3).simulate(T=5.0, n_steps=50, n_paths=5_000, random_state=2)
+    assert (paths >= 0).all()
+
+
+def test_zero_coupon_bond_broadcasts():
+    """One call prices the tenor grid for every simulated rate."""
+    model = Vasicek(0.03, 0.5, 0.04, 0.01)
+    rates = np.array([[0.01, 0.02], [0.03, 0.04]])
+    prices = model.zero_coupon_bond(TENORS, r=rates)
+    assert prices.shape == (2, 2, len(TENORS))
+    assert np.all(np.diff(prices, axis=-1) < 0)
+
+
+def test_simulate_chunks_cover_all_paths():
+    """Chunks are bounded in size and add up to the requested path count."""
+    model = Vasicek(0.03, 0.5, 0.04, 0.01)
+    sizes = [block.shape for block in model.simulate_chunks(1.0, 12, 2_500, chunk_size=1_000)]
+    assert sizes == [(1_000, 13), (1_000, 13), (500, 13)]
+
+
+def test_vasicek_calibration_recovers_curve():
+    """Calibrating to a model-generated curve recovers its parameters."""
+    true = Vasicek(0.025, 0.6, 0.045, 0.012)
+    fitted = Vasicek.calibrate(TENORS, true.yield_curve(TENORS), r0=0.025)
+    np.testing.assert_allclose(fitted.yield_curve(TENORS), true.yield_curve(TENORS), atol=1e-8)
+
+
+def test_hull_white_fits_initial_curve():
+    """Hull-White reproduces the input curve and its MC discount factor."""
+    hw = HullWhite(TENORS, YIELDS, a=0.1, sigma=0.01)
+    np.testing.assert_allclose(hw.yield_curve(TENORS), YIELDS, atol=1e-12)
+
+    paths = hw.simulate(T=2.0, n_steps=100, n_paths=20_000, random_state=3)
+    mc = pathwise_discount(paths, 2.0 / 100).mean()
+    assert mc == pytest.approx(float(hw.discount(2.0)), rel=1e-3)
+
+
+def test_base_model_is_abstract():
+    """The base class cannot be simulated, so it cannot be constructed."""
+    with pytest.raises(TypeError):
+        ShortRateModel(0.03)
@@ -0,0 +1,128 @@
+"""Tests for out-of-core streaming backtests."""
+
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qf_utils.backtester import Backtester
+from qf_utils.streaming import StreamingBacktester, iter_frames, iter_memmap, iter_parquet
+
+
+def ohlcv(n, seed=0, start="2000-01-03"):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, n)))
+    return pd.DataFrame({"Close": close, "Volume": 1e6}, index=pd.bdate_range(start, periods=n))
+
+
+def sma_crossover(data, short_window=10, long_window=30):
+    signals = pd.Series(0, index=data.index)
+    short_ma = data["Close"].rolling(short_window).mean()
+    long_ma = data["Close"].rolling(long_window).mean()
+    signals[short_ma > long_ma] = 1
+    signals[short_ma < long_ma] = -1
+    return signals
+
+
+def bar_chunks(n_bars, chunk_size, seed=0):
+    """Generate a random-walk history chunk by chunk, never holding all of it."""
+    rng = np.random.default_rng(seed)
+    last = 100.0
+    for lo in range(0, n_bars, chunk_size):
+        size = min(chunk_size, n_bars - lo)
+        close = last * np.exp(np.cumsum(rng.normal(0.0, 0.001, size)))
+        last = close[-1]
+        yield pd.DataFrame({"Close": close}, index=pd.RangeIndex(lo, lo + size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 29, 250, 5_000])
+def test_matches_in_memory_backtester(tmp_path, chunk_size):
+    """Any chunking reproduces Backtester's equity curve, trades and metrics."""
+    data = ohlcv(1_500)
+    expected = Backtester(data).run(sma_crossover)
+
+    equity_path = tmp_path / "equity.csv"
+    result = StreamingBacktester(lookback=29, equity_path=str(equity_path)).run(
+        iter_frames(data, chunk_size), sma_crossover)
+
+    equity = pd.read_csv(equity_path, index_col=0, parse_dates=True)
+    np.testing.assert_allclose(equity["portfolio_value"], expected["portfolio_value"], rtol=1e-12)
+    np.testing.assert_array_equal(equity["position"], expected["positions"])
+    pd.testing.assert_frame_equal(result["trades"], expected["trades"], check_dtype=False)
+    assert result["final_value"] == pytest.approx(expected["portfolio_value"].iloc[-1], rel=1e-12)
+    for name, value in result["metrics"].items():
+        assert value == pytest.approx(expected["metrics"][name], rel=1e-9), name
+
+
+def test_resume_continues_state(tmp_path):
+    """Two resumed runs over halves of a history equal one run over all of it."""
+    data = ohlcv(800)
+    whole = StreamingBacktester(lookback=29).run(iter_frames(data, 100), sma_crossover)
+
+    trades_path = tmp_path / "trades.csv"
+    backtester = StreamingBacktester(lookback=29, trades_path=str(trades_path))
+    backtester.run(iter_frames(data.iloc[:450], 100), sma_crossover)
+    second = backtester.run(iter_frames(data.iloc[450:], 100), sma_crossover, resume=True)
+
+    assert second["final_value"] == whole["final_value"] and second["bars"] == 800
+    assert second["metrics"] == pytest.approx(whole["metrics"], rel=1e-12)
+    written = pd.read_csv(trades_path)
+    assert len(written) == len(whole["trades"])
+    np.testing.assert_array_equal(written["shares"], whole["trades"]["shares"])
+
+
+def test_memmap_source(tmp_path):
+    data = ohlcv(1_000)
+    records = np.empty(len(data), dtype=[("timestamp", "datetime64[ns]"), ("Close", "f8")])
+    records["timestamp"] = data.index.to_numpy()
+    records["Close"] = data["Close"].to_numpy()
+    path = tmp_path / "bars.npy"
+    np.save(path, records)
+
+    chunks = list(iter_memmap(str(path), chunk_size=300, index_field="timestamp"))
+    assert [len(c) for c in chunks] == [300, 300, 300, 100]
+    from_disk = StreamingBacktester(lookback=29).run(iter_memmap(str(path), 300, "timestamp"), sma_crossover)
+    in_memory = StreamingBacktester(lookback=29).run(iter_frames(data, 300), sma_crossover)
+    assert from_disk["final_value"] == in_memory["final_value"]
+    # The structured array stores nanoseconds; the frame's index may use another unit
+    pd.testing.assert_frame_equal(from_disk["trades"], in_memory["trades"], check_dtype=False)
+
+
+def test_parquet_partitions_in_order(tmp_path):
+    pytest.importorskip("pyarrow")
+    data = ohlcv(900).rename_axis("timestamp").reset_index()
+    for year, part in data.groupby(data["timestamp"].dt.year):
+        part.to_parquet(tmp_path / f"year={year}.parquet", index=False)
+    chunks = list(iter_parquet(str(tmp_path), batch_size=128, index_field="timestamp"))
+    assert max(len(c) for c in chunks) <= 128
+    assert pd.concat(chunks).index.is_monotonic_increasing
+
+    out = tmp_path / "out"
+    out.mkdir()
+    result = StreamingBacktester(lookback=29, equity_path=str(out / "equity.parquet")).run(chunks, sma_crossover)
+    assert pd.read_parquet(out / "equity.parquet")["portfolio_value"].iloc[-1] == result["final_value"]
+
+
+def test_peak_memory_bounded_by_chunk_size(tmp_path):
+    """Quadrupling the history length leaves peak allocation roughly unchanged."""
+    def peak(n_bars):
+        backtester = StreamingBacktester(lookback=29, equity_path=str(tmp_path / f"equity_{n_bars}.csv"),
+                                         trades_path=str(tmp_path / f"trades_{n_bars}.csv"))
+        tracemalloc.start()
+        backtester.run(bar_chunks(n_bars, 1_000), sma_crossover)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    assert peak(40_000) < 1.3 * peak(10_000)
+
+
+def test_invalid_configuration(tmp_path):
+    data = ohlcv(100)
+    with pytest.raises(ValueError):
+        StreamingBacktester(equity_path=str(tmp_path / "equity.txt")).run(iter_frames(data, 10), sma_crossover)
+    with pytest.raises(ValueError):
+        StreamingBacktester().run(iter_frames(data, 10), lambda d: np.zeros(3))
+    with pytest.raises(ValueError):
+        list(iter_memmap(np.zeros(10), 5))
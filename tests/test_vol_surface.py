@@ -0,0 +1,114 @@
+"""Tests for the implied volatility surface."""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from qf_utils.vol_surface import (
+    VolatilitySurface,
+    black_scholes_price,
+    black_scholes_vega,
+    implied_volatility,
+    svi_total_variance,
+)
+
+S0, R = 100.0, 0.02
+MATURITIES = (0.1, 0.25, 0.5, 1.0, 2.0)
+
+
+def svi_params(T):
+    """Calendar-arbitrage-free SVI parameters used to generate quotes."""
+    return 0.03 * T, 0.1 * np.sqrt(T), -0.5, 0.0, 0.2
+
+
+@pytest.fixture
+def quotes():
+    """Synthetic call quotes generated from a known SVI surface."""
+    rows = []
+    for T in MATURITIES:
+        strikes = S0 * np.exp(np.linspace(-0.4, 0.4, 21) * np.sqrt(T))
+        k = np.log(strikes / (S0 * np.exp(R * T)))
+        vols = np.sqrt(svi_total_variance(k, *svi_params(T)) / T)
+        prices = black_scholes_price(S0, strikes, T, R, vols)
+        rows += [{"strike": K, "maturity": T, "price": p} for K, p in zip(strikes, prices)]
+    return pd.DataFrame(rows)
+
+
+def test_implied_volatility_round_trip():
+    """Batched inversion recovers the input vols for calls and puts."""
+    rng = np.random.default_rng(0)
+    K = rng.uniform(60, 140, 500)
+    T = rng.uniform(0.05, 3.0, 500)
+    vols = rng.uniform(0.05, 1.0, 500)
+    kinds = np.where(rng.random(500) < 0.5, "call", "put")
+    prices = black_scholes_price(S0, K, T, R, vols, option_type=kinds)
+    iv = implied_volatility(prices, S0, K, T, R, option_type=kinds)
+
+    # Skip quotes whose price carries no information about vol in double precision
+    identifiable = black_scholes_vega(S0, K, T, R, vols) > 1e-3
+    np.testing.assert_allclose(iv[identifiable], vols[identifiable], atol=1e-6)
+
+
+def test_implied_volatility_rejects_arbitrage():
+    """Prices below intrinsic value give NaN."""
+    assert np.isnan(implied_volatility(1.0, S0, 80.0, 1.0, R))
+
+
+def test_surface_reprices_quotes(quotes):
+    """The surface reproduces the generating vols and prices."""
+    surface = VolatilitySurface(quotes, S0, R)
+    np.testing.assert_allclose(surface.price(quotes["strike"], quotes["maturity"]), quotes["price"], atol=1e-6)
+    assert surface.calendar_violations() == {}
+
+    # Between slices total variance is interpolated linearly in T
+    T = 0.75
+    k = np.log(100.0 / (S0 * np.exp(R * T)))
+    w = 0.5 * (svi_total_variance(k, *svi_params(0.5)) + svi_total_variance(k, *svi_params(1.0)))
+    assert surface.vol(100.0, T) == pytest.approx(np.sqrt(w / T), rel=1e-6)
+
+
+def test_incremental_update_refits_only_changed_slice(quotes):
+    """Updating quotes in one expiry leaves other slices untouched."""
+    surface = VolatilitySurface(quotes, S0, R)
+    before = surface.coefficients.copy()
+
+    changed = quotes[quotes["maturity"] == 0.5].copy()
+    changed["price"] = black_scholes_price(S0, changed["strike"], 0.5, R, 0.25)
+    surface.update_quotes(changed)
+
+    changed_slice = list(MATURITIES).index(0.5)
+    others = [i for i in range(len(MATURITIES)) if i != changed_slice]
+    np.testing.assert_array_equal(surface.coefficients[others], before[others])
+    np.testing.assert_allclose(surface.vol(changed["strike"], 0.5), 0.25, atol=1e-4)
+
+    with pytest.raises(KeyError):
+        surface.update_quotes(pd.DataFrame({"strike": [1.0], "maturity": [0.5], "price": [1.0]}))
+
+
+def test_calls_and_puts_on_the_same_strike(quotes):
+    """Updates are keyed by option type, so a call bump never lands on the put."""
+    puts = quotes.copy()
+    puts["price"] = black_scholes_price(S0, puts["strike"], puts["maturity"], R,
+                                        VolatilitySurface(quotes, S0, R).vol(puts["strike"], puts["maturity"]),
+                                        option_type="put")
+    chain = pd.concat([quotes.assign(option_type="call"), puts.assign(option_type="put")], ignore_index=True)
+    surface = VolatilitySurface(chain.sample(frac=1.0, random_state=0), S0, R)
+    put_iv = surface.iv[surface.option_type == "put"].copy()
+
+    atm = chain[(chain["maturity"] == 1.0) & (chain["option_type"] == "call")]
+    atm = atm.iloc[[len(atm) // 2]].assign(price=lambda df: df["price"] * 1.01)
+    surface.update_quotes(atm)
+    np.testing.assert_array_equal(surface.iv[surface.option_type == "put"], put_iv)
+
+    with pytest.raises(ValueError):
+        surface.update_quotes(atm.drop(columns="option_type"))
+    with pytest.raises(ValueError):
+        VolatilitySurface(pd.concat([quotes, quotes.iloc[:1]]), S0, R)
+
+
+def test_vol_at_zero_maturity(quotes):
+    """T = 0 gives the limit of the flat short-end vol; negative T is rejected."""
+    surface = VolatilitySurface(quotes, S0, R)
+    np.testing.assert_allclose(surface.vol([90.0, 100.0], 0.0), surface.vol([90.0, 100.0], 1e-10), rtol=1e-6)
+    with pytest.raises(ValueError):
+        surface.vol(100.0, -0.1)
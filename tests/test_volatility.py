@@ -0,0 +1,120 @@
+"""Tests for the GARCH-family volatility models."""
+
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qf_utils import volatility
+from qf_utils.volatility import EGARCH, GARCH, GJRGARCH, fit_volatility
+
+TRUE_PARAMS = {
+    "garch": (GARCH, [2e-6, 0.08, 0.90]),
+    "gjr": (GJRGARCH, [2e-6, 0.03, 0.10, 0.88]),
+    "egarch": (EGARCH, [-0.4, 0.15, -0.08, 0.96]),
+}
+
+
+def panel(name, n_obs=2_000, n_assets=20, seed=0):
+    cls, params = TRUE_PARAMS[name]
+    returns = cls().simulate(params, n_obs, n_paths=n_assets, random_state=seed)
+    return pd.DataFrame(returns, columns=[f"A{i}" for i in range(n_assets)])
+
+
+@pytest.mark.parametrize("name", sorted(TRUE_PARAMS))
+def test_recovers_simulated_parameters(name):
+    """Median estimates across a simulated universe sit near the true parameters."""
+    cls, params = TRUE_PARAMS[name]
+    fit = cls().fit(panel(name))
+    assert fit.converged.all()
+    median = fit.params.median()
+    for key, value in zip(cls.param_names, params):
+        if key == "omega" and name != "egarch":
+            continue
+        assert median[key] == pytest.approx(value, abs=0.03), key
+    assert fit.conditional_variance.shape == (2_000, 20)
+
+
+@pytest.mark.parametrize("name", sorted(TRUE_PARAMS))
+def test_batched_fit_matches_single_asset_fits(name):
+    """Fitting assets together (and in chunks) gives each asset its own optimum."""
+    returns = panel(name, n_obs=1_000, n_assets=6)
+    model = TRUE_PARAMS[name][0]()
+    together = model.fit(returns)
+    chunked = model.fit(returns, batch_size=4)
+    for asset in ("A0", "A5"):
+        alone = model.fit(returns[asset])
+        np.testing.assert_allclose(together.params.loc[asset], alone.params.loc[asset], rtol=1e-6)
+        assert together.loglikelihood[asset] == pytest.approx(alone.loglikelihood[asset], rel=1e-12)
+    pd.testing.assert_frame_equal(together.params, chunked.params)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numba") is None, reason="numba not installed")
+@pytest.mark.parametrize("name", sorted(TRUE_PARAMS))
+def test_numba_and_numpy_backends_agree(name):
+    returns = panel(name, n_obs=800, n_assets=5)
+    cls = TRUE_PARAMS[name][0]
+    compiled = cls(backend="numba").fit(returns)
+    reference = cls(backend="numpy").fit(returns)
+    np.testing.assert_allclose(compiled.params, reference.params, rtol=1e-6)
+    np.testing.assert_allclose(compiled.conditional_variance, reference.conditional_variance, rtol=1e-6)
+
+
+def test_garch_forecast_mean_reverts():
+    """Step one is the filtered next variance; long horizons reach omega / (1 - alpha - beta)."""
+    fit = GARCH().fit(panel("garch", n_assets=3))
+    forecast = fit.forecast(2_000)
+    np.testing.assert_allclose(forecast.iloc[0], fit.next_variance)
+    omega, alpha, beta = fit.params.to_numpy().T
+    np.testing.assert_allclose(forecast.iloc[-1], omega / (1 - alpha - beta), rtol=1e-8)
+    assert list(forecast.columns) == ["A0", "A1", "A2"]
+
+
+@pytest.mark.parametrize("name", ["gjr", "egarch"])
+def test_asymmetric_forecasts_match_monte_carlo(name):
+    """Analytic multi-step forecasts agree with simulated expected variances."""
+    model = TRUE_PARAMS[name][0]()
+    fit = model.fit(panel(name, n_assets=1))
+    horizon, n_paths = 20, 200_000
+    theta = np.tile(fit.params.to_numpy(), (n_paths, 1))
+    state = np.full(n_paths, fit.next_variance.iloc[0])
+    if name == "egarch":
+        state = np.log(state)
+    rng = np.random.default_rng(1)
+    simulated = []
+    for _ in range(horizon):
+        h = np.exp(state) if name == "egarch" else state
+        simulated.append(h.mean())
+        state = volatility._advance(model.code, theta, np.sqrt(h) * rng.standard_normal(n_paths), state, h)[0]
+    np.testing.assert_allclose(simulated, fit.forecast(horizon).iloc[:, 0], rtol=1e-2)
+
+
+def test_warm_start_refit():
+    """Yesterday's parameters start today's fit: same optimum, fewer iterations, new assets still fitted."""
+    returns = panel("gjr", n_obs=1_500, n_assets=8)
+    yesterday = GJRGARCH().fit(returns.iloc[:-1, :6])
+    cold = GJRGARCH().fit(returns)
+    warm = yesterday.refit(returns)
+    assert warm.converged.all()
+    # Parameters on the alpha = 0 boundary are only weakly identified, so compare likelihoods
+    np.testing.assert_allclose(warm.loglikelihood, cold.loglikelihood, rtol=1e-8)
+    assert warm.iterations[:6].mean() < cold.iterations[:6].mean()
+
+    with pytest.raises(ValueError):
+        GARCH().fit(returns, start=yesterday)
+
+
+def test_fit_volatility_and_invalid_input():
+    returns = panel("garch", n_obs=500, n_assets=2)
+    assert list(fit_volatility(returns, "egarch", mean="zero").params.columns) == list(EGARCH.param_names)
+    with pytest.raises(ValueError):
+        fit_volatility(returns, "arch")
+    with pytest.raises(ValueError):
+        GARCH(mean="ar1")
+    with pytest.raises(ValueError):
+        GARCH().fit(returns.where(returns.index != 3))
+    with pytest.raises(ValueError):
+        GARCH().fit(returns).forecast(0)
+    with pytest.raises(TypeError):
+        volatility.VolatilityModel()